@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Compare jamo.arrow with converting every row of a column in Python.
+
+Usage: python benchmarks/bench_arrow.py [rows]
+
+Requires PyArrow, and pandas for the Series rows.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import pyarrow as pa
+
+import jamo
+import jamo.arrow
+from corpus import make_corpus
+
+
+def bench(name, func, rows, number=3):
+    seconds = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:>30}: {rate:8.2f} Mrow/s ({seconds:.3f}s)".format(
+        name=name, rate=rows / seconds / 1e6, seconds=seconds))
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    words = make_corpus(count * 8).split()[:count]
+    array = pa.array(words, type=pa.string())
+    assert jamo.arrow.h2j(array).to_pylist() == [jamo.h2j(_) for _ in words]
+
+    bench("per-row h2j on a list", lambda: [jamo.h2j(_) for _ in words],
+          len(words))
+    bench("to_pylist, h2j, pa.array",
+          lambda: pa.array([jamo.h2j(_) for _ in array.to_pylist()]),
+          len(words))
+    bench("jamo.arrow.h2j", lambda: jamo.arrow.h2j(array), len(words))
+    bench("jamo.arrow.choseong", lambda: jamo.arrow.choseong(array),
+          len(words))
+    bench("jamo.arrow.has_batchim", lambda: jamo.arrow.has_batchim(array),
+          len(words))
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+    if pd is not None:
+        series = pd.Series(words, dtype="string[pyarrow]")
+        bench("Series.map(jamo.h2j)", lambda: series.map(jamo.h2j),
+              len(words))
+        bench("Series.jamo.h2j()", lambda: series.jamo.h2j(), len(words))
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Compare JamoCache with uncached h2j on a Zipfian corpus.
+
+Usage: python benchmarks/bench_cache.py [chars]
+
+Reports tokens per second for converting every token of the corpus with
+h2j, and with JamoCache one token at a time and in batches, for a few cache sizes, along with the hit rate and estimated cache memory.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo
+from jamo.cache import JamoCache
+from corpus import make_corpus
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 2000000
+    text = make_corpus(size)
+    tokens = text.split()
+    print("{} tokens, {} distinct".format(len(tokens), len(set(tokens))))
+    seconds, target = _time(lambda: [jamo.h2j(_) for _ in tokens])
+    print("{:>28} {:>10.0f} tokens/s".format("h2j per token",
+                                             len(tokens) / seconds))
+    seconds, _ = _time(jamo.h2j, text)
+    print("{:>28} {:>10.0f} tokens/s".format("h2j whole text",
+                                             len(tokens) / seconds))
+    for maxsize in (1000, 10000, 100000):
+        cache = JamoCache(maxsize=maxsize)
+        seconds, trial = _time(lambda: [cache(_) for _ in tokens])
+        assert trial == target
+        print("{:>28} {:>10.0f} tokens/s".format(
+            "maxsize={} per token".format(maxsize), len(tokens) / seconds))
+        cache.clear()
+        seconds, trial = _time(cache.convert_many, tokens)
+        assert trial == target
+        print("{:>28} {:>10.0f} tokens/s, hit rate {:.3f}, {:.1f} MB".format(
+            "maxsize={} batch".format(maxsize), len(tokens) / seconds,
+            cache.hit_rate(), cache.bytes / 1e6))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
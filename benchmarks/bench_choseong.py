@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Measure ChoseongIndex build, query, save, and load times.
+
+Usage: python benchmarks/bench_choseong.py [entries]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo
+from jamo.index import ChoseongIndex
+from corpus import make_vocabulary
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(0)
+    words = make_vocabulary(50000, rng)
+    entries = [' '.join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+               for _ in range(count)]
+    index, seconds = timed(lambda: ChoseongIndex(entries))
+    print("build {} entries: {:.2f}s".format(count, seconds))
+
+    queries = []
+    for entry in rng.sample(entries, 1000):
+        entry = ''.join(entry.split())
+        length = rng.randint(1, min(4, len(entry)))
+        query = jamo.choseong(entry[:length])
+        if rng.random() < 0.3:
+            query = entry[0] + query[1:]
+        queries.append(query)
+    latencies = []
+    for query in queries:
+        _, seconds = timed(lambda: index.search(query, limit=10))
+        latencies.append(seconds)
+    latencies.sort()
+    print("search, limit=10: median {:.1f} us, p99 {:.1f} us".format(
+        latencies[len(latencies) // 2] * 1e6,
+        latencies[len(latencies) * 99 // 100] * 1e6))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index")
+        _, seconds = timed(lambda: index.save(path))
+        print("save: {:.2f}s, {:.1f} MB".format(
+            seconds, os.path.getsize(path) / 1e6))
+        _, seconds = timed(lambda: ChoseongIndex.load(path))
+        print("load: {:.2f}s".format(seconds))
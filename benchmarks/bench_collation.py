@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Compare jamo.sort with sorted(key=h2j) on the words of a corpus.
+
+Usage: python benchmarks/bench_collation.py [words]
+
+Reports strings per second for sorting the words with each key, the
+memory the keys take, and lookups per second for bisect_left and
+prefix_range on the sorted list.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo
+from jamo.collation import bisect_left, prefix_range
+from corpus import make_corpus
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 1000000
+    words = []
+    seed = 0
+    while len(words) < count:
+        words.extend(make_corpus(4 * count, seed=seed).split())
+        seed += 1
+    words = words[:count]
+    print("{} words, {} distinct".format(len(words), len(set(words))))
+    # Build the lazy conversion and key tables before timing.
+    jamo.h2j("한")
+    jamo.sort_key("한")
+    # Alternate the two sorts, so that both see the same machine load, and
+    # keep the best time of each.
+    sorts = [("sorted(key=h2j)", lambda: sorted(words, key=jamo.h2j)),
+             ("jamo.sort", lambda: jamo.sort(words))]
+    best = {}
+    for _ in range(5):
+        for name, func in sorts:
+            seconds, _ = _time(func)
+            best[name] = min(best.get(name, seconds), seconds)
+    for name, _ in sorts:
+        print("{:>24} {:>10.0f} strings/s".format(
+            name, len(words) / best[name]))
+    result = jamo.sort(words)
+    keys = list(map(jamo.sort_key, result))
+    assert all(a <= b for a, b in zip(keys, keys[1:]))
+    del keys
+    print("{:>24} {:>10.1f} MB".format(
+        "h2j keys", sum(map(sys.getsizeof, map(jamo.h2j, words))) / 1e6))
+    print("{:>24} {:>10.1f} MB".format(
+        "sort_key keys",
+        sum(map(sys.getsizeof, map(jamo.sort_key, words))) / 1e6))
+    queries = random.Random(0).sample(words, min(10000, len(words)))
+    seconds, _ = _time(lambda: [bisect_left(result, _) for _ in queries])
+    print("{:>24} {:>10.0f} lookups/s".format(
+        "bisect_left", len(queries) / seconds))
+    seconds, _ = _time(lambda: [prefix_range(result, _[:2])
+                                for _ in queries])
+    print("{:>24} {:>10.0f} lookups/s".format(
+        "prefix_range", len(queries) / seconds))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
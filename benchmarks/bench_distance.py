@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Compare jamo.distance against a pure-Python dynamic program on h2j
+output, one pair at a time and one query against a word list.
+
+Usage: python benchmarks/bench_distance.py [words]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo
+import jamo.distance
+from corpus import make_vocabulary
+
+
+def dynamic_program(a, b):
+    """The plain Levenshtein DP on h2j output, as a reference point."""
+    a, b = jamo.h2j(a), jamo.h2j(b)
+    row = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        previous, row = row, [i]
+        for j, char_b in enumerate(b, 1):
+            row.append(min(previous[j] + 1, row[j - 1] + 1,
+                           previous[j - 1] + (char_a != char_b)))
+    return row[-1]
+
+
+def bench(name, func, count, number=3):
+    seconds = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:>36}: {rate:10.0f} pairs/s ({seconds:.3f}s)".format(
+        name=name, rate=count / seconds, seconds=seconds))
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(0)
+    words = [_ for _ in make_vocabulary(count, rng)]
+    query = words[0]
+    bench("dynamic program", lambda: [dynamic_program(query, _)
+                                      for _ in words], count)
+    bench("levenshtein", lambda: [jamo.distance.levenshtein(query, _)
+                                  for _ in words], count)
+    bench("damerau_levenshtein",
+          lambda: [jamo.distance.damerau_levenshtein(query, _)
+                   for _ in words], count)
+    bench("weighted_levenshtein",
+          lambda: [jamo.distance.weighted_levenshtein(query, _)
+                   for _ in words], count)
+    bench("levenshtein_many",
+          lambda: jamo.distance.levenshtein_many(query, words), count)
+    bench("levenshtein_many, max_distance=2",
+          lambda: jamo.distance.levenshtein_many(query, words,
+                                                 max_distance=2), count)
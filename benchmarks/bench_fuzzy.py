@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Measure FuzzyIndex queries per second, recall, and memory per entry.
+
+Usage: python benchmarks/bench_fuzzy.py [words] [queries]
+
+Queries are lexicon words with one or two random jamo edits. Recall is the
+share of the true top-10 distances, found by comparing the query with every
+word, that the index returns.
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo
+import jamo.distance
+from jamo.fuzzy import FuzzyIndex
+from corpus import make_vocabulary
+
+K = 10
+
+
+def misspell(word, rng):
+    letters = list(jamo.h2j(word))
+    for _ in range(rng.randint(1, 2)):
+        position = rng.randrange(len(letters) + 1)
+        edit = rng.choice("insert delete replace".split())
+        if edit == "insert" or not letters:
+            letters.insert(position, rng.choice(jamo.JAMO_VOWELS_MODERN))
+        elif edit == "delete":
+            del letters[min(position, len(letters) - 1)]
+        else:
+            letters[min(position, len(letters) - 1)] =\
+                rng.choice(jamo.JAMO_LEADS_MODERN)
+    return jamo.synth_hangul(''.join(letters))
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    samples = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(0)
+    words = make_vocabulary(count, rng)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = FuzzyIndex(words)
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("build {} words: {:.2f}s, {:.0f} bytes per entry".format(
+        count, seconds, size / count))
+
+    queries = [misspell(_, rng) for _ in rng.sample(words, samples)]
+    truth = [sorted(jamo.distance.levenshtein_many(query, words))[:K]
+             for query in queries[:50]]
+    for max_candidates in (50, 200, 1000, None):
+        start = time.perf_counter()
+        results = [index.search(query, K, max_candidates=max_candidates)
+                   for query in queries]
+        seconds = time.perf_counter() - start
+        recall = sum(
+            sum((Counter(_ for _ in target) &
+                 Counter(distance for _, distance in found)).values())
+            for target, found in zip(truth, results)) / (K * len(truth))
+        print("max_candidates={!s:>5}: {:7.1f} queries/s, recall@{} "
+              "{:.3f}".format(max_candidates, len(queries) / seconds, K,
+                              recall))
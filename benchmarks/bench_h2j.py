@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Compare h2j throughput against the original per-character generator.
+
+Usage: python benchmarks/bench_h2j.py [megabytes]
+"""
+import os
+import sys
+import timeit
+from itertools import chain
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo
+from jamo.jamo import _hangul_char_to_jamo
+
+
+def legacy_h2j(hangul_string):
+    """The pre-table implementation of h2j, kept as a reference point."""
+    return ''.join(_ for _ in
+                   chain.from_iterable(_hangul_char_to_jamo(_) for _ in
+                                       hangul_string))
+
+
+def make_text(size):
+    """Build roughly size characters of mixed Hangul and ASCII text."""
+    sample = ("한국어 텍스트를 자모로 분해합니다. "
+              "Do you speak 한국어? 자모=字母, 123 테스트.\n")
+    return (sample * (size // len(sample) + 1))[:size]
+
+
+def bench(name, func, text, number=3):
+    seconds = min(timeit.repeat(lambda: func(text), number=1, repeat=number))
+    mbytes = len(text.encode('utf-8')) / 1e6
+    print("{name:>14}: {rate:8.2f} MB/s ({seconds:.3f}s)".format(
+        name=name, rate=mbytes / seconds, seconds=seconds))
+    return seconds
+
+
+if __name__ == "__main__":
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    text = make_text(int(megabytes * 1e6 / 2))
+    assert legacy_h2j(text) == jamo.h2j(text)
+    old = bench("legacy h2j", legacy_h2j, text)
+    new = bench("h2j", jamo.h2j, text)
+    bench("hangul_to_jamo", lambda s: ''.join(jamo.hangul_to_jamo(s)), text)
+    print("{:>14}: {:.1f}x".format("speedup", old / new))
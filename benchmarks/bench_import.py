@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Measure how long `import jamo` takes in a fresh interpreter.
+
+Usage: python benchmarks/bench_import.py [--runs N] [--max-ms MS]
+
+With --max-ms, exits with a non-zero status when the median import time,
+net of interpreter startup, exceeds the given number of milliseconds.
+benchmarks/run.py --check runs the same check.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+
+def time_command(code, runs):
+    """Return the median wall time, in milliseconds, of running code in a new
+    interpreter.
+    """
+    env = dict(os.environ, PYTHONPATH=_ROOT)
+    # Write bytecode once so every timed run loads from the cache.
+    subprocess.check_call([sys.executable, "-c", code], env=env)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", code], env=env)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def import_time(runs):
+    """Return the median time, in milliseconds, that `import jamo` adds to
+    interpreter startup.
+    """
+    return time_command("import jamo", runs) - time_command("pass", runs)
+
+
+def self_times(module_prefix):
+    """Return the -X importtime self time, in microseconds, of each module
+    whose name starts with module_prefix.
+    """
+    env = dict(os.environ, PYTHONPATH=_ROOT)
+    result = subprocess.run([sys.executable, "-X", "importtime",
+                             "-c", "import jamo"],
+                            env=env, stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = [_.strip() for _ in line.split("|")]
+        if len(fields) == 3 and fields[2].startswith(module_prefix):
+            times[fields[2]] = int(fields[0].split(":")[1])
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    baseline = time_command("pass", args.runs)
+    imported = time_command("import jamo", args.runs)
+    first_use = time_command("import jamo; jamo.h2j('한')", args.runs)
+    print("interpreter startup: {:7.2f} ms".format(baseline))
+    print("        import jamo: {:7.2f} ms".format(imported - baseline))
+    print("  import + h2j('한'): {:7.2f} ms".format(first_use - baseline))
+    for module, micros in sorted(self_times("jamo").items()):
+        print("{:>19}: {:7.2f} ms self".format(module, micros / 1000))
+    if args.max_ms is not None and imported - baseline > args.max_ms:
+        print("import jamo exceeded {} ms".format(args.max_ms))
+        sys.exit(1)
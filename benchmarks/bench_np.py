@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Compare jamo.np array throughput against the string API.
+
+Usage: python benchmarks/bench_np.py [characters]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import numpy as np
+
+import jamo
+import jamo.np
+
+
+def bench(name, func, count, number=3):
+    seconds = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:>34}: {rate:8.2f} Mchar/s ({seconds:.3f}s)".format(
+        name=name, rate=count / seconds / 1e6, seconds=seconds))
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = np.random.RandomState(0)
+    codepoints = np.where(rng.rand(count) < 0.8,
+                          rng.randint(0xAC00, 0xD7A4, count),
+                          rng.randint(0x20, 0x7F, count)).astype(np.uint32)
+    text = jamo.np.to_str(codepoints)
+    decomposed = jamo.np.decompose(codepoints)[0]
+    decomposed_text = jamo.np.to_str(decomposed)
+
+    bench("per-character _hangul_char_to_jamo",
+          lambda: [jamo.jamo._hangul_char_to_jamo(_) for _ in text], count)
+    bench("array -> str -> h2j -> array",
+          lambda: np.frombuffer(jamo.h2j(jamo.np.to_str(codepoints))
+                                .encode('utf-32-le'), dtype='<u4'), count)
+    bench("jamo.np.decompose", lambda: jamo.np.decompose(codepoints), count)
+    bench("synth_hangul", lambda: jamo.synth_hangul(decomposed_text), count)
+    bench("jamo.np.compose", lambda: jamo.np.compose(decomposed), count)
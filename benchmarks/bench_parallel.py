@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Measure jamo.parallel throughput with 1, 2, 4, and 8 worker processes.
+
+Usage: python benchmarks/bench_parallel.py [megabytes]
+
+Speedup is bounded by the number of CPUs; with fewer CPUs than workers the
+extra processes only add overhead.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo.parallel
+
+
+def make_corpus(path, megabytes):
+    rng = random.Random(0)
+    words = [''.join(chr(rng.randrange(0xAC00, 0xD7A4))
+                     for _ in range(rng.randint(1, 5)))
+             for _ in range(5000)] + ["the", "jamo", "2024", ",", "."]
+    size = 0
+    with open(path, 'w', encoding='utf-8') as fout:
+        while size < megabytes * 1e6:
+            line = ' '.join(rng.choice(words) for _ in range(12)) + "\n"
+            fout.write(line)
+            size += len(line.encode('utf-8'))
+
+
+if __name__ == "__main__":
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 64
+    print("{} CPUs".format(os.cpu_count()))
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "corpus.txt")
+        make_corpus(source, megabytes)
+        size = os.path.getsize(source)
+        shard_size = max(1 << 20, size // 32)
+        base = None
+        for processes in (1, 2, 4, 8):
+            start = time.perf_counter()
+            jamo.parallel.convert_file(source, os.devnull, "jamo", processes,
+                                       shard_size)
+            seconds = time.perf_counter() - start
+            base = base or seconds
+            print("{processes} workers: {rate:7.2f} MB/s ({seconds:.3f}s, "
+                  "{speedup:.2f}x)".format(processes=processes,
+                                           rate=size / seconds / 1e6,
+                                           seconds=seconds,
+                                           speedup=base / seconds))
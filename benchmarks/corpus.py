@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""A reproducible synthetic corpus for the benchmark suite.
+
+Words are drawn from a Zipf distribution over a generated vocabulary of
+precomposed Korean words, Latin words, numbers and punctuation, HCJ (as in
+"ㅋㅋ"), and archaic jamo sequences, so a few words are very common and most
+are rare, as in real text. The same arguments always build the same corpus.
+"""
+import random
+from itertools import accumulate
+
+import jamo
+
+# Share of the vocabulary for each kind of word.
+MIX = (("korean", 0.70), ("latin", 0.15), ("punctuation", 0.05),
+       ("hcj", 0.05), ("archaic", 0.05))
+
+_LATIN = "abcdefghijklmnopqrstuvwxyz"
+_PUNCTUATION = ".,!?;:-()\"'…·"
+_HCJ = [_ for _ in map(chr, range(0x3131, 0x318F)) if jamo.is_hcj(_)]
+_ARCHAIC_LEADS = [_ for _ in jamo.JAMO_LEADS
+                  if _ not in jamo.JAMO_LEADS_MODERN]
+_ARCHAIC_VOWELS = [_ for _ in jamo.JAMO_VOWELS
+                   if _ not in jamo.JAMO_VOWELS_MODERN]
+_ARCHAIC_TAILS = [_ for _ in jamo.JAMO_TAILS
+                  if _ not in jamo.JAMO_TAILS_MODERN]
+
+
+def _korean_word(rng):
+    return ''.join(chr(0xAC00 + min(int(rng.expovariate(1 / 2500)), 11171))
+                   for _ in range(rng.randint(1, 5)))
+
+
+def _latin_word(rng):
+    word = ''.join(rng.choice(_LATIN) for _ in range(rng.randint(1, 10)))
+    return word.capitalize() if rng.random() < 0.2 else word
+
+
+def _punctuation_word(rng):
+    if rng.random() < 0.5:
+        return str(rng.randint(0, 10 ** rng.randint(1, 6)))
+    return rng.choice(_PUNCTUATION)
+
+
+def _hcj_word(rng):
+    return rng.choice(_HCJ) * rng.randint(1, 4)
+
+
+def _archaic_word(rng):
+    syllables = []
+    for _ in range(rng.randint(1, 3)):
+        lead = rng.choice(_ARCHAIC_LEADS + jamo.JAMO_LEADS_MODERN)
+        vowel = rng.choice(_ARCHAIC_VOWELS + jamo.JAMO_VOWELS_MODERN)
+        tail = rng.choice(_ARCHAIC_TAILS + [''] * 20)
+        syllables.append(lead + vowel + tail)
+    return ''.join(syllables)
+
+
+_MAKERS = {"korean": _korean_word, "latin": _latin_word,
+           "punctuation": _punctuation_word, "hcj": _hcj_word,
+           "archaic": _archaic_word}
+
+
+def make_vocabulary(size, rng):
+    """Return size distinct words in random rank order."""
+    kinds = [kind for kind, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    words, seen = [], set()
+    while len(words) < size:
+        word = _MAKERS[rng.choices(kinds, weights)[0]](rng)
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def make_corpus(size=200000, seed=0, vocabulary=20000, exponent=1.1,
+                line_length=80):
+    """Return about size characters of text in lines of about line_length
+    characters, with words drawn from a Zipf distribution of the given
+    exponent over a vocabulary of the given size.
+    """
+    rng = random.Random(seed)
+    words = make_vocabulary(vocabulary, rng)
+    weights = list(accumulate(1 / rank ** exponent
+                              for rank in range(1, len(words) + 1)))
+    lines, line, total = [], [], 0
+    while total < size:
+        word = rng.choices(words, cum_weights=weights)[0]
+        line.append(word)
+        total += len(word) + 1
+        if sum(map(len, line)) + len(line) >= line_length:
+            lines.append(' '.join(line))
+            line = []
+    if line:
+        lines.append(' '.join(line))
+    return '\n'.join(lines) + '\n'
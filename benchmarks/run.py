@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""Benchmark every public function in jamo on a synthetic corpus.
+
+Usage: python benchmarks/run.py [--size N] [--filter REGEX]
+                                [--save BASELINE] [--check BASELINE]
+                                [--tolerance FRACTION] [--max-import-ms MS]
+
+For every function, reports throughput (characters or calls per second),
+per-call latency (median and 99th percentile), and peak allocation during
+one pass over the corpus, measured with tracemalloc.
+
+--save writes the results to a baseline JSON file. --check compares the
+results against one and exits with status 1 if any function lost more than
+--tolerance of its throughput or allocated more than --tolerance more memory
+at its peak, or with status 2 if there is no baseline to compare against.
+Both also time `import jamo` as benchmarks/bench_import.py does, and --check
+fails if it got more than --tolerance slower than the baseline or, with
+--max-import-ms, if it takes longer than that many milliseconds.
+Baselines are only comparable on the same machine and Python, so none is
+kept in the repository: save one with "make bench-baseline" first.
+"""
+import argparse
+import gc
+import inspect
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import jamo
+from bench_import import import_time
+from corpus import make_corpus
+
+# Peak allocations this small are noise, whatever the ratio.
+_MEMORY_SLACK = 4096
+_LATENCY_SAMPLES = 2000
+# Import times within this many milliseconds of the baseline are noise.
+_IMPORT_SLACK_MS = 0.5
+_IMPORT_RUNS = 20
+
+
+class Case(object):
+    """A function to benchmark, the argument tuples to call it with, and how
+    many units (characters or calls) one pass over them processes.
+    """
+    def __init__(self, name, func, args, unit="chars", units=None):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.unit = unit
+        self.units = len(args) if units is None else units
+
+
+def _consume(generator_function):
+    """Wrap a generator function so that calling it runs it to the end."""
+    def consume(*args):
+        return ''.join(generator_function(*args))
+    return consume
+
+
+def make_cases(text):
+    """Return a Case for every public function, built from a corpus."""
+    lines = text.splitlines(True)
+    jamo_lines = [jamo.h2j(_) for _ in lines]
+    chars = list(text)
+    chars_in = sum(map(len, lines))
+    jamo_chars_in = sum(map(len, jamo_lines))
+    jamo_chars = [_ for _ in ''.join(jamo_lines) if jamo.is_jamo(_) and
+                  not jamo.is_hcj(_)]
+    triples = [tuple(jamo.h2j(_)) + ('',) * (3 - len(jamo.h2j(_)))
+               for _ in text if jamo.is_hangul_char(_)]
+    line_triples = []
+    for line in lines:
+        syllables = [jamo.h2j(_) for _ in line if jamo.is_hangul_char(_)]
+        line_triples.append((''.join(_[0] for _ in syllables),
+                             ''.join(_[1] for _ in syllables),
+                             [_[2:] for _ in syllables]))
+    hcj_positions = []
+    for char in jamo_chars:
+        hcj = jamo.j2hcj(char)
+        position = jamo.get_jamo_class(char)
+        if jamo.hcj_to_jamo(hcj, position, errors='ignore'):
+            hcj_positions.append((hcj, position))
+
+    byte_lines = [_.encode('utf-8') for _ in lines]
+    jamo_byte_lines = [_.encode('utf-8') for _ in jamo_lines]
+    words = text.split()
+    encoder = jamo.JamoEncoder()
+    batches = [(lines[i:i + 32],) for i in range(0, len(lines), 32)]
+    encoded = [encoder.encode_batch(*_) for _ in batches]
+
+    def per_line(name, func, args=lines, units=chars_in):
+        return Case(name, func, [(_,) for _ in args], units=units)
+
+    def per_bytes(name, func, args):
+        return Case(name, func, [(_,) for _ in args], unit="bytes",
+                    units=sum(map(len, args)))
+
+    def per_call(name, func, args):
+        return Case(name, func, args, unit="calls")
+
+    return [
+        per_call("is_jamo", jamo.is_jamo, [(_,) for _ in chars]),
+        per_call("is_jamo_modern", jamo.is_jamo_modern,
+                 [(_,) for _ in chars]),
+        per_call("is_hcj", jamo.is_hcj, [(_,) for _ in chars]),
+        per_call("is_hcj_modern", jamo.is_hcj_modern, [(_,) for _ in chars]),
+        per_call("is_hangul_char", jamo.is_hangul_char,
+                 [(_,) for _ in chars]),
+        per_call("get_jamo_class", jamo.get_jamo_class,
+                 [(_,) for _ in jamo_chars]),
+        per_line("classify", jamo.classify),
+        per_line("scan", jamo.scan),
+        per_line("contains_hangul", jamo.contains_hangul),
+        per_line("is_all_precomposed", jamo.is_all_precomposed),
+        per_line("jamo_to_hcj", _consume(jamo.jamo_to_hcj), jamo_lines,
+                 jamo_chars_in),
+        per_line("j2hcj", jamo.j2hcj, jamo_lines, jamo_chars_in),
+        per_call("hcj_to_jamo", jamo.hcj_to_jamo, hcj_positions),
+        per_call("hcj2j", jamo.hcj2j, hcj_positions),
+        per_call("jamo_to_hangul", jamo.jamo_to_hangul, triples),
+        per_call("j2h", jamo.j2h, triples),
+        Case("jamo_to_hangul_many", jamo.jamo_to_hangul_many, line_triples,
+             unit="syllables", units=len(triples)),
+        per_line("hangul_to_jamo", _consume(jamo.hangul_to_jamo)),
+        per_line("h2j", jamo.h2j),
+        per_line("h2j_with_offsets", jamo.h2j_with_offsets),
+        per_line("choseong", jamo.choseong),
+        per_line("hangul_to_hcj", _consume(jamo.hangul_to_hcj)),
+        per_line("h2hcj", jamo.h2hcj),
+        per_bytes("h2j_bytes", jamo.h2j_bytes, byte_lines),
+        per_bytes("j2hcj_bytes", jamo.j2hcj_bytes, jamo_byte_lines),
+        per_bytes("synth_bytes", jamo.synth_bytes, jamo_byte_lines),
+        Case("synthesize_hangul", _consume(jamo.synthesize_hangul),
+             [([_],) for _ in jamo_lines], units=jamo_chars_in),
+        per_line("synth_hangul", jamo.synth_hangul, jamo_lines,
+                 jamo_chars_in),
+        Case("JamoEncoder.encode_batch", encoder.encode_batch, batches,
+             units=chars_in),
+        Case("JamoEncoder.decode_batch", encoder.decode_batch, encoded,
+             unit="batches"),
+        Case("JamoCache.convert_many", jamo.JamoCache().convert_many,
+             [(_.split(),) for _ in lines], unit="tokens",
+             units=sum(len(_.split()) for _ in lines)),
+        per_line("synth_hangul_with_offsets", jamo.synth_hangul_with_offsets,
+                 jamo_lines, jamo_chars_in),
+        per_line("sort_key", jamo.sort_key),
+        Case("sort", jamo.sort, [(words,)], unit="strings",
+             units=len(words)),
+    ]
+
+
+def public_functions():
+    """Return the names of the functions exported by jamo, including those
+    it imports lazily.
+    """
+    return sorted(name for name in dir(jamo) if not name.startswith('_') and
+                  inspect.isfunction(getattr(jamo, name)))
+
+
+def _run_pass(func, args):
+    for _ in args:
+        func(*_)
+
+
+def measure(case, repeat):
+    """Return a dict of throughput, latency, and peak allocation."""
+    func, args = case.func, case.args
+    _run_pass(func, args)  # Warm up lazily built tables.
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        _run_pass(func, args)
+        best = min(best, time.perf_counter() - start)
+
+    step = max(1, len(args) // _LATENCY_SAMPLES)
+    clock = time.perf_counter_ns
+    latencies = []
+    for _ in args[::step]:
+        start = clock()
+        func(*_)
+        latencies.append(clock() - start)
+    latencies.sort()
+
+    gc.collect()
+    tracemalloc.start()
+    _run_pass(func, args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"unit": case.unit,
+            "throughput": case.units / best,
+            "latency_median_us": latencies[len(latencies) // 2] / 1e3,
+            "latency_p99_us":
+                latencies[min(len(latencies) - 1,
+                              len(latencies) * 99 // 100)] / 1e3,
+            "peak_bytes": peak}
+
+
+def regressions(results, baseline, tolerance):
+    """Return a description of every result worse than the baseline."""
+    found = []
+    for name, old in sorted(baseline["results"].items()):
+        new = results.get(name)
+        if new is None:
+            continue
+        if new["throughput"] < old["throughput"] * (1 - tolerance):
+            found.append("{}: throughput {:.4g} {}/s, baseline {:.4g}".format(
+                name, new["throughput"], new["unit"], old["throughput"]))
+        if new["peak_bytes"] > \
+                old["peak_bytes"] * (1 + tolerance) + _MEMORY_SLACK:
+            found.append("{}: peak allocation {} bytes, baseline {}".format(
+                name, new["peak_bytes"], old["peak_bytes"]))
+    return found
+
+
+def import_regressions(import_ms, baseline, tolerance, max_import_ms):
+    """Return a description of the import time if it is worse than the
+    baseline's or max_import_ms.
+    """
+    found = []
+    old = baseline.get("import_ms")
+    limit = None if old is None else old * (1 + tolerance) + _IMPORT_SLACK_MS
+    if limit is not None and import_ms > limit:
+        found.append("import jamo: {:.2f} ms, baseline {:.2f} ms".format(
+            import_ms, old))
+    if max_import_ms is not None and import_ms > max_import_ms:
+        found.append("import jamo: {:.2f} ms, limit {} ms".format(
+            import_ms, max_import_ms))
+    return found
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument("--size", type=int, default=200000,
+                        help="corpus size in characters (default: 200000)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="corpus random seed (default: 0)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timed passes per function (default: 5)")
+    parser.add_argument("--filter", default="",
+                        help="only run functions matching this regex")
+    parser.add_argument("--save", metavar="BASELINE",
+                        help="write results to a baseline JSON file")
+    parser.add_argument("--check", metavar="BASELINE",
+                        help="compare results against a baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed fractional regression (default: 0.2)")
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="with --check, the longest `import jamo` may "
+                        "take, in milliseconds")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.check and not os.path.exists(args.check):
+        print("No baseline at {}; save one first with --save {} (make "
+              "bench-baseline)".format(args.check, args.check),
+              file=sys.stderr)
+        return 2
+    cases = make_cases(make_corpus(args.size, args.seed))
+    missing = set(public_functions()) - set(_.name for _ in cases)
+    if missing:
+        print("No benchmark for: {}".format(", ".join(sorted(missing))),
+              file=sys.stderr)
+        return 2
+
+    results = {}
+    print("{:>20} {:>14} {:>12} {:>10} {:>10} {:>12}".format(
+        "function", "throughput", "unit", "median us", "p99 us",
+        "peak bytes"))
+    for case in cases:
+        if not re.search(args.filter, case.name):
+            continue
+        result = results[case.name] = measure(case, args.repeat)
+        print("{:>20} {:>14.4g} {:>12} {:>10.3f} {:>10.3f} {:>12}".format(
+            case.name, result["throughput"], result["unit"] + "/s",
+            result["latency_median_us"], result["latency_p99_us"],
+            result["peak_bytes"]))
+    import_ms = None
+    if args.save or args.check:
+        import_ms = import_time(_IMPORT_RUNS)
+        print("{:>20} {:>14.2f} {:>12}".format("import jamo", import_ms, "ms"))
+
+    if args.save:
+        with open(args.save, 'w') as fout:
+            json.dump({"python": platform.python_version(),
+                       "jamo": jamo.__version__,
+                       "corpus": {"size": args.size, "seed": args.seed},
+                       "import_ms": import_ms,
+                       "results": results}, fout, indent=2, sort_keys=True)
+            fout.write('\n')
+    if args.check:
+        with open(args.check) as fin:
+            baseline = json.load(fin)
+        found = regressions(results, baseline, args.tolerance)
+        found += import_regressions(import_ms, baseline, args.tolerance,
+                                    args.max_import_ms)
+        for _ in found:
+            print("REGRESSION " + _, file=sys.stderr)
+        if found:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
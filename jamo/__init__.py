@@ -5,10 +5,60 @@ from .jamo import (JAMO_LEADS, JAMO_LEADS_MODERN,
                    is_jamo, is_jamo_modern,
                    is_hcj, is_hcj_modern,
                    is_hangul_char,
-                   get_jamo_class,
+                   get_jamo_class, classify,
+                   scan, contains_hangul, is_all_precomposed,
+                   FLAG_LEAD, FLAG_VOWEL, FLAG_TAIL,
+                   FLAG_HCJ, FLAG_MODERN, FLAG_HANGUL,
                    jamo_to_hcj, j2hcj,
                    hcj_to_jamo, hcj2j,
-                   jamo_to_hangul, j2h,
-                   hangul_to_jamo, h2j,
+                   jamo_to_hangul, j2h, jamo_to_hangul_many,
+                   hangul_to_jamo, h2j, h2j_with_offsets,
+                   hangul_to_hcj, h2hcj, choseong,
+                   synthesize_hangul, synth_hangul,
+                   synth_hangul_with_offsets,
+                   h2j_bytes, j2hcj_bytes, synth_bytes,
                    InvalidJamoError)
+from codecs import register as _register
+from os import environ as _environ
+if _environ.get("JAMO_PROFILE", "0") not in ("", "0"):
+    from . import instrument
+    instrument._enable_from_environment()
+
+
+def _search_codec(name):
+    """Find "<encoding>-jamo" codecs, importing jamo.codec on first use."""
+    if not name.lower().endswith(("-jamo", "_jamo")):
+        return None
+    from .codec import search
+    return search(name)
+
+
+_register(_search_codec)
+
+# Exports that are only imported, or created, when first used.
+_LAZY = {"JamoErrorRecord": "jamo",
+         "ScanResult": "jamo",
+         "JamoEncoder": "encoder",
+         "ChoseongIndex": "index",
+         "FuzzyIndex": "fuzzy",
+         "JamoCache": "cache",
+         "JamoBuffer": "buffer",
+         "sort_key": "collation",
+         "sort": "collation"}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    from importlib import import_module
+    value = getattr(import_module("." + _LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
 __version__ = '0.4.1'
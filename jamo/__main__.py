@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""Command-line transcoder between precomposed Hangul, jamo, and HCJ.
+
+Usage: python -m jamo [--to {hangul,jamo,hcj}] [-o OUTPUT] [FILE ...]
+"""
+
+import argparse
+import codecs
+import io
+import sys
+import time
+
+from .stream import FORMS, DEFAULT_CHUNK_SIZE, transcode, _check_chunk_size
+from .parallel import DEFAULT_SHARD_SIZE, _check_arguments, convert_files
+
+
+def _peak_memory(who="RUSAGE_SELF"):
+    """Return the peak resident set size of this process (or, with
+    who="RUSAGE_CHILDREN", of its largest child) in bytes, or None where it
+    is not available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(getattr(resource, who)).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _ByteCounter(io.RawIOBase):
+    """A raw stream that counts the bytes read through it."""
+    def __init__(self, raw):
+        self.raw = raw
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = self.raw.readinto(buffer)
+        if size:
+            self.count += size
+        return size
+
+    def close(self):
+        if self.raw is not sys.stdin.buffer.raw:
+            self.raw.close()
+        super(_ByteCounter, self).close()
+
+
+def _open_input(path, encoding, errors):
+    """Return a text stream for path, along with the _ByteCounter under it."""
+    if path == "-":
+        counter = _ByteCounter(sys.stdin.buffer.raw)
+    else:
+        counter = _ByteCounter(open(path, 'rb', buffering=0))
+    return io.TextIOWrapper(io.BufferedReader(counter), encoding=encoding,
+                            errors=errors, newline=''), counter
+
+
+def _open_output(path, encoding, errors):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdout.buffer, encoding=encoding,
+                                errors=errors, newline='')
+    return open(path, 'w', encoding=encoding, errors=errors, newline='')
+
+
+def _make_parser():
+    parser = argparse.ArgumentParser(
+        prog="jamo",
+        description="Convert text between precomposed Hangul, U+11xx jamo, "
+                    "and Hangul Compatibility Jamo (HCJ).")
+    parser.add_argument("files", nargs="*", default=["-"], metavar="FILE",
+                        help="files to convert, or - for standard input "
+                             "(default)")
+    parser.add_argument("-t", "--to", choices=FORMS, default="jamo",
+                        help="output form (default: jamo)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file, or - for standard output "
+                             "(default)")
+    parser.add_argument("--encoding", default="utf-8",
+                        help="input and output encoding (default: utf-8)")
+    parser.add_argument("--errors", default="strict",
+                        help="encoding error handler, e.g. surrogateescape "
+                             "(default: strict)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="characters to convert at a time (default: "
+                             "{})".format(DEFAULT_CHUNK_SIZE))
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="convert input files with this many worker "
+                             "processes, or 0 for one per CPU (default: 1)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="approximate bytes per worker task with --jobs "
+                             "(default: {})".format(DEFAULT_SHARD_SIZE))
+    parser.add_argument("--stats", action="store_true",
+                        help="report throughput and peak memory on standard "
+                             "error")
+    return parser
+
+
+def _parse_args(parser, argv):
+    args = parser.parse_args(argv)
+    try:
+        codecs.lookup(args.encoding)
+        codecs.lookup_error(args.errors)
+    except LookupError as e:
+        parser.error(str(e))
+    try:
+        _check_chunk_size(args.chunk_size)
+    except ValueError as e:
+        parser.error(str(e).replace("chunk_size", "--chunk-size"))
+    if args.jobs != 1 and "-" in args.files:
+        parser.error("--jobs needs input files, not standard input")
+    if args.jobs != 1:
+        try:
+            _check_arguments(args.shard_size, args.encoding)
+        except (ValueError, LookupError) as e:
+            parser.error(str(e).replace("shard_size", "--shard-size"))
+    return args
+
+
+def _convert_parallel(args):
+    """Convert input files with worker processes; returns bytes read."""
+    processes = args.jobs or None
+    if args.output == "-":
+        sys.stdout.flush()
+        size = convert_files(args.files, sys.stdout.buffer, args.to,
+                             processes, args.shard_size, args.encoding,
+                             args.errors)
+        sys.stdout.buffer.flush()
+        return size
+    return convert_files(args.files, args.output, args.to, processes,
+                         args.shard_size, args.encoding, args.errors)
+
+
+def _convert_serial(args):
+    """Convert input files a chunk at a time; returns bytes read."""
+    size = 0
+    fout = _open_output(args.output, args.encoding, args.errors)
+    try:
+        for path in args.files:
+            fin, counter = _open_input(path, args.encoding, args.errors)
+            try:
+                transcode(fin, fout, args.to, args.chunk_size)
+            finally:
+                size += counter.count
+                fin.close()
+    finally:
+        if args.output == "-":
+            fout.flush()
+            fout.detach()
+        else:
+            fout.close()
+    return size
+
+
+def main(argv=None):
+    parser = _make_parser()
+    args = _parse_args(parser, argv)
+    start = time.perf_counter()
+    try:
+        if args.jobs == 1:
+            size = _convert_serial(args)
+        else:
+            size = _convert_parallel(args)
+    except (OSError, LookupError) as e:
+        parser.error(str(e))
+    if args.stats:
+        seconds = time.perf_counter() - start
+        peak = _peak_memory()
+        print("{size:.2f} MB in {seconds:.3f}s, {rate:.2f} MB/s, "
+              "peak memory {peak}".format(
+                  size=size / 1e6, seconds=seconds,
+                  rate=size / seconds / 1e6 if seconds else 0,
+                  peak="{:.1f} MB".format(peak / 1e6) if peak else "n/a"),
+              file=sys.stderr)
+        if args.jobs != 1 and _peak_memory("RUSAGE_CHILDREN"):
+            print("largest worker peak memory {:.1f} MB".format(
+                _peak_memory("RUSAGE_CHILDREN") / 1e6), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""Helpers for bisecting sorted sequences by a key."""
+
+
+class KeySequence(object):
+    """The keys of items, as a sequence for bisect to search items sorted
+    by key. Keys are computed as they are looked up.
+    """
+    def __init__(self, items, key):
+        self.items = items
+        self.key = key
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, position):
+        return self.key(self.items[position])
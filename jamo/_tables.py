@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+"""Jamo tables derived from U+11xx.json and U+31xx.json.
+Generated by tools/parse.py --tables; do not edit.
+"""
+
+# Every jamo and HCJ character that has a Unicode name.
+NAMED = (
+    '\u1100\u1101\u1102\u1103\u1104\u1105\u1106\u1107\u1108\u1109\u110a\u110b'
+    '\u110c\u110d\u110e\u110f\u1110\u1111\u1112\u1113\u1114\u1115\u1116\u1117'
+    '\u1118\u1119\u111a\u111b\u111c\u111d\u111e\u111f\u1120\u1121\u1122\u1123'
+    '\u1124\u1125\u1126\u1127\u1128\u1129\u112a\u112b\u112c\u112d\u112e\u112f'
+    '\u1130\u1131\u1132\u1133\u1134\u1135\u1136\u1137\u1138\u1139\u113a\u113b'
+    '\u113c\u113d\u113e\u113f\u1140\u1141\u1142\u1143\u1144\u1145\u1146\u1147'
+    '\u1148\u1149\u114a\u114b\u114c\u114d\u114e\u114f\u1150\u1151\u1152\u1153'
+    '\u1154\u1155\u1156\u1157\u1158\u1159\u115a\u115b\u115c\u115d\u115e\u115f'
+    '\u1160\u1161\u1162\u1163\u1164\u1165\u1166\u1167\u1168\u1169\u116a\u116b'
+    '\u116c\u116d\u116e\u116f\u1170\u1171\u1172\u1173\u1174\u1175\u1176\u1177'
+    '\u1178\u1179\u117a\u117b\u117c\u117d\u117e\u117f\u1180\u1181\u1182\u1183'
+    '\u1184\u1185\u1186\u1187\u1188\u1189\u118a\u118b\u118c\u118d\u118e\u118f'
+    '\u1190\u1191\u1192\u1193\u1194\u1195\u1196\u1197\u1198\u1199\u119a\u119b'
+    '\u119c\u119d\u119e\u119f\u11a0\u11a1\u11a2\u11a3\u11a4\u11a5\u11a6\u11a7'
+    '\u11a8\u11a9\u11aa\u11ab\u11ac\u11ad\u11ae\u11af\u11b0\u11b1\u11b2\u11b3'
+    '\u11b4\u11b5\u11b6\u11b7\u11b8\u11b9\u11ba\u11bb\u11bc\u11bd\u11be\u11bf'
+    '\u11c0\u11c1\u11c2\u11c3\u11c4\u11c5\u11c6\u11c7\u11c8\u11c9\u11ca\u11cb'
+    '\u11cc\u11cd\u11ce\u11cf\u11d0\u11d1\u11d2\u11d3\u11d4\u11d5\u11d6\u11d7'
+    '\u11d8\u11d9\u11da\u11db\u11dc\u11dd\u11de\u11df\u11e0\u11e1\u11e2\u11e3'
+    '\u11e4\u11e5\u11e6\u11e7\u11e8\u11e9\u11ea\u11eb\u11ec\u11ed\u11ee\u11ef'
+    '\u11f0\u11f1\u11f2\u11f3\u11f4\u11f5\u11f6\u11f7\u11f8\u11f9\u11fa\u11fb'
+    '\u11fc\u11fd\u11fe\u11ff\u3131\u3132\u3133\u3134\u3135\u3136\u3137\u3138'
+    '\u3139\u313a\u313b\u313c\u313d\u313e\u313f\u3140\u3141\u3142\u3143\u3144'
+    '\u3145\u3146\u3147\u3148\u3149\u314a\u314b\u314c\u314d\u314e\u314f\u3150'
+    '\u3151\u3152\u3153\u3154\u3155\u3156\u3157\u3158\u3159\u315a\u315b\u315c'
+    '\u315d\u315e\u315f\u3160\u3161\u3162\u3163\u3164\u3165\u3166\u3167\u3168'
+    '\u3169\u316a\u316b\u316c\u316d\u316e\u316f\u3170\u3171\u3172\u3173\u3174'
+    '\u3175\u3176\u3177\u3178\u3179\u317a\u317b\u317c\u317d\u317e\u317f\u3180'
+    '\u3181\u3182\u3183\u3184\u3185\u3186\u3187\u3188\u3189\u318a\u318b\u318c'
+    '\u318d\u318e'
+)
+
+JAMO_TO_HCJ = {
+    '\u1100': '\u3131',
+    '\u1101': '\u3132',
+    '\u1102': '\u3134',
+    '\u1103': '\u3137',
+    '\u1104': '\u3138',
+    '\u1105': '\u3139',
+    '\u1106': '\u3141',
+    '\u1107': '\u3142',
+    '\u1108': '\u3143',
+    '\u1109': '\u3145',
+    '\u110a': '\u3146',
+    '\u110b': '\u3147',
+    '\u110c': '\u3148',
+    '\u110d': '\u3149',
+    '\u110e': '\u314a',
+    '\u110f': '\u314b',
+    '\u1110': '\u314c',
+    '\u1111': '\u314d',
+    '\u1112': '\u314e',
+    '\u1114': '\u3165',
+    '\u1115': '\u3166',
+    '\u111a': '\u3140',
+    '\u111c': '\u316e',
+    '\u111d': '\u3171',
+    '\u111e': '\u3172',
+    '\u1120': '\u3173',
+    '\u1121': '\u3144',
+    '\u1122': '\u3174',
+    '\u1123': '\u3175',
+    '\u1127': '\u3176',
+    '\u1129': '\u3177',
+    '\u112b': '\u3178',
+    '\u112c': '\u3179',
+    '\u112d': '\u317a',
+    '\u112e': '\u317b',
+    '\u112f': '\u317c',
+    '\u1132': '\u317d',
+    '\u1136': '\u317e',
+    '\u1140': '\u317f',
+    '\u1147': '\u3180',
+    '\u114c': '\u3181',
+    '\u1157': '\u3184',
+    '\u1158': '\u3185',
+    '\u1159': '\u3186',
+    '\u115b': '\u3167',
+    '\u115c': '\u3135',
+    '\u115d': '\u3136',
+    '\u1161': '\u314f',
+    '\u1162': '\u3150',
+    '\u1163': '\u3151',
+    '\u1164': '\u3152',
+    '\u1165': '\u3153',
+    '\u1166': '\u3154',
+    '\u1167': '\u3155',
+    '\u1168': '\u3156',
+    '\u1169': '\u3157',
+    '\u116a': '\u3158',
+    '\u116b': '\u3159',
+    '\u116c': '\u315a',
+    '\u116d': '\u315b',
+    '\u116e': '\u315c',
+    '\u116f': '\u315d',
+    '\u1170': '\u315e',
+    '\u1171': '\u315f',
+    '\u1172': '\u3160',
+    '\u1173': '\u3161',
+    '\u1174': '\u3162',
+    '\u1175': '\u3163',
+    '\u1184': '\u3187',
+    '\u1185': '\u3188',
+    '\u1188': '\u3189',
+    '\u1191': '\u318a',
+    '\u1192': '\u318b',
+    '\u1194': '\u318c',
+    '\u119e': '\u318d',
+    '\u11a8': '\u3131',
+    '\u11a9': '\u3132',
+    '\u11aa': '\u3133',
+    '\u11ab': '\u3134',
+    '\u11ac': '\u3135',
+    '\u11ad': '\u3136',
+    '\u11ae': '\u3137',
+    '\u11af': '\u3139',
+    '\u11b0': '\u313a',
+    '\u11b1': '\u313b',
+    '\u11b2': '\u313c',
+    '\u11b3': '\u313d',
+    '\u11b4': '\u313e',
+    '\u11b5': '\u313f',
+    '\u11b6': '\u3140',
+    '\u11b7': '\u3141',
+    '\u11b8': '\u3142',
+    '\u11b9': '\u3144',
+    '\u11ba': '\u3145',
+    '\u11bb': '\u3146',
+    '\u11bc': '\u3147',
+    '\u11bd': '\u3148',
+    '\u11be': '\u314a',
+    '\u11bf': '\u314b',
+    '\u11c0': '\u314c',
+    '\u11c1': '\u314d',
+    '\u11c2': '\u314e',
+    '\u11c6': '\u3166',
+    '\u11c7': '\u3167',
+    '\u11c8': '\u3168',
+    '\u11cc': '\u3169',
+    '\u11ce': '\u316a',
+    '\u11d3': '\u316b',
+    '\u11d7': '\u316c',
+    '\u11d9': '\u316d',
+    '\u11dc': '\u316e',
+    '\u11dd': '\u316f',
+    '\u11df': '\u3170',
+    '\u11e2': '\u3171',
+    '\u11e6': '\u3178',
+    '\u11e7': '\u317a',
+    '\u11e8': '\u317c',
+    '\u11ea': '\u317d',
+    '\u11eb': '\u317f',
+    '\u11ee': '\u3180',
+    '\u11f0': '\u3181',
+    '\u11f1': '\u3182',
+    '\u11f2': '\u3183',
+    '\u11f4': '\u3184',
+    '\u11f9': '\u3186',
+    '\u11ff': '\u3165',
+}
+
+# Named characters missing from these tables map to themselves.
+HCJ_TO_JAMO_LEAD = {
+    '\u1160': '\u115f',
+    '\u11a8': '\u1100',
+    '\u11a9': '\u1101',
+    '\u11ab': '\u1102',
+    '\u11ac': '\u115c',
+    '\u11ad': '\u115d',
+    '\u11ae': '\u1103',
+    '\u11af': '\u1105',
+    '\u11b6': '\u111a',
+    '\u11b7': '\u1106',
+    '\u11b8': '\u1107',
+    '\u11b9': '\u1121',
+    '\u11ba': '\u1109',
+    '\u11bb': '\u110a',
+    '\u11bc': '\u110b',
+    '\u11bd': '\u110c',
+    '\u11be': '\u110e',
+    '\u11bf': '\u110f',
+    '\u11c0': '\u1110',
+    '\u11c1': '\u1111',
+    '\u11c2': '\u1112',
+    '\u11c5': '\u1113',
+    '\u11c6': '\u1115',
+    '\u11c7': '\u115b',
+    '\u11ca': '\u1117',
+    '\u11cb': '\u115e',
+    '\u11cd': '\u1118',
+    '\u11d0': '\u1119',
+    '\u11dc': '\u111c',
+    '\u11e2': '\u111d',
+    '\u11e4': '\u112a',
+    '\u11e6': '\u112b',
+    '\u11e7': '\u112d',
+    '\u11e8': '\u112f',
+    '\u11e9': '\u1130',
+    '\u11ea': '\u1132',
+    '\u11eb': '\u1140',
+    '\u11ec': '\u1141',
+    '\u11ee': '\u1147',
+    '\u11f0': '\u114c',
+    '\u11f3': '\u1156',
+    '\u11f4': '\u1157',
+    '\u11f9': '\u1159',
+    '\u11ff': '\u1114',
+    '\u3131': '\u1100',
+    '\u3132': '\u1101',
+    '\u3134': '\u1102',
+    '\u3135': '\u115c',
+    '\u3136': '\u115d',
+    '\u3137': '\u1103',
+    '\u3138': '\u1104',
+    '\u3139': '\u1105',
+    '\u3140': '\u111a',
+    '\u3141': '\u1106',
+    '\u3142': '\u1107',
+    '\u3143': '\u1108',
+    '\u3144': '\u1121',
+    '\u3145': '\u1109',
+    '\u3146': '\u110a',
+    '\u3147': '\u110b',
+    '\u3148': '\u110c',
+    '\u3149': '\u110d',
+    '\u314a': '\u110e',
+    '\u314b': '\u110f',
+    '\u314c': '\u1110',
+    '\u314d': '\u1111',
+    '\u314e': '\u1112',
+    '\u3165': '\u1114',
+    '\u3166': '\u1115',
+    '\u3167': '\u115b',
+    '\u316e': '\u111c',
+    '\u3171': '\u111d',
+    '\u3172': '\u111e',
+    '\u3173': '\u1120',
+    '\u3174': '\u1122',
+    '\u3175': '\u1123',
+    '\u3176': '\u1127',
+    '\u3177': '\u1129',
+    '\u3178': '\u112b',
+    '\u3179': '\u112c',
+    '\u317a': '\u112d',
+    '\u317b': '\u112e',
+    '\u317c': '\u112f',
+    '\u317d': '\u1132',
+    '\u317e': '\u1136',
+    '\u317f': '\u1140',
+    '\u3180': '\u1147',
+    '\u3181': '\u114c',
+    '\u3184': '\u1157',
+    '\u3185': '\u1158',
+    '\u3186': '\u1159',
+}
+
+HCJ_TO_JAMO_VOWEL = {
+    '\u115f': '\u1160',
+    '\u314f': '\u1161',
+    '\u3150': '\u1162',
+    '\u3151': '\u1163',
+    '\u3152': '\u1164',
+    '\u3153': '\u1165',
+    '\u3154': '\u1166',
+    '\u3155': '\u1167',
+    '\u3156': '\u1168',
+    '\u3157': '\u1169',
+    '\u3158': '\u116a',
+    '\u3159': '\u116b',
+    '\u315a': '\u116c',
+    '\u315b': '\u116d',
+    '\u315c': '\u116e',
+    '\u315d': '\u116f',
+    '\u315e': '\u1170',
+    '\u315f': '\u1171',
+    '\u3160': '\u1172',
+    '\u3161': '\u1173',
+    '\u3162': '\u1174',
+    '\u3163': '\u1175',
+    '\u3187': '\u1184',
+    '\u3188': '\u1185',
+    '\u3189': '\u1188',
+    '\u318a': '\u1191',
+    '\u318b': '\u1192',
+    '\u318c': '\u1194',
+    '\u318d': '\u119e',
+}
+
+HCJ_TO_JAMO_TAIL = {
+    '\u1100': '\u11a8',
+    '\u1101': '\u11a9',
+    '\u1102': '\u11ab',
+    '\u1103': '\u11ae',
+    '\u1105': '\u11af',
+    '\u1106': '\u11b7',
+    '\u1107': '\u11b8',
+    '\u1109': '\u11ba',
+    '\u110a': '\u11bb',
+    '\u110b': '\u11bc',
+    '\u110c': '\u11bd',
+    '\u110e': '\u11be',
+    '\u110f': '\u11bf',
+    '\u1110': '\u11c0',
+    '\u1111': '\u11c1',
+    '\u1112': '\u11c2',
+    '\u1113': '\u11c5',
+    '\u1114': '\u11ff',
+    '\u1115': '\u11c6',
+    '\u1117': '\u11ca',
+    '\u1118': '\u11cd',
+    '\u1119': '\u11d0',
+    '\u111a': '\u11b6',
+    '\u111c': '\u11dc',
+    '\u111d': '\u11e2',
+    '\u1121': '\u11b9',
+    '\u112a': '\u11e4',
+    '\u112b': '\u11e6',
+    '\u112d': '\u11e7',
+    '\u112f': '\u11e8',
+    '\u1130': '\u11e9',
+    '\u1132': '\u11ea',
+    '\u1140': '\u11eb',
+    '\u1141': '\u11ec',
+    '\u1147': '\u11ee',
+    '\u114c': '\u11f0',
+    '\u1156': '\u11f3',
+    '\u1157': '\u11f4',
+    '\u1159': '\u11f9',
+    '\u115b': '\u11c7',
+    '\u115c': '\u11ac',
+    '\u115d': '\u11ad',
+    '\u115e': '\u11cb',
+    '\u3131': '\u11a8',
+    '\u3132': '\u11a9',
+    '\u3133': '\u11aa',
+    '\u3134': '\u11ab',
+    '\u3135': '\u11ac',
+    '\u3136': '\u11ad',
+    '\u3137': '\u11ae',
+    '\u3139': '\u11af',
+    '\u313a': '\u11b0',
+    '\u313b': '\u11b1',
+    '\u313c': '\u11b2',
+    '\u313d': '\u11b3',
+    '\u313e': '\u11b4',
+    '\u313f': '\u11b5',
+    '\u3140': '\u11b6',
+    '\u3141': '\u11b7',
+    '\u3142': '\u11b8',
+    '\u3144': '\u11b9',
+    '\u3145': '\u11ba',
+    '\u3146': '\u11bb',
+    '\u3147': '\u11bc',
+    '\u3148': '\u11bd',
+    '\u314a': '\u11be',
+    '\u314b': '\u11bf',
+    '\u314c': '\u11c0',
+    '\u314d': '\u11c1',
+    '\u314e': '\u11c2',
+    '\u3165': '\u11ff',
+    '\u3166': '\u11c6',
+    '\u3167': '\u11c7',
+    '\u3168': '\u11c8',
+    '\u3169': '\u11cc',
+    '\u316a': '\u11ce',
+    '\u316b': '\u11d3',
+    '\u316c': '\u11d7',
+    '\u316d': '\u11d9',
+    '\u316e': '\u11dc',
+    '\u316f': '\u11dd',
+    '\u3170': '\u11df',
+    '\u3171': '\u11e2',
+    '\u3178': '\u11e6',
+    '\u317a': '\u11e7',
+    '\u317c': '\u11e8',
+    '\u317d': '\u11ea',
+    '\u317f': '\u11eb',
+    '\u3180': '\u11ee',
+    '\u3181': '\u11f0',
+    '\u3182': '\u11f1',
+    '\u3183': '\u11f2',
+    '\u3184': '\u11f4',
+    '\u3186': '\u11f9',
+}
+
+# Lead, vowel, and tail jamo in collation order.
+COLLATION_LEAD = (
+    '\u115f\u1100\u1101\u115a\u1102\u1113\u1114\u1115\u1116\u115b\u115c\u115d'
+    '\u1103\u1117\u1104\u115e\u1105\u1118\u1119\u111a\u111b\u1106\u111c\u111d'
+    '\u1107\u111e\u111f\u1120\u1108\u1121\u1122\u1123\u1124\u1125\u1126\u1127'
+    '\u1128\u1129\u112a\u112b\u112c\u1109\u112d\u112e\u112f\u1130\u1131\u1132'
+    '\u1133\u110a\u1134\u1135\u1136\u1137\u1138\u1139\u113a\u113b\u113c\u113d'
+    '\u113e\u113f\u1140\u110b\u1141\u1142\u1143\u1144\u1145\u1146\u1147\u1148'
+    '\u1149\u114a\u114b\u114c\u110c\u114d\u110d\u114e\u114f\u1150\u1151\u110e'
+    '\u1152\u1153\u1154\u1155\u110f\u1110\u1111\u1156\u1157\u1112\u1158\u1159'
+)
+COLLATION_TAIL = (
+    '\u11a8\u11a9\u11fa\u11c3\u11fb\u11aa\u11c4\u11fc\u11fd\u11fe\u11ab\u11c5'
+    '\u11ff\u11c6\u11c7\u11c8\u11ac\u11c9\u11ad\u11ae\u11ca\u11cb\u11af\u11b0'
+    '\u11cc\u11cd\u11ce\u11cf\u11d0\u11b1\u11d1\u11d2\u11b2\u11d3\u11d4\u11d5'
+    '\u11b3\u11d6\u11d7\u11d8\u11b4\u11b5\u11b6\u11d9\u11b7\u11da\u11db\u11dc'
+    '\u11dd\u11de\u11df\u11e0\u11e1\u11e2\u11b8\u11e3\u11b9\u11e4\u11e5\u11e6'
+    '\u11ba\u11e7\u11e8\u11e9\u11ea\u11bb\u11eb\u11bc\u11ec\u11ed\u11ee\u11ef'
+    '\u11f0\u11f1\u11f2\u11bd\u11be\u11bf\u11c0\u11c1\u11f3\u11f4\u11c2\u11f5'
+    '\u11f6\u11f7\u11f8\u11f9'
+)
+COLLATION_VOWEL = (
+    '\u1160\u1161\u1176\u1177\u11a3\u1162\u1163\u1178\u1179\u11a4\u1164\u1165'
+    '\u117a\u117b\u117c\u1166\u1167\u11a5\u117d\u117e\u1168\u1169\u11a6\u11a7'
+    '\u117f\u1180\u1181\u1182\u1183\u116a\u116b\u116c\u116d\u1184\u1185\u1186'
+    '\u1187\u1188\u116e\u1189\u118a\u118b\u118c\u118d\u116f\u1170\u1171\u1172'
+    '\u118e\u118f\u1190\u1191\u1192\u1193\u1194\u1173\u1195\u1196\u1174\u1197'
+    '\u1175\u1198\u1199\u119a\u119b\u119c\u119d\u119e\u119f\u11a0\u11a1\u11a2'
+)
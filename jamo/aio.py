@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Conversion of asynchronous streams between Hangul, jamo, and HCJ.
+
+Each adapter takes an async iterable of str or bytes chunks, such as the
+body of a chunked HTTP request, and is itself an async iterator of
+converted strings:
+
+    async for chunk in jamo.aio.decompose(request.content.iter_any()):
+        ...
+
+Bytes are decoded incrementally, so characters split across chunks are
+decoded whole, and syllables split across chunks are still composed.
+Control returns to the event loop after every chunk. Chunks of at least
+offload_size characters are converted in an executor instead (the loop's
+default executor unless one is given), so that other tasks keep running
+while a large chunk is converted. Conversion holds the GIL, so a thread
+pool only interleaves it with the event loop; a ProcessPoolExecutor takes
+it off the loop's core entirely.
+"""
+
+import asyncio
+import codecs
+
+from .jamo import h2j, h2hcj, synth_hangul, _split_incomplete_syllable
+from .stream import FORMS
+
+
+async def _text_chunks(stream, encoding, errors):
+    """Yield the chunks of stream as strings, decoding bytes as they come."""
+    decoder = None
+    async for chunk in stream:
+        if isinstance(chunk, str):
+            yield chunk
+            continue
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(encoding)(errors)
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    if decoder is not None:
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+
+async def _run(func, text, executor, offload_size):
+    if offload_size is not None and len(text) >= offload_size:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, func, text)
+    result = func(text)
+    await asyncio.sleep(0)
+    return result
+
+
+async def _convert_each(func, stream, encoding, errors, executor,
+                        offload_size):
+    async for chunk in _text_chunks(stream, encoding, errors):
+        yield await _run(func, chunk, executor, offload_size)
+
+
+async def compose(stream, encoding='utf-8', errors='strict', executor=None,
+                  offload_size=None):
+    """Compose U+11xx jamo in an async stream into Hangul characters, as
+    synth_hangul does. A lead, or a lead and a vowel, at the end of a chunk
+    is held back until the next chunk shows whether it begins a syllable.
+    Bytes chunks are decoded with encoding and errors.
+    """
+    pending = ''
+    async for chunk in _text_chunks(stream, encoding, errors):
+        ready, pending = _split_incomplete_syllable(pending + chunk)
+        if ready:
+            yield await _run(synth_hangul, ready, executor, offload_size)
+    if pending:
+        yield synth_hangul(pending)
+
+
+def decompose(stream, encoding='utf-8', errors='strict', executor=None,
+              offload_size=None):
+    """Split Hangul characters in an async stream into U+11xx jamo, as h2j
+    does. Bytes chunks are decoded with encoding and errors.
+    """
+    return _convert_each(h2j, stream, encoding, errors, executor,
+                         offload_size)
+
+
+def to_hcj(stream, encoding='utf-8', errors='strict', executor=None,
+           offload_size=None):
+    """Convert Hangul characters and U+11xx jamo in an async stream to HCJ,
+    as h2hcj does. Bytes chunks are decoded with encoding and errors.
+    """
+    return _convert_each(h2hcj, stream, encoding, errors, executor,
+                         offload_size)
+
+
+def convert(stream, to="jamo", **kwargs):
+    """Convert an async stream into the given form ("hangul", "jamo", or
+    "hcj"), as jamo.stream.convert_chunks does. Other arguments are passed
+    on to compose, decompose, or to_hcj.
+    """
+    if to == "jamo":
+        return decompose(stream, **kwargs)
+    if to == "hcj":
+        return to_hcj(stream, **kwargs)
+    if to == "hangul":
+        return compose(stream, **kwargs)
+    raise ValueError("Unknown form {!r}; expected one of {}".format(
+        to, ", ".join(FORMS)))
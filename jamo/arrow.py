@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Conversion of whole Arrow string arrays, and a pandas Series accessor.
+
+This module requires PyArrow and NumPy. Each function converts the data
+buffer of a StringArray (or LargeStringArray, or a ChunkedArray of either)
+with one str.translate, and computes the new offsets with NumPy, so no
+Python object is made per row. Every character the conversions change, and
+every character they change it to, takes three bytes in UTF-8, so a row
+grows by three bytes for every character its conversion adds.
+
+If pandas is installed, importing this module also registers a .jamo
+accessor on Series of strings:
+
+    >>> import jamo.arrow
+    >>> df["name"].jamo.choseong()
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pyarrow as pa
+
+from .jamo import (_ClassifyTable, _hangul_to_jamo_table, _choseong_table,
+                   _jamo_to_hcj_table, _hangul_to_hcj_table, _JAMO_OFFSET)
+
+_TABLES = {"h2j": _hangul_to_jamo_table, "j2hcj": _jamo_to_hcj_table,
+           "h2hcj": _hangul_to_hcj_table, "choseong": _choseong_table}
+
+
+@lru_cache(maxsize=None)
+def _extra_table(name):
+    """Return a str.translate table mapping codepoints to the number of
+    characters a conversion adds for them, as characters.
+    """
+    return _ClassifyTable((code, chr(len(value) - 1))
+                          for code, value in _TABLES[name]().items())
+
+
+def _convert_buffers(name, data, offsets):
+    """Convert the UTF-8 data of rows between offsets, which start at 0.
+    Returns the converted data as bytes and the new offsets as an array of
+    the same type.
+    """
+    text = str(data, 'utf-8')
+    converted = text.translate(_TABLES[name]())
+    if len(converted) == len(text):
+        return converted.encode('utf-8'), offsets
+    extra = np.frombuffer(text.translate(_extra_table(name)).encode(
+        'latin-1'), dtype=np.uint8)
+    extra_before = np.zeros(len(extra) + 1, dtype=np.int64)
+    np.cumsum(extra, out=extra_before[1:])
+    # Each row boundary, as a byte offset, is after as many characters as
+    # there are bytes before it that start one.
+    starts = (np.frombuffer(data, dtype=np.uint8) & 0xC0) != 0x80
+    chars_before = np.zeros(len(starts) + 1, dtype=np.int64)
+    np.cumsum(starts, out=chars_before[1:])
+    new_offsets = offsets + 3 * extra_before[chars_before[offsets]]
+    if new_offsets[-1] > np.iinfo(offsets.dtype).max:
+        raise OverflowError("Converted data is too large for a string "
+                            "array; use a large_string array instead")
+    return converted.encode('utf-8'), new_offsets.astype(offsets.dtype)
+
+
+def _string_buffers(array):
+    """Return the data of a string array as a memoryview, and its offsets as
+    a NumPy array starting at 0.
+    """
+    if pa.types.is_string(array.type):
+        dtype = np.int32
+    elif pa.types.is_large_string(array.type):
+        dtype = np.int64
+    else:
+        raise TypeError("Expected a string array, not {}".format(array.type))
+    _, offsets, data = array.buffers()
+    offsets = np.frombuffer(offsets, dtype=dtype, count=len(array) + 1,
+                            offset=array.offset * np.dtype(dtype).itemsize)
+    start, end = int(offsets[0]), int(offsets[-1])
+    data = memoryview(data)[start:end] if data is not None else b''
+    return data, offsets - offsets[0]
+
+
+def _validity(array):
+    """Return the validity bitmap of an array as if it had no offset."""
+    if not array.null_count:
+        return None
+    return array.is_valid().buffers()[1]
+
+
+def _each_chunk(convert, array, result_type=None):
+    """Apply convert to an array, or to every chunk of a ChunkedArray, whose
+    results have result_type (by default, the type of array). Sequences of
+    strings are converted to string arrays first.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        return pa.chunked_array([convert(_) for _ in array.chunks],
+                                type=result_type or array.type)
+    if not isinstance(array, pa.Array):
+        array = pa.array(array, type=pa.string())
+    return convert(array)
+
+
+def _convert_array(name, array):
+    data, offsets = _string_buffers(array)
+    data, offsets = _convert_buffers(name, data, offsets)
+    return pa.Array.from_buffers(
+        array.type, len(array),
+        [_validity(array), pa.py_buffer(offsets), pa.py_buffer(data)],
+        null_count=array.null_count)
+
+
+def _has_batchim_array(array):
+    data, offsets = _string_buffers(array)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # A Hangul character at the end of a row is its last three bytes,
+    # beginning with the lead byte of a three-byte sequence.
+    last = offsets[1:] - 3
+    long_enough = last >= offsets[:-1]
+    lead = np.zeros(len(array), dtype=np.uint8)
+    lead[long_enough] = raw[last[long_enough]]
+    syllable = long_enough & ((lead & 0xF0) == 0xE0)
+    positions = last[syllable]
+    first, second, third = (raw[positions + i].astype(np.int64)
+                            for i in range(3))
+    codes = ((first & 0x0F) << 12 | (second & 0x3F) << 6 | third & 0x3F)
+    codes -= _JAMO_OFFSET
+    hangul = np.zeros(len(array), dtype=bool)
+    hangul[syllable] = (codes >= 0) & (codes < 11172)
+    tails = np.zeros(len(array), dtype=bool)
+    tails[syllable] = (codes % 28) != 0
+    mask = ~hangul
+    if array.null_count:
+        mask |= array.is_null().to_numpy(zero_copy_only=False)
+    return pa.array(tails & hangul, type=pa.bool_(), mask=mask)
+
+
+def h2j(array):
+    """Split the Hangul characters of every row into U+11xx jamo, as
+    jamo.h2j does. Arguments may be Arrow string arrays, chunked arrays, or
+    sequences of strings; returns an array of the same type.
+    """
+    return _each_chunk(lambda _: _convert_array("h2j", _), array)
+
+
+def j2hcj(array):
+    """Convert the jamo of every row to HCJ, as jamo.j2hcj does."""
+    return _each_chunk(lambda _: _convert_array("j2hcj", _), array)
+
+
+def h2hcj(array):
+    """Convert the Hangul characters and jamo of every row to HCJ, as
+    jamo.h2hcj does.
+    """
+    return _each_chunk(lambda _: _convert_array("h2hcj", _), array)
+
+
+def choseong(array):
+    """Replace the Hangul characters of every row with the HCJ of their
+    leads, as jamo.choseong does.
+    """
+    return _each_chunk(lambda _: _convert_array("choseong", _), array)
+
+
+def has_batchim(array):
+    """Return a boolean array telling whether each row ends in a Hangul
+    character with a tail (batchim). Rows that are null or do not end in a
+    Hangul character are null.
+    """
+    return _each_chunk(_has_batchim_array, array, pa.bool_())
+
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+if pd is not None:
+    @pd.api.extensions.register_series_accessor("jamo")
+    class JamoAccessor(object):
+        """The .jamo accessor on pandas Series of strings. Each method
+        converts the whole Series through Arrow, as the function of the
+        same name in jamo.arrow does, and returns a Series backed by Arrow
+        with the same index and name.
+        """
+        def __init__(self, series):
+            self._series = series
+
+        def _apply(self, convert):
+            values = pa.array(self._series, from_pandas=True)
+            if pa.types.is_null(values.type):
+                values = values.cast(pa.string())
+            result = convert(values)
+            if isinstance(result, pa.ChunkedArray):
+                result = result.combine_chunks()
+            return pd.Series(pd.arrays.ArrowExtensionArray(result),
+                             index=self._series.index,
+                             name=self._series.name)
+
+        def h2j(self):
+            return self._apply(h2j)
+
+        def j2hcj(self):
+            return self._apply(j2hcj)
+
+        def h2hcj(self):
+            return self._apply(h2hcj)
+
+        def choseong(self):
+            return self._apply(choseong)
+
+        def has_batchim(self):
+            return self._apply(has_batchim)
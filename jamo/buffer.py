@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Compact storage for decomposed text.
+
+A JamoBuffer holds text split into U+11xx jamo as an immutable buffer of
+unsigned integers, one per character. The integers are codepoints, except
+that the modern jamo, the lead and vowel fillers, and the modern HCJ are
+swapped with the codepoints 0x80 to 0xF7. Text made of those and ASCII,
+which is most decomposed Korean text, then takes one byte per jamo, and is
+packed and unpacked by str.translate and the latin-1 codec without any
+Python-level work per character. Buffers holding other characters take two
+bytes per character, or four if any are outside the BMP.
+"""
+
+import re
+import sys
+from array import array
+from functools import lru_cache
+from itertools import accumulate, islice
+
+from .jamo import (JAMO_LEADS_MODERN, JAMO_VOWELS_MODERN, JAMO_TAILS_MODERN,
+                   j2hcj, synth_hangul, _hangul_to_jamo_table, _MemoTable)
+
+_UTF16 = 'utf-16-le' if sys.byteorder == 'little' else 'utf-16-be'
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+_CODECS = {1: 'latin-1', 2: _UTF16, 4: _UTF32}
+_FORMATS = {1: 'B', 2: 'H', 4: 'I'}
+# Texts packed at a time by JamoBuffer.from_texts.
+_BATCH = 10000
+
+
+@lru_cache(maxsize=None)
+def _swap_table():
+    """Return a str.translate table swapping the one-byte jamo with the
+    codepoints from 0x80. It is its own inverse, so it both packs and
+    unpacks.
+    """
+    packed = JAMO_LEADS_MODERN + JAMO_VOWELS_MODERN + JAMO_TAILS_MODERN +\
+        ['\u115f', '\u1160'] + [chr(_) for _ in range(0x3131, 0x3164)]
+    table = _MemoTable()
+    for code, char in enumerate(packed, 0x80):
+        table[code] = char
+        table[ord(char)] = chr(code)
+    return table
+
+
+@lru_cache(maxsize=None)
+def _pack_table():
+    """Return a str.translate table that decomposes Hangul characters, as
+    h2j does, and swaps the one-byte jamo, in one pass.
+    """
+    swap = _swap_table()
+    table = _MemoTable(swap)
+    table.update((code, jamo.translate(swap))
+                 for code, jamo in _hangul_to_jamo_table().items())
+    return table
+
+
+@lru_cache(maxsize=None)
+def _wide_pattern():
+    """Return a pattern matching characters that UTF-16 cannot hold one to a
+    code unit.
+    """
+    return re.compile("[\\ud800-\\udfff\\U00010000-\\U0010ffff]")
+
+
+def _encode(packed):
+    """Return packed text as bytes, and the bytes per character."""
+    try:
+        return packed.encode('latin-1'), 1
+    except UnicodeEncodeError:
+        pass
+    if _wide_pattern().search(packed) is None:
+        return packed.encode(_UTF16), 2
+    return packed.encode(_UTF32, 'surrogatepass'), 4
+
+
+class JamoBuffer(object):
+    """Text decomposed into U+11xx jamo, as h2j does, and packed into one
+    to four bytes per character.
+
+    A JamoBuffer is an immutable sequence of characters: len, indexing,
+    iteration, and str work as for the decomposed string, and slices are
+    JamoBuffers sharing the same memory. The packed integers are available
+    as the memoryview codes, and numpy.asarray(buffer) wraps them without
+    copying.
+    """
+    __slots__ = ('codes',)
+
+    def __init__(self, text=''):
+        if not isinstance(text, str):
+            text = ''.join(text)
+        data, size = _encode(text.translate(_pack_table()))
+        self.codes = memoryview(data).cast(_FORMATS[size])
+
+    @classmethod
+    def from_codes(cls, codes):
+        """Return a JamoBuffer over codes, as found in the codes of another
+        buffer, without copying them. codes may be any contiguous buffer of
+        unsigned 8, 16, or 32-bit integers, such as a numpy array.
+        """
+        view = memoryview(codes)
+        if not view.c_contiguous:
+            raise ValueError("codes must be a contiguous buffer")
+        if view.format not in ('B', 'H', 'I', 'L') or view.ndim != 1 or\
+                view.itemsize not in _FORMATS:
+            raise ValueError("codes must be one-dimensional unsigned 8, 16, "
+                             "or 32-bit integers, not {!r}".format(
+                                 view.format))
+        buffer = cls.__new__(cls)
+        buffer.codes = view.cast('B').cast(_FORMATS[view.itemsize])
+        return buffer
+
+    @classmethod
+    def from_texts(cls, texts):
+        """Return a JamoBuffer holding texts one after another, and an
+        array('Q') of offsets: text i is buffer[offsets[i]:offsets[i + 1]].
+        Packing a whole corpus into one buffer saves the overhead of an
+        object per text.
+        """
+        texts = iter(texts)
+        lengths = array('Q')
+        parts = []
+        table = _pack_table()
+        while True:
+            batch = [_.translate(table) for _ in islice(texts, _BATCH)]
+            if not batch:
+                break
+            lengths.extend(map(len, batch))
+            parts.append(''.join(batch))
+        packed = ''.join(parts)
+        del parts
+        data, size = _encode(packed)
+        buffer = cls.__new__(cls)
+        buffer.codes = memoryview(data).cast(_FORMATS[size])
+        return buffer, array('Q', accumulate(lengths, initial=0))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            buffer = JamoBuffer.__new__(JamoBuffer)
+            buffer.codes = self.codes[index]
+            return buffer
+        return chr(self.codes[index]).translate(_swap_table())
+
+    def __iter__(self):
+        for start in range(0, len(self), 4096):
+            yield from str(self[start:start + 4096])
+
+    def __str__(self):
+        return str(self.codes.tobytes(), _CODECS[self.codes.itemsize],
+                   'surrogatepass').translate(_swap_table())
+
+    def __repr__(self):
+        return "JamoBuffer({!r})".format(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, JamoBuffer):
+            return self.codes == other.codes
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return JamoBuffer, (str(self),)
+
+    def __buffer__(self, flags):
+        return self.codes
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy
+        if copy:
+            return numpy.array(self.codes, dtype=dtype, copy=True)
+        if copy is False and dtype is not None and\
+                numpy.dtype(dtype) != numpy.asarray(self.codes).dtype:
+            raise ValueError("Converting the codes to {} needs a copy".format(
+                numpy.dtype(dtype)))
+        return numpy.asarray(self.codes, dtype=dtype)
+
+    @property
+    def nbytes(self):
+        """The size of the packed characters in bytes."""
+        return self.codes.nbytes
+
+    def to_hcj(self):
+        """Return the text with its jamo converted to HCJ, as j2hcj does."""
+        return j2hcj(str(self))
+
+    def to_hangul(self):
+        """Return the text with its jamo composed into Hangul characters, as
+        synth_hangul does.
+        """
+        return synth_hangul(str(self))
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Memoized per-token conversion for repetitive text.
+
+Words in Korean text follow a Zipf distribution, so a few thousand words
+make up most of any corpus. A JamoCache remembers the conversions of the
+tokens it has seen, evicting the least recently used once it holds maxsize
+tokens or its estimated size passes max_bytes. Batches of tokens are looked
+up under one lock acquisition, which is where most of the speedup over
+converting every token comes from; looking tokens up one call at a time
+costs about as much as converting them. Tokens that are not cached are
+converted outside the lock, so a miss never holds up other threads.
+"""
+
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+from .jamo import h2j
+
+# Statistics as returned by JamoCache.info. bytes is the estimated size of
+# the cached tokens and their conversions.
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'size',
+                                     'bytes', 'maxsize', 'max_bytes'])
+
+# Estimated bytes per entry beyond its two strings: the OrderedDict's hash
+# table slot and linked list node.
+_ENTRY_OVERHEAD = 100
+
+
+def _entry_size(token, value):
+    return sys.getsizeof(token) + sys.getsizeof(value) + _ENTRY_OVERHEAD
+
+
+class JamoCache(object):
+    """A thread-safe LRU cache of func applied to tokens.
+
+    func must be a conversion from string to string that depends on its
+    argument alone, such as h2j, h2hcj, j2hcj, or choseong. maxsize bounds
+    the number of tokens remembered and max_bytes their estimated memory;
+    either may be None for no bound.
+    """
+    def __init__(self, func=h2j, maxsize=100000, max_bytes=None):
+        self.func = func
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, token):
+        return token in self._entries
+
+    def _over_limit(self):
+        """Return whether the cache holds more than its bounds allow."""
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            return True
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
+    def _add(self, token, value):
+        """Remember value as func(token); the caller holds the lock. If
+        another thread remembered the token first, value is dropped.
+        """
+        self.misses += 1
+        entries = self._entries
+        if token in entries:
+            return
+        entries[token] = value
+        self.bytes += _entry_size(token, value)
+        while entries and self._over_limit():
+            self.bytes -= _entry_size(*entries.popitem(last=False))
+            self.evictions += 1
+
+    def __call__(self, token):
+        """Return func(token), converting it only if it is not cached."""
+        with self._lock:
+            value = self._entries.get(token)
+            if value is not None:
+                self._entries.move_to_end(token)
+                self.hits += 1
+                return value
+        value = self.func(token)
+        with self._lock:
+            self._add(token, value)
+        return value
+
+    def convert_many(self, tokens):
+        """Return a list of func applied to each of tokens."""
+        found = []
+        append = found.append
+        entries = self._entries
+        get, move_to_end = entries.get, entries.move_to_end
+        missing = {}
+        hits = 0
+        with self._lock:
+            try:
+                for token in tokens:
+                    value = get(token)
+                    if value is None:
+                        if token in missing:
+                            hits += 1
+                        missing.setdefault(token, []).append(len(found))
+                    else:
+                        move_to_end(token)
+                        hits += 1
+                    append(value)
+            finally:
+                self.hits += hits
+        if not missing:
+            return found
+        # Convert outside the lock so that other threads are not held up.
+        func = self.func
+        values = [(token, func(token)) for token in missing]
+        for token, value in values:
+            for position in missing[token]:
+                found[position] = value
+        # Add them in order of last use in the batch, so that the least
+        # recently used go first.
+        values.sort(key=lambda item: missing[item[0]][-1])
+        with self._lock:
+            for token, value in values:
+                self._add(token, value)
+        return found
+
+    def info(self):
+        """Return the cache's statistics as a CacheInfo."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             len(self._entries), self.bytes, self.maxsize,
+                             self.max_bytes)
+
+    def hit_rate(self):
+        """Return the share of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Forget every token and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.bytes = 0
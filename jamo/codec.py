@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Codecs that decompose Hangul on decoding and compose it on encoding.
+
+Importing jamo registers a codec named "<encoding>-jamo" for every text
+encoding, e.g. "utf-8-jamo" or "cp949-jamo"; this module is imported when
+one is first looked up. Decoding with it splits Hangul characters into
+U+11xx jamo as h2j does, and encoding composes U+11xx jamo into Hangul
+characters as synth_hangul does before encoding with the underlying
+encoding:
+
+    with open(path, encoding="utf-8-jamo") as fin:
+        text = fin.read()
+
+The incremental encoder holds back a lead, or a lead and a vowel, at the
+end of a chunk until the next chunk shows whether they begin a syllable, so
+a syllable split across chunks is composed as if the input were one piece.
+The held back jamo are written out with the next chunk, or when the encoder
+is called with final=True, as codecs.iterencode does.
+
+io.TextIOWrapper, which open uses, never calls its encoder with
+final=True, so text written through open should not end with a bare lead,
+or a lead and a vowel; ending it with a newline or any other character is
+enough. StreamWriter, which codecs.open uses, cannot learn that the text has
+ended either, so it composes each write on its own and holds nothing back:
+a syllable whose jamo are split across two writes is written as jamo.
+"""
+
+import codecs
+from functools import lru_cache
+
+from .jamo import h2j, synth_hangul, _split_incomplete_syllable
+
+SUFFIX = "-jamo"
+
+
+def _encode(base, input, errors):
+    return base.encode(synth_hangul(input), errors)[0], len(input)
+
+
+def _decode(base, input, errors):
+    text, consumed = base.decode(input, errors)
+    return h2j(text), consumed
+
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    """Compose jamo, then encode with the base codec."""
+    base = codecs.lookup('utf-8')
+
+    def __init__(self, errors='strict'):
+        super(IncrementalEncoder, self).__init__(errors)
+        self.encoder = self.base.incrementalencoder(errors)
+        self.pending = ''
+
+    def encode(self, input, final=False):
+        text = self.pending + input
+        if final:
+            ready, self.pending = text, ''
+        else:
+            ready, self.pending = _split_incomplete_syllable(text)
+        return self.encoder.encode(synth_hangul(ready), final)
+
+    def reset(self):
+        self.encoder.reset()
+        self.pending = ''
+
+    def getstate(self):
+        # At most two characters are pending: 21 bits each, with their count
+        # and the base encoder's state above them.
+        state = (self.encoder.getstate() << 2) | len(self.pending)
+        for char in self.pending:
+            state = (state << 21) | ord(char)
+        return state << 21 * (2 - len(self.pending))
+
+    def setstate(self, state):
+        chars = [state >> 21 & 0x1FFFFF, state & 0x1FFFFF]
+        count = state >> 42 & 3
+        self.pending = ''.join(map(chr, chars[:count]))
+        self.encoder.setstate(state >> 44)
+
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+    """Decode with the base codec, then decompose Hangul."""
+    base = codecs.lookup('utf-8')
+
+    def __init__(self, errors='strict'):
+        super(IncrementalDecoder, self).__init__(errors)
+        self.decoder = self.base.incrementaldecoder(errors)
+
+    def decode(self, input, final=False):
+        return h2j(self.decoder.decode(input, final))
+
+    def reset(self):
+        self.decoder.reset()
+
+    def getstate(self):
+        return self.decoder.getstate()
+
+    def setstate(self, state):
+        self.decoder.setstate(state)
+
+
+class StreamWriter(codecs.StreamWriter):
+    """Compose each write on its own, then encode with the base codec."""
+    base = codecs.lookup('utf-8')
+
+    def __init__(self, stream, errors='strict'):
+        super(StreamWriter, self).__init__(stream, errors)
+        self.encoder = self.base.incrementalencoder(errors)
+
+    def encode(self, input, errors='strict'):
+        return self.encoder.encode(synth_hangul(input)), len(input)
+
+    def reset(self):
+        super(StreamWriter, self).reset()
+        self.encoder.reset()
+
+
+class StreamReader(codecs.StreamReader):
+    """Decode with the base codec, then decompose Hangul."""
+    base = codecs.lookup('utf-8')
+
+    def __init__(self, stream, errors='strict'):
+        super(StreamReader, self).__init__(stream, errors)
+        self.decoder = self.base.incrementaldecoder(errors)
+
+    def decode(self, input, errors='strict'):
+        # StreamReader.read passes the bytes not consumed, such as part of a
+        # character, again with the next read, so the decoder must not also
+        # keep them.
+        text = self.decoder.decode(input)
+        pending, flag = self.decoder.getstate()
+        self.decoder.setstate((b'', flag))
+        return h2j(text), len(input) - len(pending)
+
+    def reset(self):
+        super(StreamReader, self).reset()
+        self.decoder.reset()
+
+
+def _codec_info(base):
+    """Return a CodecInfo for the jamo codec over a base CodecInfo."""
+    def subclass(cls):
+        return type(cls.__name__, (cls,), {"base": base})
+
+    return codecs.CodecInfo(
+        name=base.name + SUFFIX,
+        encode=lambda input, errors='strict': _encode(base, input, errors),
+        decode=lambda input, errors='strict': _decode(base, input, errors),
+        incrementalencoder=subclass(IncrementalEncoder),
+        incrementaldecoder=subclass(IncrementalDecoder),
+        streamwriter=subclass(StreamWriter),
+        streamreader=subclass(StreamReader),
+        _is_text_encoding=True)
+
+
+@lru_cache(maxsize=None)
+def _name_pattern():
+    """Return a pattern matching "<encoding>-jamo" codec names."""
+    import re
+    return re.compile(r"(.+)[-_]jamo$")
+
+
+def search(name):
+    """Codec search function for codecs.register: find "<encoding>-jamo"."""
+    match = _name_pattern().match(name.lower())
+    if match is None:
+        return None
+    try:
+        base = codecs.lookup(match.group(1))
+    except LookupError:
+        return None
+    if not base._is_text_encoding:
+        return None
+    return _codec_info(base)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Sorting of Korean text in jamo order.
+
+sort_key turns a string into bytes that compare in jamo order: Hangul
+characters compare as their lead, vowel, and tail jamo, archaic jamo sort
+among the modern jamo they are built from (as in the COLLATION_* tables of
+jamo/_tables.py, derived from the Unicode names), and HCJ sorts as the
+equivalent lead, or vowel, or tail. Leads sort before vowels, and vowels
+before tails, so that a syllable sorts before the same syllable with a
+tail followed by anything.
+
+Keys are the UTF-8 encoding, whose bytes compare in codepoint order, of a
+string of weights. Weights take the codepoints from U+0080, which other
+characters below U+AC00 make room for by moving up, so every jamo takes two
+bytes, ASCII one, and other characters keep their order. Keys are built by
+one codecs.charmap_encode over a table mapping every Hangul character
+straight to the bytes of the weights of its jamo.
+"""
+
+import bisect
+from codecs import charmap_encode
+from functools import lru_cache
+
+from .jamo import (_hangul_to_jamo_table, _hcj_to_jamo_tables, _jamo_flags,
+                   _MemoTable, FLAG_LEAD, FLAG_VOWEL, FLAG_TAIL, FLAG_HCJ)
+from ._search import KeySequence
+
+_FIRST_WEIGHT = 0x80
+# Characters from here up to the Hangul characters move up past the weights.
+_SHIFT_END = 0xAC00
+# Strings whose keys sort computes at a time.
+_BATCH = 10000
+
+
+def _utf8(text):
+    return text.encode('utf-8', 'surrogatepass')
+
+
+class _KeyTable(_MemoTable):
+    """A codecs.charmap_encode table to the UTF-8 bytes of collation
+    weights. Characters without a weight move up by shift if they are below
+    U+AC00.
+    """
+    def __init__(self, table, shift):
+        super(_KeyTable, self).__init__(table)
+        self.shift = shift
+
+    def value(self, code):
+        if _FIRST_WEIGHT <= code < _SHIFT_END:
+            code += self.shift
+        return _utf8(chr(code))
+
+
+def _extended(flag):
+    """Return the extended jamo with a flag, in codepoint order."""
+    return [char for char, flags in sorted(_jamo_flags().items())
+            if flags & flag and not flags & FLAG_HCJ
+            if not 0x1100 <= ord(char) < 0x1200]
+
+
+@lru_cache(maxsize=None)
+def _key_table():
+    """Return the codecs.charmap_encode table behind sort_key."""
+    from ._tables import COLLATION_LEAD, COLLATION_VOWEL, COLLATION_TAIL
+    order = [*COLLATION_LEAD, *_extended(FLAG_LEAD),
+             *COLLATION_VOWEL, *_extended(FLAG_VOWEL),
+             *COLLATION_TAIL, *_extended(FLAG_TAIL)]
+    weights = {char: chr(code)
+               for code, char in enumerate(order, _FIRST_WEIGHT)}
+    table = {ord(char): _utf8(weight) for char, weight in weights.items()}
+    for position, mapping in sorted(_hcj_to_jamo_tables().items()):
+        for char, jamo in mapping.items():
+            if jamo != char and jamo in weights:
+                table.setdefault(ord(char), _utf8(weights[jamo]))
+    for code, jamo in _hangul_to_jamo_table().items():
+        table[code] = _utf8(''.join(map(weights.__getitem__, jamo)))
+    return _KeyTable(table, len(order))
+
+
+def sort_key(text):
+    """Return a bytes key for text that sorts in jamo order.
+    Arguments may be strings or iterables of characters.
+
+    Keys of text that begins with a given string begin with the key of that
+    string, even when it ends partway through a syllable: the key of "한구"
+    is a prefix of the key of "한국어".
+    """
+    if not isinstance(text, str):
+        text = ''.join(text)
+    return charmap_encode(text, 'strict', _key_table())[0]
+
+
+def _sort_keys(strings):
+    """Return a list of the sort_key of each of strings, encoding them a
+    batch at a time joined by newlines, which sort_key leaves alone.
+    """
+    table = _key_table()
+    keys = []
+    for start in range(0, len(strings), _BATCH):
+        batch = strings[start:start + _BATCH]
+        found = charmap_encode('\n'.join(batch), 'strict',
+                               table)[0].split(b'\n')
+        # Strings holding newlines split into more than one key.
+        if len(found) != len(batch):
+            found = [sort_key(_) for _ in batch]
+        keys.extend(found)
+    return keys
+
+
+def sort(strings, reverse=False):
+    """Return a new list of strings sorted in jamo order, as by sort_key.
+    The sort is stable, so strings with equal keys, such as a Hangul
+    character and its jamo, keep their order.
+    """
+    strings = list(strings)
+    keys = _sort_keys(strings)
+    order = sorted(range(len(strings)), key=keys.__getitem__,
+                   reverse=reverse)
+    return [strings[_] for _ in order]
+
+
+def bisect_left(strings, text, lo=0, hi=None):
+    """Return where text would go in strings, a list sorted by sort_key,
+    before any strings with an equal key, as bisect.bisect_left does.
+    """
+    return bisect.bisect_left(KeySequence(strings, sort_key),
+                              sort_key(text), lo,
+                              len(strings) if hi is None else hi)
+
+
+def bisect_right(strings, text, lo=0, hi=None):
+    """Return where text would go in strings, a list sorted by sort_key,
+    after any strings with an equal key, as bisect.bisect_right does.
+    """
+    return bisect.bisect_right(KeySequence(strings, sort_key),
+                               sort_key(text), lo,
+                               len(strings) if hi is None else hi)
+
+
+def prefix_range(strings, prefix, lo=0, hi=None):
+    """Return the (start, end) range of the strings in strings, a list
+    sorted by sort_key, that begin with prefix in jamo order. The prefix may
+    end partway through a syllable, so "한구" finds "한국어".
+    """
+    keys = KeySequence(strings, sort_key)
+    hi = len(strings) if hi is None else hi
+    key = sort_key(prefix)
+    start = bisect.bisect_left(keys, key, lo, hi)
+    # UTF-8 never contains 0xFF, so this sorts after every key with the
+    # prefix.
+    return start, bisect.bisect_left(keys, key + b'\xff', start, hi)
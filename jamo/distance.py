@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Edit distances between strings of jamo.
+
+Strings are split into U+11xx jamo with h2j before they are compared, so
+"간" and "갈" are one substitution apart rather than two unrelated
+syllables. Pass decompose=False to compare strings as they are.
+
+levenshtein and damerau_levenshtein use the bit-parallel algorithm of Myers
+as formulated by Hyyrö, with one bit per character of the first string held
+in a Python integer, so each character of the second string costs a handful
+of integer operations. That is fastest for short strings, such as words.
+weighted_levenshtein allows substitution, insertion, and deletion costs to
+depend on jamo class, which the bit-parallel algorithm cannot, and is a
+plain dynamic program.
+"""
+
+from .jamo import h2j, _jamo_flags, FLAG_LEAD, FLAG_VOWEL, FLAG_TAIL
+
+# Jamo classes as used for costs. None is anything other than a U+11xx or
+# extended lead, vowel, or tail, including HCJ consonants.
+CLASSES = ("lead", "vowel", "tail", None)
+
+
+def _prepare(string, decompose):
+    if not isinstance(string, str):
+        string = ''.join(string)
+    return h2j(string) if decompose else string
+
+
+def _pattern_masks(pattern):
+    """Return a dict mapping each character of pattern to a bit mask of the
+    positions where it occurs.
+    """
+    masks = {}
+    bit = 1
+    for char in pattern:
+        masks[char] = masks.get(char, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _bit_parallel(masks, length, text, transpositions=False,
+                  max_distance=None):
+    """Return the distance between a pattern, given as its _pattern_masks and
+    length, and text. With transpositions=True, swapping adjacent characters
+    costs one edit (optimal string alignment). With max_distance, stop early
+    and return max_distance + 1 once the distance is certain to exceed it.
+    """
+    if not length:
+        distance = len(text)
+    else:
+        mask = (1 << length) - 1
+        top = 1 << (length - 1)
+        vp, vn, d0, previous = mask, 0, 0, 0
+        distance = length
+        remaining = len(text)
+        for char in text:
+            pm = masks.get(char, 0)
+            if transpositions:
+                swapped = (~d0 & pm) << 1 & previous
+                d0 = ((((pm & vp) + vp) ^ vp) | pm | vn | swapped) & mask
+                previous = pm
+            else:
+                d0 = ((((pm & vp) + vp) ^ vp) | pm | vn) & mask
+            hp = vn | (~(d0 | vp) & mask)
+            hn = d0 & vp
+            if hp & top:
+                distance += 1
+            elif hn & top:
+                distance -= 1
+            hp = (hp << 1 | 1) & mask
+            hn = hn << 1 & mask
+            vp = hn | (~(d0 | hp) & mask)
+            vn = hp & d0
+            remaining -= 1
+            if max_distance is not None and \
+                    distance - remaining > max_distance:
+                return max_distance + 1
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def levenshtein(a, b, decompose=True):
+    """Return the number of jamo insertions, deletions, and substitutions
+    needed to turn a into b.
+    Arguments may be strings or iterables of characters.
+    """
+    a, b = _prepare(a, decompose), _prepare(b, decompose)
+    return _bit_parallel(_pattern_masks(a), len(a), b)
+
+
+def damerau_levenshtein(a, b, decompose=True):
+    """Return the number of jamo insertions, deletions, substitutions, and
+    swaps of adjacent jamo needed to turn a into b.
+    Arguments may be strings or iterables of characters.
+
+    This is the optimal string alignment distance: no substring is edited
+    more than once, so a swapped pair is not edited further.
+    """
+    a, b = _prepare(a, decompose), _prepare(b, decompose)
+    return _bit_parallel(_pattern_masks(a), len(a), b, transpositions=True)
+
+
+def levenshtein_many(query, candidates, transpositions=False,
+                     max_distance=None, decompose=True):
+    """Return a list of the distances from query to each candidate.
+    Arguments may be strings or iterables of characters.
+
+    The query is prepared once and compared against every candidate, as
+    levenshtein does, or as damerau_levenshtein does with
+    transpositions=True. With max_distance, distances greater than it are
+    reported as max_distance + 1, and candidates are abandoned as soon as
+    they are certain to be that far.
+    """
+    query = _prepare(query, decompose)
+    masks = _pattern_masks(query)
+    return [_bit_parallel(masks, len(query), _prepare(candidate, decompose),
+                          transpositions, max_distance)
+            for candidate in candidates]
+
+
+def _class_index(char):
+    flags = _jamo_flags().get(char, 0)
+    if flags & FLAG_LEAD:
+        return 0
+    if flags & FLAG_VOWEL:
+        return 1
+    if flags & FLAG_TAIL:
+        return 2
+    return 3
+
+
+def _costs(costs):
+    """Return costs, given as a number or as a dict from class to cost, as a
+    tuple in CLASSES order. Classes missing from a dict cost 1.
+    """
+    if isinstance(costs, dict):
+        return tuple(costs.get(_, 1) for _ in CLASSES)
+    return (costs,) * len(CLASSES)
+
+
+def weighted_levenshtein(a, b, substitution=1, insertion=1, deletion=1,
+                         decompose=True):
+    """Return the lowest total cost of insertions, deletions, and
+    substitutions needed to turn a into b.
+    Arguments may be strings or iterables of characters.
+
+    Each cost may be a number, or a dict mapping a jamo class ("lead",
+    "vowel", "tail", as returned by get_jamo_class, or None for anything
+    else) to a cost; classes missing from a dict cost 1. Insertion and
+    deletion costs depend on the class of the character inserted or
+    deleted. A substitution costs substitution[class] when both characters
+    have the same class, and substitution[None] otherwise.
+    """
+    a, b = _prepare(a, decompose), _prepare(b, decompose)
+    substitution = _costs(substitution)
+    insertion, deletion = _costs(insertion), _costs(deletion)
+    classes_a = [_class_index(_) for _ in a]
+    classes_b = [_class_index(_) for _ in b]
+    inserts = [insertion[_] for _ in classes_b]
+
+    row = [0]
+    for cost in inserts:
+        row.append(row[-1] + cost)
+    for char_a, class_a in zip(a, classes_a):
+        delete = deletion[class_a]
+        previous, row = row, [row[0] + delete]
+        for j, (char_b, class_b) in enumerate(zip(b, classes_b)):
+            if char_a == char_b:
+                replace = previous[j]
+            elif class_a == class_b:
+                replace = previous[j] + substitution[class_a]
+            else:
+                replace = previous[j] + substitution[3]
+            row.append(min(replace, previous[j + 1] + delete,
+                           row[j] + inserts[j]))
+    return row[-1]
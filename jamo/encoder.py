@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Integer encoding of jamo for character-level models.
+
+A JamoEncoder gives every jamo in its vocabulary an integer ID. Text is
+split into U+11xx jamo and mapped to IDs in a single str.translate, so there
+is no Python-level lookup per character.
+"""
+
+import sys
+from array import array
+
+from .jamo import (JAMO_LEADS, JAMO_LEADS_MODERN, JAMO_VOWELS,
+                   JAMO_VOWELS_MODERN, JAMO_TAILS, JAMO_TAILS_MODERN,
+                   synth_hangul, _MemoTable, _hangul_to_jamo_table,
+                   _jamo_flags)
+
+# IDs are carried as the codepoints of a string, which is then encoded as
+# UTF-32 in native byte order to become an array('I').
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+PAD = 0
+OOV = 1
+# IDs from 0xD800 on would reach the surrogates, which UTF-32 cannot encode.
+MAX_VOCABULARY = 0xD800
+
+
+class _OOVTable(_MemoTable):
+    """A str.translate table that maps codepoints missing from it to oov."""
+    def __init__(self, table, oov):
+        super(_OOVTable, self).__init__(table)
+        self.oov = oov
+
+    def value(self, code):
+        return self.oov
+
+
+def _archaic_jamo():
+    """Return the non-modern U+11xx and extended jamo, in codepoint order."""
+    modern = set(JAMO_LEADS_MODERN + JAMO_VOWELS_MODERN + JAMO_TAILS_MODERN)
+    return [char for char in sorted(_jamo_flags()) if char not in modern
+            if not 0x3130 <= ord(char) < 0x3190]
+
+
+def _hcj():
+    return [char for char in sorted(_jamo_flags())
+            if 0x3130 <= ord(char) < 0x3190]
+
+
+class JamoEncoder(object):
+    """Encode text as jamo IDs and decode it back.
+
+    ID 0 is padding and ID 1 is out of vocabulary (OOV). The modern lead,
+    vowel, and tail jamo of JAMO_LEADS_MODERN, JAMO_VOWELS_MODERN, and
+    JAMO_TAILS_MODERN come next, in that order. With archaic=True, archaic
+    and extended jamo get IDs after them, and with hcj=True, so do HCJ.
+    Every character in chars gets an ID last. Anything else is OOV, and
+    decodes to oov_char. The vocabulary may have at most MAX_VOCABULARY
+    entries; ValueError is raised for a larger one.
+    """
+    def __init__(self, archaic=False, hcj=False, chars=" ",
+                 oov_char='\ufffd'):
+        vocabulary = ['', oov_char]
+        vocabulary += JAMO_LEADS_MODERN + JAMO_VOWELS_MODERN +\
+            JAMO_TAILS_MODERN
+        if archaic:
+            vocabulary += _archaic_jamo()
+        if hcj:
+            vocabulary += _hcj()
+        known = set(vocabulary)
+        vocabulary += [char for char in dict.fromkeys(chars)
+                       if char not in known]
+        if len(vocabulary) > MAX_VOCABULARY:
+            raise ValueError("vocabulary of {} exceeds {} entries".format(
+                len(vocabulary), MAX_VOCABULARY))
+        self.vocabulary = vocabulary
+        table = _OOVTable(((ord(char), chr(code))
+                           for code, char in enumerate(vocabulary)
+                           if code > OOV), chr(OOV))
+        # Hangul characters map straight to the IDs of their jamo.
+        table.update((code, jamo.translate(table))
+                     for code, jamo in _hangul_to_jamo_table().items())
+        self._encode_table = table
+        # IDs outside the vocabulary decode to oov_char.
+        self._decode_table = _OOVTable(enumerate(vocabulary), oov_char)
+
+    def __len__(self):
+        return len(self.vocabulary)
+
+    def _encode_bytes(self, text):
+        return text.translate(self._encode_table).encode(_UTF32)
+
+    def encode(self, text):
+        """Return the IDs of the jamo of a string as an array('I')."""
+        ids = array('I')
+        ids.frombytes(self._encode_bytes(text))
+        return ids
+
+    def encode_batch(self, texts, width=None):
+        """Encode a sequence of strings into a padded 2-D array of IDs.
+
+        Returns (ids, lengths). ids is a memoryview of unsigned ints with
+        shape (len(texts), width), which numpy.asarray accepts without a
+        copy. Rows are padded with PAD, and width defaults to the length of
+        the longest row; longer rows are cut to fit. lengths is an
+        array('I') of the number of IDs in each row, not counting padding.
+        A memoryview cannot have a zero dimension, so ids is flat and empty
+        when there are no rows or all are empty.
+        """
+        rows = [self._encode_bytes(text) for text in texts]
+        lengths = array('I', [len(row) // 4 for row in rows])
+        if width is None:
+            width = max(lengths, default=0)
+        else:
+            lengths = array('I', [min(_, width) for _ in lengths])
+            rows = [row[:width * 4] for row in rows]
+        padding = array('I', [PAD]).tobytes()
+        ids = array('I')
+        ids.frombytes(b''.join(row + padding * (width - len(row) // 4)
+                               for row in rows))
+        if not rows or not width:
+            return memoryview(ids), lengths
+        return (memoryview(ids).cast('B').cast('I', [len(rows), width]),
+                lengths)
+
+    def _decode_bytes(self, data, compose):
+        # IDs that are not codepoints decode to U+FFFD, which is outside
+        # the vocabulary too.
+        text = data.decode(_UTF32, 'replace').translate(self._decode_table)
+        return synth_hangul(text) if compose else text
+
+    def decode(self, ids, compose=True):
+        """Return the string for a sequence of IDs, dropping padding.
+        With compose=True, jamo are composed into Hangul with synth_hangul.
+        """
+        return self._decode_bytes(array('I', ids).tobytes(), compose)
+
+    def decode_batch(self, ids, lengths=None, compose=True):
+        """Return the strings for a 2-D array of IDs, as returned by
+        encode_batch. Arguments may also be NumPy arrays or sequences of
+        sequences of IDs. Rows are cut to lengths, if given.
+        """
+        try:
+            view = memoryview(ids)
+        except TypeError:
+            view = None
+        if view is not None and view.ndim == 2 and view.format == 'I':
+            # Slice rows straight out of the buffer.
+            data, step = view.tobytes(), view.shape[1] * 4
+            rows = [data[i:i + step] for i in range(0, len(data), step)]
+        else:
+            rows = [array('I', row).tobytes() for row in ids]
+        if lengths is not None:
+            rows = [row[:length * 4] for row, length in zip(rows, lengths)]
+        return [self._decode_bytes(row, compose) for row in rows]
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Top-k fuzzy lookup of words by jamo edit distance.
+
+A FuzzyIndex keeps, for every n-gram of the decomposed (h2j) form of its
+words, an array of the numbers of the words that contain it. A query counts
+the n-grams it shares with every word, verifies the words sharing the most
+with the bit-parallel distance of jamo.distance, and returns the closest.
+max_candidates bounds how many words are verified, trading recall for
+latency.
+"""
+
+from array import array
+from collections import Counter
+
+from .jamo import h2j
+from .distance import _pattern_masks, _bit_parallel
+
+# Pads the ends of words, so that their first and last jamo appear in as
+# many n-grams as the rest.
+_PAD = '\x00'
+
+
+class FuzzyIndex(object):
+    """An index of words for fuzzy lookup by jamo edit distance.
+
+    n is the length of the jamo n-grams used to find candidates. Longer
+    n-grams make postings shorter and lookups faster, but miss more words
+    with many edits.
+    """
+    def __init__(self, words=(), n=3):
+        self.n = n
+        self._words = []
+        self._numbers = {}
+        self._postings = {}
+        self._deleted = 0
+        for word in words:
+            self.insert(word)
+
+    def __len__(self):
+        return len(self._numbers)
+
+    def __contains__(self, word):
+        return word in self._numbers
+
+    def __iter__(self):
+        return iter(self._numbers)
+
+    def _grams(self, jamo):
+        padded = _PAD * (self.n - 1) + jamo + _PAD * (self.n - 1)
+        return set(padded[i:i + self.n]
+                   for i in range(len(padded) - self.n + 1))
+
+    def insert(self, word):
+        """Add a word to the index. Adding a word twice has no effect."""
+        if word in self._numbers:
+            return
+        number = len(self._words)
+        self._words.append(word)
+        self._numbers[word] = number
+        postings = self._postings
+        for gram in self._grams(h2j(word)):
+            if gram in postings:
+                postings[gram].append(number)
+            else:
+                postings[gram] = array('I', [number])
+
+    def delete(self, word):
+        """Remove a word from the index. Raises KeyError if it is missing.
+
+        Deleted words are skipped by search until enough of them pile up to
+        make rebuilding the postings worthwhile.
+        """
+        number = self._numbers.pop(word)
+        self._words[number] = None
+        self._deleted += 1
+        if self._deleted > max(len(self._numbers), 1000):
+            self.compact()
+
+    def compact(self):
+        """Drop deleted words from the postings, and renumber the rest so
+        that their slots are reclaimed.
+        """
+        renumbered = [None] * len(self._words)
+        kept_words = []
+        for number, word in enumerate(self._words):
+            if word is not None:
+                renumbered[number] = len(kept_words)
+                kept_words.append(word)
+        for gram, posting in list(self._postings.items()):
+            kept = array('I', [renumbered[_] for _ in posting
+                               if renumbered[_] is not None])
+            if kept:
+                self._postings[gram] = kept
+            else:
+                del self._postings[gram]
+        self._words = kept_words
+        self._numbers = {word: number
+                         for number, word in enumerate(kept_words)}
+        self._deleted = 0
+
+    def search(self, query, k=10, max_distance=None, max_candidates=200,
+               transpositions=False):
+        """Return up to k (word, distance) pairs for the words closest to
+        query, closest first, and then in order of the words.
+
+        Distances are counted in jamo, as by jamo.distance.levenshtein, or
+        jamo.distance.damerau_levenshtein with transpositions=True. Words
+        further than max_distance are left out.
+
+        Only the max_candidates words sharing the most n-grams with the
+        query are verified, so a larger max_candidates finds close words
+        more reliably but takes longer, and None verifies every word sharing
+        any n-gram.
+        """
+        if k <= 0:
+            return []
+        jamo = h2j(query)
+        counts = Counter()
+        for gram in self._grams(jamo):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                counts.update(posting)
+        masks = _pattern_masks(jamo)
+        words = self._words
+        found = []
+        cutoff = max_distance
+        # Deleted words still in the postings are skipped, not counted
+        # against max_candidates.
+        limit = None if max_candidates is None else\
+            max_candidates + self._deleted
+        verified = 0
+        for number, _ in counts.most_common(limit):
+            word = words[number]
+            if word is None:
+                continue
+            if verified == max_candidates:
+                break
+            verified += 1
+            distance = _bit_parallel(masks, len(jamo), h2j(word),
+                                     transpositions, cutoff)
+            if cutoff is not None and distance > cutoff:
+                continue
+            found.append((distance, word))
+            if len(found) >= k:
+                # Only words at least as close as the k-th are of interest.
+                found.sort()
+                del found[k:]
+                cutoff = found[-1][0]
+        found.sort()
+        return [(word, distance) for distance, word in found[:k]]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Initial consonant (choseong) search over a fixed list of entries.
+
+A ChoseongIndex answers autocomplete queries such as "ㄱㄴ", which should
+match "가나다", as well as queries that mix syllables and initial consonants,
+such as "가ㄴ". Entries are kept in one string with an array of offsets,
+and sorted by their choseong keys and by their text in two arrays of entry
+numbers, so the index costs a few bytes per entry beyond the text itself.
+Queries bisect the sorted keys, or the sorted entries when a query begins
+with whole syllables, whichever leaves fewer entries to check.
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from .jamo import choseong, is_hangul_char
+from ._search import KeySequence
+
+_MAGIC = b'JAMOCHO1'
+_HEADER = struct.Struct('<?QQ')
+# Sorts after any character, to bisect to the end of a run of prefixes.
+_LAST = '\U0010ffff'
+
+
+def _prefix_range(keys, prefix):
+    start = bisect_left(keys, prefix)
+    return start, bisect_right(keys, prefix + _LAST, start)
+
+
+class ChoseongIndex(object):
+    """An index of entries (strings) by their initial consonants.
+
+    With ignore_spaces=True, whitespace is left out of entries and queries
+    when matching them, so "ㅅㅅㅈㅈ" matches "삼성 전자".
+
+    Entries are numbered in the order they are given; len and indexing work
+    as for the list of entries.
+    """
+    def __init__(self, entries=(), ignore_spaces=True):
+        entries = list(entries)
+        self.ignore_spaces = ignore_spaces
+        self._text = ''.join(entries)
+        self._offsets = array('I', accumulate(map(len, entries), initial=0))
+        texts = list(map(self._normalize, entries))
+        # Entries with the same key are sorted by their text.
+        keys = [(choseong(text), text) for text in texts]
+        self._order = array('I', sorted(range(len(keys)),
+                                        key=keys.__getitem__))
+        self._text_order = array('I', sorted(range(len(texts)),
+                                             key=texts.__getitem__))
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, number):
+        if not -len(self) <= number < len(self):
+            raise IndexError("ChoseongIndex index out of range")
+        number %= len(self)
+        return self._text[self._offsets[number]:self._offsets[number + 1]]
+
+    def _normalize(self, text):
+        return ''.join(text.split()) if self.ignore_spaces else text
+
+    def _entry(self, number):
+        """Return an entry as it is matched, without bounds checks."""
+        offsets = self._offsets
+        return self._normalize(self._text[offsets[number]:
+                                          offsets[number + 1]])
+
+    def search_ids(self, query, limit=None):
+        """Return the numbers of the entries that begin with query, up to
+        limit of them.
+
+        Every HCJ consonant in query matches a Hangul character with that
+        lead, as well as the consonant itself; every Hangul character in
+        query matches only itself. Matches are in order of their choseong
+        keys and then their text, except that queries beginning with whole
+        syllables, as when an input method is still composing the last one,
+        may be answered in order of text alone.
+        """
+        if limit is not None and limit <= 0:
+            return []
+        query = self._normalize(query)
+        prefix = choseong(query)
+        syllables = [(i, char) for i, char in enumerate(query)
+                     if is_hangul_char(char)]
+        order = self._order
+        start, end = _prefix_range(
+            KeySequence(order, lambda _: choseong(self._entry(_))), prefix)
+        leading = 0
+        while leading < len(syllables) and syllables[leading][0] == leading:
+            leading += 1
+        if leading:
+            text_start, text_end = _prefix_range(
+                KeySequence(self._text_order, self._entry), query[:leading])
+            if text_end - text_start < end - start:
+                order = self._text_order
+                start, end = text_start, text_end
+        found = []
+        for position in range(start, end):
+            number = order[position]
+            entry = self._entry(number)
+            if choseong(entry[:len(prefix)]) == prefix and\
+                    all(entry[i] == char for i, char in syllables):
+                found.append(number)
+                if len(found) == limit:
+                    break
+        return found
+
+    def search(self, query, limit=None):
+        """Return the entries that begin with query, as search_ids."""
+        return [self[_] for _ in self.search_ids(query, limit)]
+
+    def save(self, path):
+        """Write the index to a file, for ChoseongIndex.load."""
+        text = self._text.encode('utf-8', 'surrogatepass')
+        arrays = [array('I', _) for _ in (self._offsets, self._order,
+                                          self._text_order)]
+        with open(path, 'wb') as fout:
+            fout.write(_MAGIC)
+            fout.write(_HEADER.pack(self.ignore_spaces, len(self), len(text)))
+            for values in arrays:
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                fout.write(values.tobytes())
+            fout.write(text)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save. Nothing is sorted again."""
+        with open(path, 'rb') as fin:
+            data = memoryview(fin.read())
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError("{} is not a ChoseongIndex file".format(path))
+        position = len(_MAGIC)
+        if len(data) < position + _HEADER.size:
+            raise ValueError("{} is truncated".format(path))
+        ignore_spaces, count, size = _HEADER.unpack_from(data, position)
+        position += _HEADER.size
+        end = position + (3 * count + 1) * array('I').itemsize + size
+        if len(data) < end:
+            raise ValueError("{} is truncated".format(path))
+        index = cls.__new__(cls)
+        index.ignore_spaces = ignore_spaces
+        index._offsets, index._order, index._text_order = \
+            array('I'), array('I'), array('I')
+        for values, length in ((index._offsets, count + 1),
+                               (index._order, count),
+                               (index._text_order, count)):
+            end = position + length * values.itemsize
+            values.frombytes(data[position:end])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            position = end
+        index._text = str(data[position:position + size], 'utf-8',
+                          'surrogatepass')
+        return index
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Opt-in call statistics for the conversion functions.
+
+While instrumentation is enabled, h2j, j2hcj, hcj_to_jamo, jamo_to_hangul,
+and get_jamo_class are replaced, in jamo and every loaded jamo module, by
+wrappers that count calls, characters converted, time spent, and
+exceptions raised, by function and by the type of the first argument (a
+str, or some other iterable, which takes a slower path). Disabling puts the
+original functions back, so instrumentation costs nothing while it is off.
+
+Enable it with enable(), within a "with profile():" block, or for a whole
+program by setting the JAMO_PROFILE environment variable to 1, which also
+prints the statistics to standard error at exit. Names imported with
+"from jamo import h2j" before instrumentation is enabled keep the original
+functions; JAMO_PROFILE enables it before anything else is imported.
+"""
+
+import atexit
+import functools
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from . import jamo as _jamo
+
+FUNCTIONS = ("h2j", "j2hcj", "hcj_to_jamo", "jamo_to_hangul",
+             "get_jamo_class")
+# Functions whose first argument is a string of characters to convert; the
+# others convert one character (or syllable) per call.
+_STRING_FUNCTIONS = ("h2j", "j2hcj")
+_FIELDS = ("calls", "chars", "seconds", "errors")
+_HELP = {"calls": "Calls to jamo conversion functions.",
+         "chars": "Characters converted by jamo conversion functions.",
+         "seconds": "Time spent in jamo conversion functions.",
+         "errors": "Exceptions raised by jamo conversion functions."}
+
+_ORIGINALS = {name: getattr(_jamo, name) for name in FUNCTIONS}
+_wrappers = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def _wrap(name, func):
+    """Return func wrapped to record its statistics under name."""
+    count_string = name in _STRING_FUNCTIONS
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            argument = args[0] if args else None
+            if not count_string:
+                chars = 1
+            elif hasattr(argument, '__len__'):
+                chars = len(argument)
+            else:
+                chars = 0
+            key = (name, type(argument).__name__)
+            with _lock:
+                stats = _stats.get(key)
+                if stats is None:
+                    stats = _stats[key] = [0, 0, 0.0, 0]
+                stats[0] += 1
+                stats[1] += chars
+                stats[2] += seconds
+                stats[3] += failed
+    return wrapper
+
+
+def _modules():
+    return [module for name, module in list(sys.modules.items())
+            if module is not None
+            if name == "jamo" or name.startswith("jamo.")]
+
+
+def _replace(replacements):
+    """Rebind every module attribute that is one of the (old, new) pairs of
+    replacements to the new function.
+    """
+    functions = {id(old): (old, new) for old, new in replacements}
+    for module in _modules():
+        namespace = vars(module)
+        for attribute, value in list(namespace.items()):
+            old, new = functions.get(id(value), (None, None))
+            if value is old:
+                namespace[attribute] = new
+
+
+def is_enabled():
+    """Return whether instrumentation is enabled."""
+    return bool(_wrappers)
+
+
+def enable():
+    """Start recording statistics. Has no effect if already enabled."""
+    with _lock:
+        if _wrappers:
+            return
+        for name, func in _ORIGINALS.items():
+            _wrappers[name] = _wrap(name, func)
+        _replace([(_ORIGINALS[_], _wrappers[_]) for _ in FUNCTIONS])
+
+
+def disable():
+    """Stop recording statistics and restore the original functions.
+    Statistics recorded so far are kept.
+    """
+    with _lock:
+        if not _wrappers:
+            return
+        _replace([(_wrappers[_], _ORIGINALS[_]) for _ in FUNCTIONS])
+        _wrappers.clear()
+
+
+def reset():
+    """Forget the statistics recorded so far."""
+    with _lock:
+        _stats.clear()
+
+
+@contextmanager
+def profile(reset_stats=False):
+    """Record statistics within a with block, first forgetting earlier ones
+    if reset_stats is True. Instrumentation is left as it was found.
+    """
+    was_enabled = is_enabled()
+    if reset_stats:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot():
+    """Return the statistics recorded so far as a dict.
+
+    Each instrumented function maps to a dict of its total "calls", "chars"
+    (characters converted), "seconds", and "errors" (exceptions raised),
+    along with "inputs", a dict mapping the type name of the first argument
+    to a dict of the same totals for calls with that type.
+    """
+    with _lock:
+        items = sorted((key, list(stats)) for key, stats in _stats.items())
+    result = {}
+    for (name, kind), stats in items:
+        entry = result.setdefault(name, dict.fromkeys(_FIELDS, 0))
+        entry.setdefault("inputs", {})[kind] = dict(zip(_FIELDS, stats))
+        for field, value in zip(_FIELDS, stats):
+            entry[field] += value
+    return result
+
+
+def prometheus():
+    """Return the statistics recorded so far in the Prometheus text
+    exposition format, as counters labelled by function and input type.
+    """
+    with _lock:
+        items = sorted((key, list(stats)) for key, stats in _stats.items())
+    lines = []
+    for number, field in enumerate(_FIELDS):
+        metric = "jamo_{}_total".format(field)
+        lines.append("# HELP {} {}".format(metric, _HELP[field]))
+        lines.append("# TYPE {} counter".format(metric))
+        for (name, kind), stats in items:
+            lines.append('{}{{function="{}",input="{}"}} {!r}'.format(
+                metric, name, kind, stats[number]))
+    return '\n'.join(lines) + '\n'
+
+
+def _report():
+    sys.stderr.write(prometheus())
+
+
+def _enable_from_environment():
+    """Enable instrumentation for the whole program, as JAMO_PROFILE=1
+    asks, and print the statistics at exit.
+    """
+    enable()
+    atexit.register(_report)
@@ -7,27 +7,16 @@ For more information, see:
 http://python-jamo.readthedocs.org/ko/latest/
 """
 
-import os
-from sys import stderr
-from itertools import chain
-import json
-import re
+from functools import lru_cache
+from itertools import accumulate, chain
+from operator import add
 
 
-_ROOT = os.path.abspath(os.path.dirname(__file__))
-
 _JAMO_OFFSET = 44032
 _JAMO_LEAD_OFFSET = 0x10ff
 _JAMO_VOWEL_OFFSET = 0x1160
 _JAMO_TAIL_OFFSET = 0x11a7
 
-with open(os.path.join(_ROOT, 'data', "U+11xx.json"), 'r') as namedata:
-    _JAMO_TO_NAME = json.load(namedata)
-_JAMO_REVERSE_LOOKUP = {name: char for char, name in _JAMO_TO_NAME.items()}
-with open(os.path.join(_ROOT, 'data', "U+31xx.json"), 'r') as namedata:
-    _HCJ_TO_NAME = json.load(namedata)
-_HCJ_REVERSE_LOOKUP = {name: char for char, name in _HCJ_TO_NAME.items()}
-
 JAMO_LEADS = [chr(_) for _ in range(0x1100, 0x115F)]
 JAMO_LEADS_MODERN = [chr(_) for _ in range(0x1100, 0x1113)]
 JAMO_VOWELS = [chr(_) for _ in range(0x1161, 0x11A8)]
@@ -35,14 +24,358 @@ JAMO_VOWELS_MODERN = [chr(_) for _ in range(0x1161, 0x1176)]
 JAMO_TAILS = [chr(_) for _ in range(0x11A8, 0x1200)]
 JAMO_TAILS_MODERN = [chr(_) for _ in range(0x11A8, 0x11C3)]
 
+# Character class bits, as reported by classify.
+FLAG_LEAD = 0x01
+FLAG_VOWEL = 0x02
+FLAG_TAIL = 0x04
+FLAG_HCJ = 0x08
+FLAG_MODERN = 0x10
+FLAG_HANGUL = 0x20
+_FLAG_JAMO = FLAG_LEAD | FLAG_VOWEL | FLAG_TAIL | FLAG_HCJ
+_FLAG_HCJ_MODERN = FLAG_HCJ | FLAG_MODERN
+
+# Fields of the namedtuple classes, which __getattr__ creates on first use
+# since creating them costs more than the rest of importing this module.
+_RECORDS = {
+    # One invalid input found with errors='collect'. position is the index
+    # of the character (or triple, for jamo_to_hangul_many) in the input,
+    # value is the offending input, and reason describes the problem.
+    'JamoErrorRecord': ['position', 'value', 'reason'],
+    # Character counts by kind, as returned by scan. modern_jamo and
+    # archaic_jamo count U+11xx and extended jamo (modern as in
+    # is_jamo_modern), hcj counts HCJ, and other counts everything that is
+    # not Hangul.
+    'ScanResult': ['precomposed', 'modern_jamo', 'archaic_jamo', 'hcj',
+                   'other'],
+}
+
+
+@lru_cache(maxsize=None)
+def _record_class(name):
+    """Return the namedtuple class JamoErrorRecord or ScanResult."""
+    from collections import namedtuple
+    return namedtuple(name, _RECORDS[name], module=__name__)
+
+
+def __getattr__(name):
+    if name not in _RECORDS:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    return _record_class(name)
+
+
+# The lookup tables below are built on first use rather than at import time,
+# so that short-lived programs only pay for the conversions they call. The
+# name-derived tables come from jamo/_tables.py, which is generated from the
+# Unicode name data in jamo/data by tools/parse.py --tables.
+
+
+@lru_cache(maxsize=None)
+def _hangul_to_jamo_table():
+    """Return a str.translate table mapping every Hangul syllable codepoint to
+    its decomposed U+11xx jamo string.
+    Syllables are laid out in lead, vowel, tail order, so the table is filled
+    by walking the modern jamo in the same order.
+    """
+    table = {}
+    code = _JAMO_OFFSET
+    for lead in JAMO_LEADS_MODERN:
+        for vowel in JAMO_VOWELS_MODERN:
+            table[code] = lead + vowel
+            code += 1
+            for tail in JAMO_TAILS_MODERN:
+                table[code] = lead + vowel + tail
+                code += 1
+    return table
+
+
+@lru_cache(maxsize=None)
+def _jamo_to_hangul_table():
+    """Return a dict mapping decomposed jamo strings to Hangul characters."""
+    return {jamo: chr(code)
+            for code, jamo in _hangul_to_jamo_table().items()}
+
+
+@lru_cache(maxsize=None)
+def _jamo_to_hcj_table():
+    """Return a str.translate table mapping every U+11xx jamo with a HCJ
+    counterpart to that HCJ character.
+    """
+    from ._tables import JAMO_TO_HCJ
+    return {ord(char): hcj for char, hcj in JAMO_TO_HCJ.items()}
+
+
+@lru_cache(maxsize=None)
+def _hangul_to_hcj_table():
+    """Return a str.translate table mapping Hangul syllables and jamo to
+    HCJ.
+    """
+    jamo_to_hcj = _jamo_to_hcj_table()
+    table = dict(jamo_to_hcj)
+    table.update((code, jamo.translate(jamo_to_hcj))
+                 for code, jamo in _hangul_to_jamo_table().items())
+    return table
+
+
+@lru_cache(maxsize=None)
+def _choseong_table():
+    """Return a str.translate table mapping Hangul syllables and modern
+    lead jamo to the HCJ of their lead.
+    Each run of 588 syllables shares a lead, in JAMO_LEADS_MODERN order.
+    """
+    jamo_to_hcj = _jamo_to_hcj_table()
+    table = {ord(lead): jamo_to_hcj[ord(lead)] for lead in JAMO_LEADS_MODERN}
+    for index, lead in enumerate(JAMO_LEADS_MODERN):
+        start = _JAMO_OFFSET + index * 588
+        table.update(dict.fromkeys(range(start, start + 588),
+                                   jamo_to_hcj[ord(lead)]))
+    return table
+
+
+@lru_cache(maxsize=None)
+def _hcj_to_jamo_tables():
+    """Return a dict of position ("lead", "vowel", "tail") to a dict mapping
+    every named jamo and HCJ character to the U+11xx jamo of the same name in
+    that position. Characters with no such jamo map to themselves.
+    """
+    from ._tables import (NAMED, HCJ_TO_JAMO_LEAD, HCJ_TO_JAMO_VOWEL,
+                          HCJ_TO_JAMO_TAIL)
+    tables = {}
+    for position, mapping in (("lead", HCJ_TO_JAMO_LEAD),
+                              ("vowel", HCJ_TO_JAMO_VOWEL),
+                              ("tail", HCJ_TO_JAMO_TAIL)):
+        tables[position] = {char: char for char in NAMED}
+        tables[position].update(mapping)
+    return tables
+
+
+@lru_cache(maxsize=None)
+def _composition_codes():
+    """Return dicts mapping each valid jamo_to_hangul lead, vowel, and tail
+    argument to its share of the Hangul codepoint.
+    Tails are only converted from HCJ, as with hcj_to_jamo(tail, "tail").
+    """
+    tables = _hcj_to_jamo_tables()
+    leads = {char: (ord(jamo) - 0x1100) * 588 + _JAMO_OFFSET
+             for char, jamo in tables["lead"].items()
+             if jamo in JAMO_LEADS_MODERN}
+    vowels = {char: (ord(jamo) - 0x1161) * 28
+              for char, jamo in tables["vowel"].items()
+              if jamo in JAMO_VOWELS_MODERN}
+    tails = {char: ord(jamo) - _JAMO_TAIL_OFFSET
+             for char, jamo in tables["tail"].items()
+             if jamo in JAMO_TAILS_MODERN
+             if is_hcj(char) or char == jamo}
+    tails.update({'': 0, '\x00': 0, None: 0, 0: 0})
+    return leads, vowels, tails
+
+
+@lru_cache(maxsize=None)
+def _syllable_pattern():
+    """Return a pattern matching a modern lead and vowel, optionally followed
+    by a modern tail.
+    """
+    import re
+    return re.compile("[\u1100-\u1112][\u1161-\u1175][\u11a8-\u11c2]?")
+
+
+@lru_cache(maxsize=None)
+def _unmapped_jamo_pattern():
+    """Return a pattern matching jamo that have no HCJ counterpart."""
+    import re
+    table = _jamo_to_hcj_table()
+    return re.compile("[{}]".format(''.join(
+        char for char, flags in sorted(_jamo_flags().items())
+        if flags & _FLAG_JAMO and not flags & FLAG_HCJ
+        if ord(char) not in table)))
+
+
+@lru_cache(maxsize=None)
+def _surrogate_pattern():
+    """Return a pattern matching lone surrogates, which is how malformed
+    bytes look after decoding with errors='surrogateescape'.
+    """
+    import re
+    return re.compile("[\\ud800-\\udfff]")
+
+
+@lru_cache(maxsize=None)
+def _jamo_flags():
+    """Return a dict mapping every jamo and HCJ character to its FLAG_* bits.
+    Covers the U+1100, U+3130, U+A960, and U+D7B0 blocks; characters that
+    are missing have no flags.
+    """
+    flags = {}
+    for start, stop, flag in ((0x1100, 0x1160, FLAG_LEAD),
+                              (0x1160, 0x11A8, FLAG_VOWEL),
+                              (0x11A8, 0x1200, FLAG_TAIL),
+                              (0xA960, 0xA97D, FLAG_LEAD),
+                              (0xD7B0, 0xD7C7, FLAG_VOWEL),
+                              (0xD7CB, 0xD7FC, FLAG_TAIL),
+                              (0x3131, 0x3164, FLAG_HCJ),
+                              (0x3165, 0x318F, FLAG_HCJ),
+                              # HCJ vowels are classed as vowels.
+                              (0x314F, 0x3164, FLAG_VOWEL),
+                              (0x1100, 0x1113, FLAG_MODERN),
+                              (0x1161, 0x1176, FLAG_MODERN),
+                              (0x11A8, 0x11C3, FLAG_MODERN),
+                              (0x3131, 0x3164, FLAG_MODERN)):
+        for code in range(start, stop):
+            flags[chr(code)] = flags.get(chr(code), 0) | flag
+    return flags
+
+
+class _MemoTable(dict):
+    """A str.translate table that maps codepoints missing from it to
+    value(code), by default the codepoint itself. Missing codepoints are
+    added on first sight, so that later lookups stay in C. Astral codepoints
+    are not remembered, which bounds the table to the BMP.
+    """
+    def value(self, code):
+        return code
+
+    def __missing__(self, code):
+        value = self.value(code)
+        if code < 0x10000:
+            self[code] = value
+        return value
+
+
+class _ClassifyTable(_MemoTable):
+    """A str.translate table mapping codepoints to their FLAG_* bits as
+    characters. Codepoints without flags map to default.
+    """
+    default = '\x00'
+
+    def value(self, code):
+        return self.default
+
+
+class _LengthTable(_ClassifyTable):
+    """A str.translate table mapping codepoints to the length of their h2j
+    output as characters. Like _ClassifyTable, but anything other than
+    Hangul is one character long.
+    """
+    default = '\x01'
+
+
+@lru_cache(maxsize=None)
+def _classify_table():
+    table = _ClassifyTable((ord(char), chr(flags))
+                           for char, flags in _jamo_flags().items())
+    table.update(dict.fromkeys(range(0xAC00, 0xD7A4), chr(FLAG_HANGUL)))
+    return table
+
+
+@lru_cache(maxsize=None)
+def _scan_table():
+    """Return a str.translate table mapping codepoints to their index in
+    ScanResult, counting other as 0.
+    """
+    table = _ClassifyTable()
+    for char, flags in _jamo_flags().items():
+        if flags & FLAG_HCJ:
+            table[ord(char)] = '\x04'
+        elif flags & FLAG_MODERN:
+            table[ord(char)] = '\x02'
+        else:
+            table[ord(char)] = '\x03'
+    table.update(dict.fromkeys(range(0xAC00, 0xD7A4), '\x01'))
+    return table
+
+
+@lru_cache(maxsize=None)
+def _hangul_pattern():
+    """Return a pattern matching Hangul characters, jamo, and HCJ."""
+    import re
+    return re.compile("[\uac00-\ud7a3{}]".format(''.join(sorted(
+        _jamo_flags()))))
+
+
+@lru_cache(maxsize=None)
+def _jamo_pattern():
+    """Return a pattern matching jamo and HCJ."""
+    import re
+    return re.compile("[{}]".format(''.join(sorted(_jamo_flags()))))
+
+
+@lru_cache(maxsize=None)
+def _jamo_length_table():
+    return _LengthTable((code, chr(len(jamo)))
+                        for code, jamo in _hangul_to_jamo_table().items())
+
+
+_START_MARKS = (b'', b'\x01', b'\x01\x00', b'\x01\x00\x00')
+
+
+def _offset_maps(lengths):
+    """Return offset maps between two strings, given how many characters of
+    the longer string each character of the shorter one corresponds to.
+
+    Returns (starts, owners): starts[i] is the index in the longer string of
+    the first character for shorter string character i, and owners[j] is the
+    index in the shorter string of longer string character j. Each ends with
+    an extra entry holding the length of the other string.
+    """
+    from array import array
+    starts = array('I', accumulate(lengths, initial=0))
+    # A 1 for every character of the longer string that starts a new
+    # character of the shorter one; their running total gives the owners.
+    marks = b''.join(map(_START_MARKS.__getitem__, lengths))
+    owners = array('I', accumulate(marks[1:], initial=0) if marks else ())
+    owners.append(len(lengths))
+    return starts, owners
+
 
 class InvalidJamoError(Exception):
     """jamo is a U+11xx codepoint."""
     def __init__(self, message, jamo):
-        super(InvalidJamoError, self).__init__(message)
         self.jamo = hex(ord(jamo))
-        print("Could not parse jamo: U+{code}".format(code=self.jamo[2:]),
-              file=stderr)
+        super(InvalidJamoError, self).__init__(
+            "{message} (U+{code})".format(message=message,
+                                          code=self.jamo[2:]))
+
+
+_ERROR_MODES = ('strict', 'ignore', 'replace', 'collect')
+
+
+def _handle_error(errors, message, jamo, value, unchanged):
+    """Handle a single invalid input according to an errors mode.
+    'strict' raises an InvalidJamoError about jamo, 'ignore' returns an empty
+    string, 'replace' returns U+FFFD, and 'collect' returns unchanged along
+    with a report of value.
+    """
+    if errors == 'strict':
+        raise InvalidJamoError(message, jamo)
+    if errors == 'ignore':
+        return ''
+    if errors == 'replace':
+        return '\ufffd'
+    if errors == 'collect':
+        record = _record_class('JamoErrorRecord')
+        return unchanged, [record(0, value, message)]
+    raise ValueError("Unknown errors mode: {!r}".format(errors))
+
+
+def _handle_errors(errors, message, pattern, text):
+    """Handle every match of pattern in text according to an errors mode.
+    Returns text with the matches removed or replaced, along with a list of
+    JamoErrorRecord when errors is 'collect'.
+    """
+    if errors == 'strict':
+        match = pattern.search(text)
+        if match:
+            raise InvalidJamoError(message, match.group())
+        return text, None
+    if errors == 'ignore':
+        return pattern.sub('', text), None
+    if errors == 'replace':
+        return pattern.sub('\ufffd', text), None
+    if errors == 'collect':
+        record = _record_class('JamoErrorRecord')
+        return text, [record(match.start(), match.group(), message)
+                      for match in pattern.finditer(text)]
+    raise ValueError("Unknown errors mode: {!r}".format(errors))
 
 
 def _hangul_char_to_jamo(syllable):
@@ -75,24 +408,7 @@ def _jamo_to_hangul_char(lead, vowel, tail=0):
 
 
 def _jamo_char_to_hcj(char):
-    if is_jamo(char):
-        hcj_name = re.sub("(?<=HANGUL )(\w+)",
-                          "LETTER",
-                          _get_unicode_name(char))
-        if hcj_name in _HCJ_REVERSE_LOOKUP.keys():
-            return _HCJ_REVERSE_LOOKUP[hcj_name]
-    return char
-
-
-def _get_unicode_name(char):
-    """Fetch the unicode name for jamo characters.
-    """
-    if char not in _JAMO_TO_NAME.keys() and char not in _HCJ_TO_NAME.keys():
-        raise InvalidJamoError("Not jamo or nameless jamo character", char)
-    else:
-        if is_hcj(char):
-            return _HCJ_TO_NAME[char]
-        return _JAMO_TO_NAME[char]
+    return _jamo_to_hcj_table().get(ord(char), char)
 
 
 def is_jamo(character):
@@ -100,11 +416,7 @@ def is_jamo(character):
     Valid jamo includes all modern and archaic jamo, as well as all HCJ.
     Non-assigned code points are invalid.
     """
-    code = ord(character)
-    return 0x1100 <= code <= 0x11FF or\
-        0xA960 <= code <= 0xA97C or\
-        0xD7B0 <= code <= 0xD7C6 or 0xD7CB <= code <= 0xD7FB or\
-        is_hcj(character)
+    return bool(_jamo_flags().get(character, 0) & _FLAG_JAMO)
 
 
 def is_jamo_modern(character):
@@ -114,11 +426,7 @@ def is_jamo_modern(character):
     WARNING: U+1160 is NOT considered a modern jamo character, but it is listed
     under 'Medial Vowels' in the Unicode 7.0 spec.
     """
-    code = ord(character)
-    return 0x1100 <= code <= 0x1112 or\
-        0x1161 <= code <= 0x1175 or\
-        0x11A8 <= code <= 0x11C2 or\
-        is_hcj_modern(character)
+    return bool(_jamo_flags().get(character, 0) & FLAG_MODERN)
 
 
 def is_hcj(character):
@@ -126,7 +434,7 @@ def is_hcj(character):
     HCJ is defined as the U+313x to U+318x block, sans two non-assigned code
     points.
     """
-    return 0x3131 <= ord(character) <= 0x318E and ord(character) != 0x3164
+    return bool(_jamo_flags().get(character, 0) & FLAG_HCJ)
 
 
 def is_hcj_modern(character):
@@ -134,9 +442,8 @@ def is_hcj_modern(character):
     Modern HCJ is defined as HCJ that corresponds to a U+11xx jamo character
     in modern usage.
     """
-    code = ord(character)
-    return 0x3131 <= code <= 0x314E or\
-        0x314F <= code <= 0x3163
+    return _jamo_flags().get(character, 0) & _FLAG_HCJ_MODERN ==\
+        _FLAG_HCJ_MODERN
 
 
 def is_hangul_char(character):
@@ -148,25 +455,67 @@ def is_hangul_char(character):
 
 def get_jamo_class(jamo):
     """Determine if a jamo character is a lead, vowel, or tail.
-    Integers and U+11xx characters are valid arguments. HCJ consonants are not
-    valid here.
+    U+11xx characters, the extended jamo in the U+A960 and U+D7B0 blocks, and
+    HCJ vowels are valid arguments. HCJ consonants are not valid here.
 
     get_jamo_class should return the class ["lead" | "vowel" | "tail"] of a
-    given character or integer.
+    given character.
 
     Note: jamo class directly corresponds to the Unicode 7.0 specification,
     thus includes filler characters as having a class.
     """
     # TODO: Perhaps raise a separate error for U+3xxx jamo.
-    if jamo in JAMO_LEADS or jamo == chr(0x115F):
+    flags = _jamo_flags().get(jamo, 0)
+    if flags & FLAG_LEAD:
         return "lead"
-    if jamo in JAMO_VOWELS or jamo == chr(0x1160) or\
-            0x314F <= ord(jamo) <= 0x3163:
+    if flags & FLAG_VOWEL:
         return "vowel"
-    if jamo in JAMO_TAILS:
+    if flags & FLAG_TAIL:
         return "tail"
-    else:
-        raise InvalidJamoError("Invalid or classless jamo argument.", jamo)
+    raise InvalidJamoError("Invalid or classless jamo argument.", jamo)
+
+
+def classify(text):
+    """Return the FLAG_* bits of every character in a string as bytes.
+    Arguments may be strings.
+
+    classify should return one byte per character: a combination of
+    FLAG_LEAD, FLAG_VOWEL, and FLAG_TAIL (the jamo class, as in
+    get_jamo_class), FLAG_HCJ, and FLAG_MODERN for jamo, FLAG_HANGUL for
+    Hangul characters, and 0 for anything else.
+    """
+    return text.translate(_classify_table()).encode('latin-1')
+
+
+def scan(text):
+    """Count the kinds of Hangul in a string in one pass.
+    Arguments may be strings or iterables of characters.
+
+    scan should return a ScanResult with the number of Hangul characters,
+    modern and archaic U+11xx (and extended) jamo, HCJ, and other
+    characters in text.
+    """
+    if not isinstance(text, str):
+        text = ''.join(text)
+    kinds = text.translate(_scan_table())
+    counts = [kinds.count(chr(_)) for _ in range(1, 5)]
+    return _record_class('ScanResult')(*counts,
+                                       other=len(text) - sum(counts))
+
+
+def contains_hangul(text):
+    """Test if a string contains any Hangul character, jamo, or HCJ.
+    Stops at the first one.
+    """
+    return _hangul_pattern().search(text) is not None
+
+
+def is_all_precomposed(text):
+    """Test if all the Hangul in a string is precomposed, that is, if it
+    contains no jamo or HCJ. Text without any Hangul passes.
+    Stops at the first jamo.
+    """
+    return _jamo_pattern().search(text) is None
 
 
 def jamo_to_hcj(data):
@@ -179,48 +528,63 @@ def jamo_to_hcj(data):
     jamo_to_hcj is the generator version of j2hcj, the string version. Passing
     a character to jamo_to_hcj will still return a generator.
     """
-    return (_jamo_char_to_hcj(_) for _ in data)
+    table = _jamo_to_hcj_table()
+    return (table.get(ord(_), _) for _ in data)
 
 
-def j2hcj(jamo):
+def j2hcj(jamo, errors=None):
     """Convert jamo into HCJ.
     Arguments may be iterables or single characters.
 
     j2hcj should convert every jamo character into HCJ in a given input, if
     possible. Anything else is unchanged.
 
+    By default, jamo with no HCJ counterpart are unchanged as well. errors
+    may be 'strict' to raise an InvalidJamoError for them, 'ignore' to drop
+    them, 'replace' to replace them with U+FFFD, or 'collect' to leave them
+    unchanged and return a (string, [JamoErrorRecord]) pair instead.
+
     j2hcj is the string version of jamo_to_hcj, the generator version.
     """
-    return ''.join(jamo_to_hcj(jamo))
-
-
-def hcj_to_jamo(hcj_char, position="vowel"):
+    if errors is None:
+        if isinstance(jamo, str):
+            return jamo.translate(_jamo_to_hcj_table())
+        return ''.join(jamo_to_hcj(jamo))
+    if not isinstance(jamo, str):
+        jamo = ''.join(jamo)
+    jamo, records = _handle_errors(errors, "No HCJ for jamo character",
+                                   _unmapped_jamo_pattern(), jamo)
+    result = jamo.translate(_jamo_to_hcj_table())
+    return (result, records) if errors == 'collect' else result
+
+
+def hcj_to_jamo(hcj_char, position="vowel", errors='strict'):
     """Convert a HCJ character to a jamo character.
     Arguments may be single characters along with the desired jamo class
     (lead, vowel, tail). Non-mappable input will raise an InvalidJamoError.
-    """
-    if position == "lead":
-        jamo_class = "CHOSEONG"
-    elif position == "vowel":
-        jamo_class = "JUNGSEONG"
-    elif position == "tail":
-        jamo_class = "JONGSEONG"
-    else:
-        raise InvalidJamoError("No mapping from input to jamo.", hcj_char)
-    jamo_name = re.sub("(?<=HANGUL )(\w+)",
-                       jamo_class,
-                       _get_unicode_name(hcj_char))
-    # TODO: add tests that test non entries.
-    if jamo_name in _JAMO_REVERSE_LOOKUP.keys():
-        return _JAMO_REVERSE_LOOKUP[jamo_name]
-    return hcj_char
-
 
-def hcj2j(hcj_char, position="vowel"):
+    errors may be 'ignore' to return '' for non-mappable input instead,
+    'replace' to return U+FFFD, or 'collect' to return a
+    (character, [JamoErrorRecord]) pair, where the character is unchanged
+    for non-mappable input.
+    """
+    tables = _hcj_to_jamo_tables()
+    if position not in tables:
+        return _handle_error(errors, "No mapping from input to jamo.",
+                             hcj_char, hcj_char, hcj_char)
+    try:
+        result = tables[position][hcj_char]
+    except KeyError:
+        return _handle_error(errors, "Not jamo or nameless jamo character",
+                             hcj_char, hcj_char, hcj_char)
+    return (result, []) if errors == 'collect' else result
+
+
+def hcj2j(hcj_char, position="vowel", errors='strict'):
     """Convert a HCJ character to a jamo character.
     Identical to hcj_to_jamo.
     """
-    return hcj_to_jamo(hcj_char, position)
+    return hcj_to_jamo(hcj_char, position, errors)
 
 
 def hangul_to_jamo(hangul_string):
@@ -233,52 +597,191 @@ def hangul_to_jamo(hangul_string):
     hangul_to_jamo is the generator version of h2j, the string version.
     """
 
+    table = _hangul_to_jamo_table()
     return (_ for _ in
-            chain.from_iterable(_hangul_char_to_jamo(_) for _ in
-                                hangul_string))
+            chain.from_iterable(table.get(ord(_), _) for _ in hangul_string))
 
 
-def h2j(hangul_string):
+def h2j(hangul_string, errors=None):
     """Convert a string of Hangul to jamo.
     Arguments may be iterables of characters.
 
     h2j should split every Hangul character into U+11xx jamo for any given
     string. Non-hangul characters are not touched.
 
+    Every Hangul character can be split, so the only invalid input is lone
+    surrogates, which is what malformed bytes decoded with
+    errors='surrogateescape' turn into. By default they are not touched
+    either. errors may be 'strict' to raise an InvalidJamoError for them,
+    'ignore' to drop them, 'replace' to replace them with U+FFFD, or
+    'collect' to leave them unchanged and return a
+    (string, [JamoErrorRecord]) pair instead.
+
     h2j is the string version of hangul_to_jamo, the generator version.
     """
 
-    return ''.join(hangul_to_jamo(hangul_string))
+    if errors is None:
+        if isinstance(hangul_string, str):
+            return hangul_string.translate(_hangul_to_jamo_table())
+        return ''.join(hangul_to_jamo(hangul_string))
+    if not isinstance(hangul_string, str):
+        hangul_string = ''.join(hangul_string)
+    hangul_string, records = _handle_errors(errors, "Lone surrogate",
+                                            _surrogate_pattern(),
+                                            hangul_string)
+    result = hangul_string.translate(_hangul_to_jamo_table())
+    return (result, records) if errors == 'collect' else result
+
+
+def h2j_with_offsets(hangul_string):
+    """Convert a string of Hangul to jamo, keeping track of where every
+    character went.
+    Arguments may be iterables of characters.
+
+    Returns (jamo, source_to_target, target_to_source). jamo is h2j of the
+    input. source_to_target is an array('I') with an entry for every input
+    character, giving the index in jamo where its output begins.
+    target_to_source is an array('I') with an entry for every jamo
+    character, giving the index of the input character it came from. Each
+    has one extra entry holding the length of the other string, so a span
+    [start, end) maps to [offsets[start], offsets[end]).
+    """
+    if not isinstance(hangul_string, str):
+        hangul_string = ''.join(hangul_string)
+    lengths = hangul_string.translate(_jamo_length_table()).encode('latin-1')
+    source_to_target, target_to_source = _offset_maps(lengths)
+    return (hangul_string.translate(_hangul_to_jamo_table()),
+            source_to_target, target_to_source)
+
+
+def hangul_to_hcj(hangul_string):
+    """Convert a string of Hangul and jamo to HCJ.
+    Arguments may be iterables of characters.
+
+    hangul_to_hcj should split every Hangul character into HCJ and convert
+    every jamo character into HCJ, if possible, in one pass. It is equivalent
+    to jamo_to_hcj(hangul_to_jamo(hangul_string)). Anything else is unchanged.
+
+    hangul_to_hcj is the generator version of h2hcj, the string version.
+    """
+    table = _hangul_to_hcj_table()
+    return (_ for _ in
+            chain.from_iterable(table.get(ord(_), _) for _ in hangul_string))
+
+
+def h2hcj(hangul_string):
+    """Convert a string of Hangul and jamo to HCJ.
+    Arguments may be iterables of characters.
+
+    h2hcj should split every Hangul character into HCJ and convert every jamo
+    character into HCJ, if possible, in one pass. It is equivalent to
+    j2hcj(h2j(hangul_string)). Anything else is unchanged.
+
+    h2hcj is the string version of hangul_to_hcj, the generator version.
+    """
+    if isinstance(hangul_string, str):
+        return hangul_string.translate(_hangul_to_hcj_table())
+    return ''.join(hangul_to_hcj(hangul_string))
+
+
+def choseong(hangul_string):
+    """Return the initial consonants (choseong) of a string of Hangul.
+    Arguments may be iterables of characters.
+
+    choseong should replace every Hangul character, and every modern U+11xx
+    lead, with the HCJ of its lead, so "가나다" becomes "ㄱㄴㄷ". Anything
+    else is unchanged, so the output is as long as the input.
+    """
+    if not isinstance(hangul_string, str):
+        hangul_string = ''.join(hangul_string)
+    return hangul_string.translate(_choseong_table())
 
 
-def jamo_to_hangul(lead, vowel, tail=''):
+def jamo_to_hangul(lead, vowel, tail='', errors='strict'):
     """Return the Hangul character for the given jamo input.
     Integers corresponding to U+11xx jamo codepoints, U+11xx jamo characters,
     or HCJ are valid inputs.
 
     Outputs a one-character Hangul string.
 
+    Input with no Hangul character raises an InvalidJamoError. errors may be
+    'ignore' to return '' instead, 'replace' to return U+FFFD, or 'collect' to
+    return a (string, [JamoErrorRecord]) pair, where the string is the input
+    jamo, unchanged, if they could not be synthesized.
+
     This function is identical to j2h.
     """
-    # Internally, we convert everything to a jamo char,
-    # then pass it to _jamo_to_hangul_char
-    lead = hcj_to_jamo(lead, "lead")
-    vowel = hcj_to_jamo(vowel, "vowel")
-    if not tail or ord(tail) == 0:
-        tail = None
-    elif is_hcj(tail):
-        tail = hcj_to_jamo(tail, "tail")
-    if (is_jamo(lead) and get_jamo_class(lead) == "lead") and\
-       (is_jamo(vowel) and get_jamo_class(vowel) == "vowel") and\
-       ((not tail) or (is_jamo(tail) and get_jamo_class(tail) == "tail")):
-        result = _jamo_to_hangul_char(lead, vowel, tail)
-        if is_hangul_char(result):
-            return result
-    raise InvalidJamoError("Could not synthesize characters to Hangul.",
-                           '\x00')
-
-
-def j2h(lead, vowel, tail=0):
+    # Each argument maps straight to its share of the Hangul codepoint.
+    leads, vowels, tails = _composition_codes()
+    try:
+        result = chr(leads[lead] + vowels[vowel] + tails[tail])
+    except (KeyError, TypeError):
+        unchanged = ''.join(_ for _ in (lead, vowel, tail)
+                            if isinstance(_, str))
+        return _handle_error(errors,
+                             "Could not synthesize characters to Hangul.",
+                             '\x00', (lead, vowel, tail), unchanged)
+    return (result, []) if errors == 'collect' else result
+
+
+def jamo_to_hangul_many(leads, vowels, tails=None, errors='strict'):
+    """Return a string of Hangul characters for the given sequences of jamo.
+    Arguments may be iterables (including strings) of the characters accepted
+    by jamo_to_hangul. Missing tails may be given as '', None, or '\\x00',
+    and omitting tails altogether composes open syllables only.
+
+    jamo_to_hangul_many(leads, vowels, tails) is equivalent to joining
+    jamo_to_hangul(*_) for _ in zip(leads, vowels, tails), but composes every
+    triple without a Python-level loop. errors applies to each triple as in
+    jamo_to_hangul; with 'collect', the JamoErrorRecord positions are indices
+    of triples. With 'strict', the InvalidJamoError gives the index of the
+    first invalid triple. An unknown errors mode raises ValueError even if
+    every triple is valid.
+    """
+    if errors not in _ERROR_MODES:
+        raise ValueError("Unknown errors mode: {!r}".format(errors))
+    # Keep the input around to find or retry invalid triples.
+    leads, vowels, tails = [
+        _ if _ is None or isinstance(_, (str, list, tuple)) else list(_)
+        for _ in (leads, vowels, tails)]
+    lead_codes, vowel_codes, tail_codes = _composition_codes()
+    codes = map(add, map(lead_codes.__getitem__, leads),
+                map(vowel_codes.__getitem__, vowels))
+    if tails is not None:
+        codes = map(add, codes, map(tail_codes.__getitem__, tails))
+    try:
+        result = ''.join(map(chr, codes))
+    except (KeyError, TypeError):
+        if errors == 'strict':
+            _, records = _jamo_to_hangul_each(leads, vowels, tails, 'collect')
+            raise InvalidJamoError(
+                "Could not synthesize the characters at index {} to "
+                "Hangul.".format(records[0].position), '\x00')
+        return _jamo_to_hangul_each(leads, vowels, tails, errors)
+    return (result, []) if errors == 'collect' else result
+
+
+def _jamo_to_hangul_each(leads, vowels, tails, errors):
+    """Compose triples one at a time, handling invalid ones according to an
+    errors mode other than 'strict'.
+    """
+    if tails is None:
+        tails = [None] * len(leads)
+    pieces, records = [], []
+    for position, triple in enumerate(zip(leads, vowels, tails)):
+        piece, errors_found = jamo_to_hangul(*triple, errors='collect')
+        if errors_found:
+            piece = _handle_error(errors, errors_found[0].reason, '\x00',
+                                  triple, piece)
+            if errors == 'collect':
+                piece = piece[0]
+                records.append(errors_found[0]._replace(position=position))
+        pieces.append(piece)
+    result = ''.join(pieces)
+    return (result, records) if errors == 'collect' else result
+
+
+def j2h(lead, vowel, tail=0, errors='strict'):
     """Arguments may be integers corresponding to the U+11xx codepoints, the
     actual U+11xx jamo characters, or HCJ.
 
@@ -288,10 +791,138 @@ def j2h(lead, vowel, tail=0):
     jamo_to_hangul.
     """
 
-    return jamo_to_hangul(lead, vowel, tail)
+    return jamo_to_hangul(lead, vowel, tail, errors)
+
+
+def _synth_syllable(match):
+    return _jamo_to_hangul_table()[match.group()]
+
+
+def _split_incomplete_syllable(string):
+    """Split a string into the part that can be composed now and the
+    trailing lead, or lead and vowel, that may still become part of a
+    syllable once more jamo arrive.
+    """
+    length = 0
+    if string[-1:] and 0x1100 <= ord(string[-1]) <= 0x1112:
+        length = 1
+    elif string[-2:-1] and 0x1100 <= ord(string[-2]) <= 0x1112 and\
+            0x1161 <= ord(string[-1]) <= 0x1175:
+        length = 2
+    split = len(string) - length
+    return string[:split], string[split:]
+
+
+def synthesize_hangul(chunks):
+    """Compose U+11xx jamo into Hangul characters.
+    Arguments may be iterables of strings of any length, including single
+    characters.
+
+    synthesize_hangul should combine every modern lead and vowel, along with
+    an optional modern tail, into a Hangul character. Jamo that cannot be
+    composed and non-jamo characters are unchanged. Syllables split across
+    chunks are composed as if the input were one string.
+
+    synthesize_hangul is the generator version of synth_hangul, the string
+    version. It yields strings rather than single characters.
+    """
+    pending = ''
+    for chunk in chunks:
+        ready, pending = _split_incomplete_syllable(pending + chunk)
+        if ready:
+            yield synth_hangul(ready)
+    if pending:
+        yield synth_hangul(pending)
 
 
 def synth_hangul(string):
-    """Convert jamo characters in a string into hcj as much as possible."""
-    raise NotImplementedError
-    return ''.join([''.join(''.join(jamo_to_hcj(_)) for _ in string)])
+    """Compose U+11xx jamo into Hangul characters.
+    Arguments may be iterables of characters.
+
+    synth_hangul should combine every modern lead and vowel, along with an
+    optional modern tail, into a Hangul character. Jamo that cannot be
+    composed and non-jamo characters are unchanged, so synth_hangul undoes
+    h2j.
+
+    synth_hangul is the string version of synthesize_hangul, the generator
+    version.
+    """
+    if not isinstance(string, str):
+        string = ''.join(string)
+    return _syllable_pattern().sub(_synth_syllable, string)
+
+
+def _transcode_utf8(func, data):
+    """Apply a string conversion to UTF-8 bytes by decoding them, converting
+    the string, and encoding the result, so it costs as much as doing that
+    by hand. Malformed bytes become lone surrogates, which no conversion
+    touches, and then the same bytes again.
+    """
+    if isinstance(data, bytes) and data.isascii():
+        return data
+    text = str(data, 'utf-8', 'surrogateescape')
+    if text.isascii():
+        return bytes(data)
+    return func(text).encode('utf-8', 'surrogateescape')
+
+
+def h2j_bytes(data):
+    """Convert UTF-8 Hangul to UTF-8 jamo, as h2j does.
+    Arguments may be bytes, bytearray, or memoryview; returns bytes.
+
+    Anything other than Hangul characters is unchanged, down to the byte,
+    including malformed UTF-8.
+    """
+    return _transcode_utf8(h2j, data)
+
+
+def j2hcj_bytes(data):
+    """Convert UTF-8 jamo to UTF-8 HCJ, as j2hcj does.
+    Arguments may be bytes, bytearray, or memoryview; returns bytes.
+
+    Anything other than jamo with an HCJ counterpart is unchanged, down to
+    the byte, including malformed UTF-8.
+    """
+    return _transcode_utf8(j2hcj, data)
+
+
+def synth_bytes(data):
+    """Compose UTF-8 jamo into UTF-8 Hangul, as synth_hangul does.
+    Arguments may be bytes, bytearray, or memoryview; returns bytes.
+
+    Anything other than composable jamo is unchanged, down to the byte,
+    including malformed UTF-8.
+    """
+    return _transcode_utf8(synth_hangul, data)
+
+
+def synth_hangul_with_offsets(string):
+    """Compose U+11xx jamo into Hangul characters, keeping track of where
+    every character went. The inverse of h2j_with_offsets.
+    Arguments may be iterables of characters.
+
+    Returns (hangul, source_to_target, target_to_source). hangul is
+    synth_hangul of the input. source_to_target is an array('I') with an
+    entry for every input character, giving the index in hangul of the
+    character it became part of. target_to_source is an array('I') with an
+    entry for every Hangul character, giving the index of the first input
+    character it was composed from. Each has one extra entry holding the
+    length of the other string.
+    """
+    if not isinstance(string, str):
+        string = ''.join(string)
+    table = _jamo_to_hangul_table()
+    pieces = []
+    lengths = bytearray()
+    last = 0
+    for match in _syllable_pattern().finditer(string):
+        start, end = match.span()
+        pieces.append(string[last:start])
+        pieces.append(table[match.group()])
+        lengths += b'\x01' * (start - last)
+        lengths.append(end - start)
+        last = end
+    pieces.append(string[last:])
+    lengths += b'\x01' * (len(string) - last)
+    target_to_source, source_to_target = _offset_maps(lengths)
+    return ''.join(pieces), source_to_target, target_to_source
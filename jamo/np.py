@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Hangul decomposition and synthesis over NumPy arrays of codepoints.
+
+This module requires NumPy. Every function works on whole arrays at once,
+using the same syllable arithmetic as _hangul_char_to_jamo and
+_jamo_to_hangul_char, so there is no Python-level loop per character.
+"""
+
+import numpy as np
+
+from .jamo import (_JAMO_OFFSET, _JAMO_LEAD_OFFSET, _JAMO_VOWEL_OFFSET,
+                   _JAMO_TAIL_OFFSET)
+
+
+def _as_codepoints(codepoints):
+    """Return codepoints as a one-dimensional uint32 array.
+    Strings are accepted for convenience.
+    """
+    if isinstance(codepoints, str):
+        return np.frombuffer(codepoints.encode('utf-32-le'), dtype='<u4')
+    return np.asarray(codepoints, dtype=np.uint32).ravel()
+
+
+def to_str(codepoints):
+    """Return the string for an array of codepoints."""
+    return np.ascontiguousarray(codepoints, dtype='<u4').tobytes()\
+        .decode('utf-32-le')
+
+
+def decompose(codepoints):
+    """Split every Hangul codepoint into U+11xx jamo codepoints.
+    Arguments may be arrays or sequences of integers, or strings.
+
+    Returns a (codepoints, offsets) pair. codepoints is a new uint32 array in
+    which every Hangul character is replaced by its lead, vowel, and optional
+    tail; anything else is unchanged. offsets has one more entry than the
+    input, and input character i became codepoints[offsets[i]:offsets[i + 1]].
+
+    decompose is the array version of h2j.
+    """
+    source = _as_codepoints(codepoints)
+    # Non-Hangul codepoints wrap around to large unsigned values.
+    rem = source - np.uint32(_JAMO_OFFSET)
+    syllables = np.flatnonzero(rem < 11172)
+    rem = rem[syllables]
+    tail = rem % 28
+
+    lengths = np.ones(len(source), dtype=np.int64)
+    lengths[syllables] = 2 + (tail > 0)
+    offsets = np.zeros(len(source) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    starts = offsets[syllables]
+    result = np.empty(offsets[-1], dtype=np.uint32)
+    result[offsets[:-1]] = source
+    result[starts] = 1 + rem // 588 + _JAMO_LEAD_OFFSET
+    result[starts + 1] = 1 + (rem % 588) // 28 + _JAMO_VOWEL_OFFSET
+    has_tail = tail > 0
+    result[starts[has_tail] + 2] = tail[has_tail] + _JAMO_TAIL_OFFSET
+    return result, offsets
+
+
+def compose(codepoints):
+    """Combine every modern lead and vowel, along with an optional modern
+    tail, into a Hangul codepoint.
+    Arguments may be arrays or sequences of integers, or strings.
+
+    Returns a (codepoints, offsets) pair. codepoints is a new uint32 array in
+    which jamo that cannot be composed and non-jamo are unchanged. offsets has
+    one more entry than the output, and output character j was composed from
+    the input codepoints[offsets[j]:offsets[j + 1]], so compose inverts the
+    offsets returned by decompose.
+
+    compose is the array version of synth_hangul.
+    """
+    source = _as_codepoints(codepoints)
+    is_lead = (source >= 0x1100) & (source <= 0x1112)
+    is_vowel = (source >= 0x1161) & (source <= 0x1175)
+    is_tail = (source >= 0x11A8) & (source <= 0x11C2)
+
+    # Lead, vowel, and tail classes are disjoint, so syllables never overlap.
+    start = np.zeros(len(source), dtype=bool)
+    start[:-1] = is_lead[:-1] & is_vowel[1:]
+    with_tail = np.zeros(len(source), dtype=bool)
+    with_tail[:-2] = start[:-2] & is_tail[2:]
+    consumed = np.zeros(len(source), dtype=bool)
+    consumed[1:] = start[:-1]
+    consumed[2:] |= with_tail[:-2]
+
+    kept = np.flatnonzero(~consumed)
+    result = source[kept]
+    syllables = np.flatnonzero(start[kept])
+    leads = kept[syllables]
+    tails = np.where(with_tail[leads],
+                     source[np.minimum(leads + 2, len(source) - 1)]
+                     .astype(np.int64) - _JAMO_TAIL_OFFSET, 0)
+    lead = source[leads].astype(np.int64) - _JAMO_LEAD_OFFSET - 1
+    vowel = source[leads + 1].astype(np.int64) - _JAMO_VOWEL_OFFSET - 1
+    result[syllables] = lead * 588 + vowel * 28 + tails + _JAMO_OFFSET
+    offsets = np.append(kept, len(source)).astype(np.int64)
+    return result, offsets
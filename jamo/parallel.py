@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Multiprocess conversion of large files between Hangul, jamo, and HCJ.
+
+Input files are split into shards of whole lines, each shard is converted
+in a worker process, and the results are written out in input order. Lines
+never split a syllable or a multi-byte character, so the output is exactly
+what converting each file in one piece would produce.
+
+Encodings must encode a newline as the single byte 0x0A, as UTF-8 and
+other ASCII-compatible encodings do, so that a newline byte always ends a
+line; UTF-16 and encodings that write a byte order mark are rejected.
+"""
+
+import os
+from collections import deque
+from multiprocessing import Pool
+
+from .stream import convert_chunks
+
+DEFAULT_SHARD_SIZE = 1 << 24
+# Shards submitted to the pool per worker and not yet written out, so that
+# memory stays bounded however slowly the destination takes the results.
+_SHARDS_PER_WORKER = 2
+
+
+def _check_arguments(shard_size, encoding):
+    """Raise ValueError unless files can be split into shards of shard_size
+    bytes in encoding, and LookupError if encoding is unknown.
+    """
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive, not {}".format(
+            shard_size))
+    if '\n'.encode(encoding) != b'\n':
+        raise ValueError("{} does not encode a newline as the single "
+                         "byte 0x0A, so files in it cannot be split "
+                         "into shards".format(encoding))
+
+
+def _shards(path, shard_size):
+    """Return (start, end) byte ranges covering a file, each ending just
+    after a newline or at the end of the file.
+    """
+    size = os.path.getsize(path)
+    shards = []
+    with open(path, 'rb') as fin:
+        start = 0
+        while start < size:
+            end = start + shard_size
+            if end >= size:
+                end = size
+            else:
+                fin.seek(end)
+                end += len(fin.readline())
+            shards.append((start, end))
+            start = end
+    return shards
+
+
+def _convert_shard(task):
+    """Convert one shard of a file; run in a worker process."""
+    path, start, end, to, encoding, errors = task
+    with open(path, 'rb') as fin:
+        fin.seek(start)
+        data = fin.read(end - start)
+    text = data.decode(encoding, errors)
+    return ''.join(convert_chunks([text], to)).encode(encoding, errors)
+
+
+def _tasks(sources, to, shard_size, encoding, errors):
+    for path in sources:
+        for start, end in _shards(path, shard_size):
+            yield path, start, end, to, encoding, errors
+
+
+def convert_files(sources, destination, to="jamo", processes=None,
+                  shard_size=DEFAULT_SHARD_SIZE, encoding='utf-8',
+                  errors='strict'):
+    """Convert files into the given form ("hangul", "jamo", or "hcj") with a
+    pool of worker processes, writing them one after another to destination.
+    destination may be a path or a binary file object.
+
+    processes defaults to the number of CPUs; with processes=1, files are
+    converted in this process. shard_size is the approximate number of bytes
+    given to a worker at a time; at most two shards per worker are held in
+    memory at once. Returns the number of bytes read.
+
+    Raises ValueError if shard_size is not positive or encoding does not
+    encode a newline as the single byte 0x0A.
+    """
+    _check_arguments(shard_size, encoding)
+    tasks = _tasks(sources, to, shard_size, encoding, errors)
+    if isinstance(destination, (str, bytes, os.PathLike)):
+        with open(destination, 'wb') as fout:
+            return _write_results(tasks, fout, processes)
+    return _write_results(tasks, destination, processes)
+
+
+def _bounded_map(pool, func, tasks, window):
+    """Yield (task, func(task)) in order, computed in pool, with at most
+    window tasks submitted but not yet yielded.
+    """
+    running = deque()
+    for task in tasks:
+        if len(running) >= window:
+            done, result = running.popleft()
+            yield done, result.get()
+        running.append((task, pool.apply_async(func, (task,))))
+    while running:
+        done, result = running.popleft()
+        yield done, result.get()
+
+
+def _write_results(tasks, fout, processes):
+    size = 0
+    if processes == 1:
+        for task in tasks:
+            fout.write(_convert_shard(task))
+            size += task[2] - task[1]
+        return size
+    window = _SHARDS_PER_WORKER * (processes or os.cpu_count() or 1)
+    with Pool(processes) as pool:
+        for task, result in _bounded_map(pool, _convert_shard, tasks,
+                                         window):
+            fout.write(result)
+            size += task[2] - task[1]
+    return size
+
+
+def convert_file(source, destination, to="jamo", processes=None,
+                 shard_size=DEFAULT_SHARD_SIZE, encoding='utf-8',
+                 errors='strict'):
+    """Convert one file with a pool of worker processes, as convert_files."""
+    return convert_files([source], destination, to, processes, shard_size,
+                         encoding, errors)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Chunked conversion of text streams between Hangul, jamo, and HCJ.
+
+Streams are converted a fixed number of characters at a time, so memory use
+does not grow with the size of the input.
+"""
+
+from .jamo import h2j, h2hcj, synthesize_hangul
+
+# Output forms, by name: precomposed Hangul, U+11xx jamo, and HCJ.
+FORMS = ("hangul", "jamo", "hcj")
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def convert_chunks(chunks, to="jamo"):
+    """Convert an iterable of strings into the given form.
+    Returns an iterator of converted strings.
+
+    Converting to "jamo" or "hcj" splits Hangul characters with h2j or
+    h2hcj. Converting to "hangul" composes U+11xx jamo with
+    synthesize_hangul, so syllables split across chunks are still composed.
+    """
+    if to == "jamo":
+        return map(h2j, chunks)
+    if to == "hcj":
+        return map(h2hcj, chunks)
+    if to == "hangul":
+        return synthesize_hangul(chunks)
+    raise ValueError("Unknown form {!r}; expected one of {}".format(
+        to, ", ".join(FORMS)))
+
+
+def _check_chunk_size(chunk_size):
+    """Raise ValueError unless chunk_size is positive."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive, not {}".format(
+            chunk_size))
+
+
+def _read_chunks(fin, chunk_size):
+    while True:
+        chunk = fin.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_chunks(fin, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield strings of at most chunk_size characters from a text file.
+    Raises ValueError if chunk_size is not positive.
+    """
+    _check_chunk_size(chunk_size)
+    return _read_chunks(fin, chunk_size)
+
+
+def transcode(fin, fout, to="jamo", chunk_size=DEFAULT_CHUNK_SIZE):
+    """Convert a text file into the given form, writing to another text file.
+    Returns the number of characters read. Raises ValueError if chunk_size
+    is not positive.
+    """
+    _check_chunk_size(chunk_size)
+    count = 0
+
+    def counted(chunks):
+        nonlocal count
+        for chunk in chunks:
+            count += len(chunk)
+            yield chunk
+
+    for chunk in convert_chunks(counted(read_chunks(fin, chunk_size)), to):
+        fout.write(chunk)
+    return count
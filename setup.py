@@ -3,8 +3,8 @@ from setuptools import setup, find_packages
 from jamo import __version__
 import sys
 
-if sys.version_info <= (3, 0):
-    print("ERROR: jamo requires Python 3.0 or later "
+if sys.version_info < (3, 8):
+    print("ERROR: jamo requires Python 3.8 or later "
           "(bleeding edge preferred)", file=sys.stderr)
     sys.exit(1)
 
@@ -23,12 +23,23 @@ setup(
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.2",
-        "Programming Language :: Python :: 3.3",
-        "Programming Language :: Python :: 3.4",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
     ],
+    python_requires='>=3.8',
     keywords="Korean Hangul jamo syllable nlp",
     packages=find_packages(),
     package_dir={'jamo': 'jamo'},
     package_data={'jamo': ['data/*.json']},
+    entry_points={
+        'console_scripts': ['jamo = jamo.__main__:main'],
+    },
+    extras_require={
+        'numpy': ['numpy'],
+        'arrow': ['numpy', 'pyarrow'],
+        'pandas': ['numpy', 'pyarrow', 'pandas'],
+    },
 )
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for asynchronous stream conversion.
+"""
+import unittest
+import jamo
+import jamo.aio
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+_TEXT = "자모=字母, Do you speak 한국어?\n한글을 합성합니다. ᄀᄁᄂᄃᇹᇫ\n"
+
+
+async def _stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(chunks):
+    return ''.join([_ async for _ in chunks])
+
+
+def _split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestAio(unittest.TestCase):
+    def test_convert(self):
+        """Conversion should not depend on where the input is split, in
+        characters or in bytes.
+        """
+        targets = {"jamo": jamo.h2j(_TEXT),
+                   "hcj": jamo.h2hcj(_TEXT),
+                   "hangul": jamo.synth_hangul(jamo.h2j(_TEXT))}
+        for to, target in targets.items():
+            source = jamo.h2j(_TEXT) if to == "hangul" else _TEXT
+            for size in (1, 2, 3, 5, len(source)):
+                for data in (source, source.encode('utf-8')):
+                    trial = asyncio.run(_collect(jamo.aio.convert(
+                        _stream(_split(data, size)), to)))
+                    assert trial == target,\
+                        ("Converted chunks of size {size} of {kind} to {to} "
+                         "as {trial}.").format(size=size, to=to, trial=trial,
+                                               kind=type(data).__name__)
+        try:
+            jamo.aio.convert(_stream([_TEXT]), "latin")
+            assert False, "Accepted an unknown form."
+        except ValueError:
+            pass
+
+    def test_encoding(self):
+        """compose should decode bytes with the given encoding."""
+        data = jamo.h2j(_TEXT).encode('utf-16-le')
+        trial = asyncio.run(_collect(jamo.aio.compose(
+            _stream(_split(data, 3)), encoding='utf-16-le')))
+        assert trial == jamo.synth_hangul(jamo.h2j(_TEXT)),\
+            "compose didn't decode with the given encoding."
+
+    def test_offload(self):
+        """Large chunks should convert the same in an executor."""
+        chunks = _split(jamo.h2j(_TEXT) * 10, 7)
+
+        async def run():
+            with ThreadPoolExecutor(1) as executor:
+                return await _collect(jamo.aio.compose(
+                    _stream(chunks), executor=executor, offload_size=5))
+
+        assert asyncio.run(run()) == jamo.synth_hangul(''.join(chunks)),\
+            "compose failed with offloading."
+
+    def test_yields_control(self):
+        """Other tasks should run between chunks."""
+        async def run():
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            before = len(ticks)
+            await _collect(jamo.aio.decompose(_stream([_TEXT] * 20)))
+            task.cancel()
+            return len(ticks) - before
+
+        assert asyncio.run(run()) >= 20,\
+            "decompose didn't yield to the event loop between chunks."
+
+
+if __name__ == "__main__":
+    unittest.main()
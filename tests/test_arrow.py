@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the Arrow and pandas integration.
+"""
+import unittest
+import jamo
+
+try:
+    import pyarrow as pa
+    import jamo.arrow
+except ImportError:
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+_ROWS = ["자모=字母", None, "", "Do you speak 한국어?", "한글 ᄀᄁᄂᄃᇹᇫ ㄱㆎ",
+         "\U0001f600밥", "값", "가", "abc"]
+_BATCHIM = [None, None, None, None, None, True, True, False, None]
+_FUNCTIONS = ["h2j", "j2hcj", "h2hcj", "choseong"]
+
+
+def _expected(name, rows):
+    func = getattr(jamo, name)
+    if name == "j2hcj":
+        rows = [None if _ is None else jamo.h2j(_) for _ in rows]
+    return rows, [None if _ is None else func(_) for _ in rows]
+
+
+@unittest.skipIf(pa is None, "PyArrow is not installed")
+class TestArrow(unittest.TestCase):
+    def test_convert(self):
+        """Converting an array should match converting every row."""
+        for name in _FUNCTIONS:
+            rows, target = _expected(name, _ROWS)
+            for type in (pa.string(), pa.large_string()):
+                array = pa.array(rows, type=type)
+                for trial_array, trial_target in (
+                        (array, target), (array.slice(3, 4), target[3:7])):
+                    trial = getattr(jamo.arrow, name)(trial_array)
+                    assert trial.type == type and\
+                        trial.to_pylist() == trial_target,\
+                        "{} of {} gave {}.".format(name, trial_array, trial)
+            trial = getattr(jamo.arrow, name)(rows)
+            assert trial.to_pylist() == target,\
+                "{} didn't accept a list.".format(name)
+
+    def test_chunked(self):
+        rows, target = _expected("h2j", _ROWS)
+        chunked = pa.chunked_array([rows[:4], rows[4:], []], type=pa.string())
+        trial = jamo.arrow.h2j(chunked)
+        assert isinstance(trial, pa.ChunkedArray) and\
+            trial.to_pylist() == target,\
+            "h2j of a chunked array gave {}.".format(trial)
+        assert jamo.arrow.has_batchim(chunked).to_pylist() == _BATCHIM,\
+            "has_batchim of a chunked array failed."
+
+    def test_has_batchim(self):
+        trial = jamo.arrow.has_batchim(pa.array(_ROWS))
+        assert trial.type == pa.bool_() and trial.to_pylist() == _BATCHIM,\
+            "has_batchim gave {}.".format(trial)
+
+    def test_errors(self):
+        try:
+            jamo.arrow.h2j(pa.array([1, 2]))
+            assert False, "h2j accepted integers."
+        except TypeError:
+            pass
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_accessor(self):
+        """The .jamo accessor should keep the index and name."""
+        series = pd.Series(_ROWS, index=range(10, 10 + len(_ROWS)),
+                           name="text")
+        for name in _FUNCTIONS + ["has_batchim"]:
+            if name == "has_batchim":
+                target = _BATCHIM
+                source = series
+            else:
+                rows, target = _expected(name, _ROWS)
+                source = pd.Series(rows, index=series.index, name="text")
+            trial = getattr(source.jamo, name)()
+            assert list(trial.index) == list(series.index) and\
+                trial.name == "text",\
+                "{} lost the index or name.".format(name)
+            assert [None if pd.isna(_) else _ for _ in trial] == target,\
+                "{} gave {}.".format(name, list(trial))
+
+
+if __name__ == "__main__":
+    unittest.main()
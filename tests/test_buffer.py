@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for JamoBuffer.
+"""
+import unittest
+import jamo
+import pickle
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Texts needing one, two, and four bytes per character.
+_TEXTS = ["", "Do you speak 한국어? ㅋㅋ", "한글 ᄀᄁᄂᄃᇹᇫ ㄱㆎ 字母 é",
+          "\U0001f600 한국어 \udc80"]
+
+
+class TestBuffer(unittest.TestCase):
+    def test_sequence(self):
+        """A JamoBuffer should behave as its decomposed string."""
+        for text, itemsize in zip(_TEXTS, (1, 1, 2, 4)):
+            target = jamo.h2j(text)
+            buffer = jamo.JamoBuffer(text)
+            assert buffer.codes.itemsize == itemsize,\
+                "{} took {} bytes per character.".format(
+                    text, buffer.codes.itemsize)
+            assert str(buffer) == target and len(buffer) == len(target),\
+                "{} didn't come back as {}.".format(buffer, target)
+            assert list(buffer) == list(target),\
+                "Iterating {} failed.".format(text)
+            for index in range(-len(target), len(target)):
+                assert buffer[index] == target[index],\
+                    "Indexing {} at {} failed.".format(text, index)
+            for key in (slice(2, 9), slice(None, None, -2), slice(5, 1)):
+                assert str(buffer[key]) == target[key],\
+                    "Slicing {} with {} failed.".format(text, key)
+            assert buffer.to_hcj() == jamo.j2hcj(target),\
+                "to_hcj failed for {}.".format(text)
+            assert buffer.to_hangul() == jamo.synth_hangul(target),\
+                "to_hangul failed for {}.".format(text)
+            assert pickle.loads(pickle.dumps(buffer)) == buffer,\
+                "Pickling {} failed.".format(text)
+        assert jamo.JamoBuffer("한국어") == jamo.JamoBuffer(jamo.h2j("한국어")),\
+            "Decomposed and precomposed text packed differently."
+
+    def test_from_texts(self):
+        """from_texts should pack texts one after another, with offsets
+        that slice each one back out.
+        """
+        buffer, offsets = jamo.JamoBuffer.from_texts(iter(_TEXTS * 3000))
+        assert len(offsets) == len(_TEXTS) * 3000 + 1,\
+            "from_texts returned the wrong number of offsets."
+        for number in (0, 1, 2, 3, 9998, 11999):
+            text = _TEXTS[number % len(_TEXTS)]
+            assert str(buffer[offsets[number]:offsets[number + 1]]) ==\
+                jamo.h2j(text), "from_texts lost {}.".format(text)
+
+    def test_from_codes(self):
+        """from_codes should share the codes of another buffer and reject
+        buffers it cannot view as one row of codes.
+        """
+        buffer = jamo.JamoBuffer(_TEXTS[1])
+        trial = jamo.JamoBuffer.from_codes(buffer.codes)
+        assert trial == buffer, "from_codes didn't restore the buffer."
+        try:
+            jamo.JamoBuffer.from_codes(memoryview(buffer.codes)[::2])
+            assert False, "from_codes accepted a non-contiguous buffer."
+        except ValueError:
+            pass
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        """Codes should pass to and from NumPy without copies."""
+        buffer = jamo.JamoBuffer(_TEXTS[1])
+        codes = numpy.asarray(buffer)
+        assert codes.dtype == numpy.uint8 and len(codes) == len(buffer),\
+            "numpy.asarray gave {}.".format(codes)
+        assert numpy.shares_memory(codes, numpy.asarray(buffer.codes)),\
+            "numpy.asarray copied the codes."
+        assert not numpy.shares_memory(buffer.__array__(copy=True), codes),\
+            "copy=True didn't copy the codes."
+        assert numpy.shares_memory(buffer.__array__(numpy.uint8, copy=False),
+                                   codes), "copy=False copied the codes."
+        converted = buffer.__array__(numpy.uint32)
+        assert converted.dtype == numpy.uint32 and\
+            list(converted) == list(codes), "dtype didn't convert the codes."
+        try:
+            buffer.__array__(numpy.uint32, copy=False)
+            assert False, "copy=False converted the codes with a copy."
+        except ValueError:
+            pass
+        trial = jamo.JamoBuffer.from_codes(codes.astype(numpy.uint32))
+        assert trial == buffer and str(trial) == str(buffer),\
+            "from_codes didn't restore the buffer."
+        try:
+            jamo.JamoBuffer.from_codes(codes.astype(numpy.int64))
+            assert False, "from_codes accepted 64-bit integers."
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for JamoCache.
+"""
+import unittest
+import jamo
+import sys
+import threading
+from jamo.cache import _entry_size
+
+
+_TOKENS = "한국어 를 배우는 한국어 학생 의 한국어 ㅋㅋ abc 학생".split()
+
+
+class TestCache(unittest.TestCase):
+    def test_convert(self):
+        """Cached conversions should match the uncached ones."""
+        for func in (jamo.h2j, jamo.h2hcj, jamo.choseong):
+            cache = jamo.JamoCache(func)
+            target = [func(_) for _ in _TOKENS]
+            assert cache.convert_many(_TOKENS) == target,\
+                "convert_many didn't match {}.".format(func.__name__)
+            assert [cache(_) for _ in _TOKENS] == target,\
+                "Calling the cache didn't match {}.".format(func.__name__)
+        info = cache.info()
+        distinct = len(set(_TOKENS))
+        assert (info.hits, info.misses, info.evictions, info.size) ==\
+            (2 * len(_TOKENS) - distinct, distinct, 0, distinct),\
+            "Wrong statistics {}.".format(info)
+        assert cache.hit_rate() == info.hits / (2 * len(_TOKENS)),\
+            "Wrong hit rate."
+        cache.clear()
+        assert len(cache) == 0 and cache.info().hits == 0,\
+            "clear didn't empty the cache."
+
+    def test_eviction(self):
+        """The least recently used tokens should go first."""
+        cache = jamo.JamoCache(maxsize=2)
+        cache.convert_many(["가", "나", "가", "다"])
+        assert "가" in cache and "다" in cache and "나" not in cache,\
+            "Evicted the wrong token."
+        assert cache.evictions == 1, "Didn't count the eviction."
+        size = _entry_size("가", jamo.h2j("가"))
+        cache = jamo.JamoCache(maxsize=None, max_bytes=3 * size)
+        cache.convert_many(["가", "나", "다", "라", "마"])
+        assert len(cache) == 3 and cache.bytes <= 3 * size,\
+            "Exceeded max_bytes."
+        assert cache.bytes == sum(_entry_size(_, jamo.h2j(_))
+                                  for _ in "다라마"),\
+            "Lost track of the cache size."
+
+    def test_threads(self):
+        """Concurrent lookups should keep the statistics consistent."""
+        cache = jamo.JamoCache(maxsize=5)
+        tokens = _TOKENS * 200
+        results = []
+
+        def work():
+            results.append(cache.convert_many(tokens))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        target = [jamo.h2j(_) for _ in tokens]
+        assert all(_ == target for _ in results),\
+            "Threads got wrong conversions."
+        info = cache.info()
+        assert info.hits + info.misses == 4 * len(tokens),\
+            "Lookups went uncounted."
+        # Threads may convert the same token at once; only one result is
+        # kept, so there may be more misses than entries added.
+        assert info.misses - info.evictions >= info.size == len(cache),\
+            "Evictions went uncounted."
+
+    def test_miss_outside_lock(self):
+        """A slow conversion should not hold up lookups in other threads."""
+        started, release = threading.Event(), threading.Event()
+        released = []
+
+        def slow(token):
+            if token == "느림":
+                started.set()
+                released.append(release.wait(5))
+            return jamo.h2j(token)
+
+        cache = jamo.JamoCache(slow)
+        cache("가")
+        thread = threading.Thread(target=cache, args=("느림",))
+        thread.start()
+        started.wait(5)
+        assert cache("가") == jamo.h2j("가") and\
+            cache.convert_many(["가"]) == [jamo.h2j("가")],\
+            "Lookups returned the wrong conversion."
+        release.set()
+        thread.join()
+        assert released == [True], "A miss held the lock while converting."
+        assert "느림" in cache, "Didn't remember the slow conversion."
+
+
+if __name__ == "__main__":
+    unittest.main()
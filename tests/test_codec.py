@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the "<encoding>-jamo" codecs.
+"""
+import unittest
+import jamo
+import codecs
+import io
+import os
+import tempfile
+
+
+_TEXT = "자모=字母, Do you speak 한국어?\n한글을 합성합니다. ᄀᄁᄂᄃᇹᇫ\n"
+
+
+class TestCodec(unittest.TestCase):
+    def test_lookup(self):
+        """Any text encoding should have a -jamo codec."""
+        for name, target in (("utf-8-jamo", "utf-8-jamo"),
+                             ("UTF_8_JAMO", "utf-8-jamo"),
+                             ("utf-16-jamo", "utf-16-jamo"),
+                             ("cp949-jamo", "cp949-jamo")):
+            trial = codecs.lookup(name).name
+            assert trial == target,\
+                "Looked up {} as {}, not {}.".format(name, trial, target)
+        for name in ("nonexistent-jamo", "base64-jamo"):
+            try:
+                codecs.lookup(name)
+                assert False, "Looked up {}.".format(name)
+            except LookupError:
+                pass
+
+    def test_encode_decode(self):
+        """Decoding should decompose and encoding should compose."""
+        for encoding in ("utf-8", "utf-16", "cp949"):
+            data = _TEXT.encode(encoding, 'ignore')
+            text = data.decode(encoding)
+            trial = data.decode(encoding + "-jamo")
+            assert trial == jamo.h2j(text),\
+                "Decoding {} didn't decompose Hangul.".format(encoding)
+            trial = jamo.h2j(text).encode(encoding + "-jamo")
+            assert trial == jamo.synth_hangul(jamo.h2j(text)).encode(
+                encoding), "Encoding {} didn't compose jamo.".format(encoding)
+
+    def test_incremental(self):
+        """Syllables and characters split across chunks should convert as
+        if the input were one piece.
+        """
+        source = jamo.h2j(_TEXT)
+        target = jamo.synth_hangul(source).encode('utf-8')
+        for size in (1, 2, 3, 5):
+            chunks = [source[i:i + size] for i in range(0, len(source), size)]
+            trial = b''.join(codecs.iterencode(chunks, "utf-8-jamo"))
+            assert trial == target,\
+                "Encoded chunks of size {} as {}.".format(size, trial)
+            chunks = [target[i:i + size] for i in range(0, len(target), size)]
+            trial = ''.join(codecs.iterdecode(chunks, "utf-8-jamo"))
+            assert trial == source,\
+                "Decoded chunks of size {} as {}.".format(size, trial)
+        trial = b''.join(codecs.iterencode(["\u1100", "\u1161\u11a8"],
+                                           "utf-8-jamo"))
+        assert trial.decode('utf-8') == "각",\
+            "Didn't compose a syllable split across chunks."
+        encoder = codecs.getincrementalencoder("utf-8-jamo")()
+        encoder.encode("\u1100")
+        encoder.reset()
+        assert encoder.encode("\u1161", final=True) == "\u1161".encode(),\
+            "reset didn't drop pending jamo."
+
+    def test_encoder_state(self):
+        """getstate and setstate should carry pending jamo."""
+        source = jamo.h2j("한국어")
+        factory = codecs.getincrementalencoder("utf-16-jamo")
+        encoder = factory()
+        data = encoder.encode(source[:4])
+        copy = factory()
+        copy.setstate(encoder.getstate())
+        data += copy.encode(source[4:], final=True)
+        assert data.decode("utf-16") == "한국어",\
+            "Lost pending jamo through getstate and setstate."
+
+    def test_stream(self):
+        """StreamWriter should compose jamo, and StreamReader should
+        decompose Hangul, however the bytes are split.
+        """
+        fout = io.BytesIO()
+        writer = codecs.getwriter("utf-8-jamo")(fout)
+        for char in _TEXT + "하":
+            writer.write(jamo.h2j(char))
+        assert fout.getvalue().decode('utf-8') == _TEXT + "하",\
+            "StreamWriter didn't compose the text."
+        for encoding in ("utf-8", "utf-16", "cp949"):
+            data = ("한국어 " * 100).encode(encoding)
+            reader = codecs.getreader(encoding + "-jamo")(io.BytesIO(data))
+            parts = []
+            while True:
+                part = reader.read(7)
+                if not part:
+                    break
+                parts.append(part)
+            assert ''.join(parts) == jamo.h2j("한국어 " * 100),\
+                "StreamReader split {} characters.".format(encoding)
+        reader = codecs.getreader("utf-8-jamo")(
+            io.BytesIO(_TEXT.encode('utf-8')))
+        assert reader.read() == jamo.h2j(_TEXT),\
+            "StreamReader didn't decompose the text."
+
+    def test_open(self):
+        """Files opened with a -jamo encoding should convert as they are
+        written and read.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.txt")
+            with open(path, 'w', encoding="utf-8-jamo") as fout:
+                fout.write(jamo.h2j(_TEXT))
+            with open(path, encoding='utf-8') as fin:
+                assert fin.read() == _TEXT,\
+                    "Writing through open didn't compose jamo."
+            with open(path, encoding="utf-8-jamo") as fin:
+                assert fin.read() == jamo.h2j(_TEXT),\
+                    "Reading through open didn't decompose Hangul."
+            source = jamo.h2j("한국어\n")
+            with open(path, 'w', encoding="utf-8-jamo") as fout:
+                for char in source:
+                    fout.write(char)
+                    fout.flush()
+            with open(path, encoding='utf-8') as fin:
+                assert fin.read() == "한국어\n",\
+                    "open didn't compose a syllable split across writes."
+
+    def test_open_trailing_jamo(self):
+        """Jamo held back at the end of a write through open should be
+        written out with the next write.
+        """
+        for text, more in ((jamo.h2j("안녕하"), "abc"),
+                           ("abc\u1100", "\n"),
+                           ("abc\u1100", "\u1161\n")):
+            target = jamo.synth_hangul(text + more)
+            fout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8-jamo")
+            fout.write(text)
+            fout.flush()
+            fout.write(more)
+            fout.flush()
+            trial = fout.buffer.getvalue().decode('utf-8')
+            assert trial == target,\
+                "TextIOWrapper wrote {!r} as {!r}.".format(text + more, trial)
+
+    def test_codecs_open(self):
+        """codecs.open should keep jamo at the end of the text."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "test.txt")
+            for text in ("한국어 하", "가ᄀ", "안녕하"):
+                with codecs.open(path, 'w', encoding="utf-8-jamo") as fout:
+                    fout.write(jamo.h2j(text))
+                with open(path, encoding='utf-8') as fin:
+                    assert fin.read() == text,\
+                        "codecs.open lost the end of {}.".format(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
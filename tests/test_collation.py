@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for sorting in jamo order.
+"""
+import random
+import unittest
+import jamo
+from jamo.collation import bisect_left, bisect_right, prefix_range
+
+
+class TestCollation(unittest.TestCase):
+    def test_modern(self):
+        """Modern Hangul should sort as its jamo do, a syllable before the
+        same syllable with a tail.
+        """
+        rng = random.Random(0)
+        syllables = [chr(rng.randrange(0xAC00, 0xD7A4)) for _ in range(300)]
+        words = [''.join(rng.choice(syllables)
+                         for _ in range(rng.randint(1, 4)))
+                 for _ in range(3000)]
+        assert jamo.sort(words) == sorted(words),\
+            "Modern Hangul didn't sort in syllable order."
+        assert jamo.sort(["각", "가나", "가", "abc", ""]) ==\
+            ["", "abc", "가", "가나", "각"],\
+            "Didn't sort leads before tails."
+        assert jamo.sort(words, reverse=True) == sorted(words, reverse=True),\
+            "Didn't sort in reverse."
+
+    def test_archaic(self):
+        """Archaic jamo should sort among the modern ones they come
+        from.
+        """
+        for before, archaic, after in [("ᄉ", "ᅀ", "ᄋ"),
+                                       ("ᄋ", "ᅌ", "ᄌ"),
+                                       ("ᅵ", "ᆞ", "ᆨ"),
+                                       ("ᄇ", "ᄫ", "ᄉ")]:
+            assert jamo.sort_key(before) < jamo.sort_key(archaic) <\
+                jamo.sort_key(after),\
+                "{} didn't sort between {} and {}.".format(
+                    hex(ord(archaic)), hex(ord(before)), hex(ord(after)))
+
+    def test_equivalence(self):
+        """Hangul characters, their jamo, and HCJ should have equal keys."""
+        for text in ["한국어", "ㅎ", "ㅏ", "값"]:
+            assert jamo.sort_key(text) == jamo.sort_key(jamo.h2j(text)),\
+                "{} didn't match its jamo.".format(text)
+        assert jamo.sort_key("ㄱ") == jamo.sort_key("ᄀ"),\
+            "HCJ didn't match its lead."
+        assert jamo.sort_key("ㅏ") == jamo.sort_key("ᅡ"),\
+            "HCJ didn't match its vowel."
+        assert jamo.sort_key("ㄳ") == jamo.sort_key("ᆪ"),\
+            "HCJ didn't match its tail."
+        assert jamo.sort(["한", "ᄒ", "ㅎ"]) == ["ᄒ", "ㅎ", "한"],\
+            "Didn't sort stably."
+        assert jamo.sort(["가\n나", "가", "a\nb"]) == ["a\nb", "가", "가\n나"],\
+            "Didn't sort strings holding newlines."
+
+    def test_search(self):
+        """bisect and prefix_range should find strings in a sorted list."""
+        words = jamo.sort(["한국", "한국어", "한글", "하나", "한", "값", "ㅎ",
+                           "ㅎㅎ", "abc"])
+        start = bisect_left(words, "한")
+        assert words[start] == "한" and bisect_right(words, "한") == start + 1,\
+            "bisect didn't find a string."
+        assert bisect_left(words, "한가") == start + 1,\
+            "bisect didn't place a missing string."
+        start, end = prefix_range(words, "한구")
+        assert words[start:end] == ["한국", "한국어"],\
+            "prefix_range didn't find a partial syllable."
+        start, end = prefix_range(words, "ㅎ")
+        assert words[start:end] == ["ㅎ", "ㅎㅎ", "하나", "한", "한국",
+                                    "한국어", "한글"],\
+            "prefix_range didn't find an HCJ lead."
+        start, end = prefix_range(words, "xyz")
+        assert start == end == 1, "prefix_range found a missing prefix."
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for jamo-level edit distances.
+"""
+import unittest
+import jamo
+import jamo.distance
+import random
+
+
+def _reference(a, b, transpositions=False):
+    """A plain dynamic program for Levenshtein and optimal string alignment
+    distances.
+    """
+    rows = [list(range(len(b) + 1))]
+    for i in range(1, len(a) + 1):
+        row = [i]
+        for j in range(1, len(b) + 1):
+            row.append(min(rows[-1][j] + 1, row[j - 1] + 1,
+                           rows[-1][j - 1] + (a[i - 1] != b[j - 1])))
+            if transpositions and i > 1 and j > 1 and\
+                    a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], rows[-2][j - 2] + 1)
+        rows.append(row)
+    return rows[-1][-1]
+
+
+class TestDistance(unittest.TestCase):
+    def test_levenshtein(self):
+        """levenshtein tests
+        Distances should count jamo, not syllables.
+        """
+        tests = [("간", "갈", 1), ("간", "가", 1), ("간", "", 3),
+                 ("한국어", "한국어", 0), ("한국어", "헌국아", 2),
+                 ("", "", 0), ("abc", "acb", 2)]
+        for a, b, target in tests:
+            trial = jamo.distance.levenshtein(a, b)
+            assert trial == target,\
+                ("Distance from {a} to {b} was {trial}, but expected "
+                 "{target}.").format(a=a, b=b, trial=trial, target=target)
+        assert jamo.distance.levenshtein("간", "갈", decompose=False) == 1 and\
+            jamo.distance.levenshtein("간", "가", decompose=False) == 1,\
+            "decompose=False didn't compare syllables."
+
+    def test_damerau_levenshtein(self):
+        """damerau_levenshtein tests
+        Swapping adjacent jamo should cost one edit.
+        """
+        tests = [("abc", "acb", 1), ("ca", "abc", 3), ("간", "갈", 1),
+                 (jamo.h2j("가"), jamo.h2j("가")[::-1], 1)]
+        for a, b, target in tests:
+            trial = jamo.distance.damerau_levenshtein(a, b)
+            assert trial == target,\
+                ("Distance from {a} to {b} was {trial}, but expected "
+                 "{target}.").format(a=a, b=b, trial=trial, target=target)
+
+    def test_random(self):
+        """The bit-parallel distances should agree with a dynamic program,
+        including for strings longer than a machine word.
+        """
+        rng = random.Random(0)
+        for _ in range(500):
+            a, b = [''.join(rng.choice("가각나ab") for _ in
+                            range(30 if rng.random() < 0.05 else
+                                  rng.randint(0, 8)))
+                    for _ in range(2)]
+            ja, jb = jamo.h2j(a), jamo.h2j(b)
+            for transpositions, func in (
+                    (False, jamo.distance.levenshtein),
+                    (True, jamo.distance.damerau_levenshtein)):
+                target = _reference(ja, jb, transpositions)
+                assert func(a, b) == target,\
+                    "{} from {} to {} was {}, not {}.".format(
+                        func.__name__, a, b, func(a, b), target)
+            assert jamo.distance.weighted_levenshtein(a, b) ==\
+                _reference(ja, jb),\
+                "weighted_levenshtein with unit costs disagreed."
+
+    def test_levenshtein_many(self):
+        """levenshtein_many should match one-by-one distances, capped at
+        max_distance + 1.
+        """
+        candidates = ["한국어", "한국", "헌국아", "", "대한민국", "hello"]
+        for transpositions in (False, True):
+            trial = jamo.distance.levenshtein_many(
+                "한국어", iter(candidates), transpositions)
+            func = jamo.distance.damerau_levenshtein if transpositions\
+                else jamo.distance.levenshtein
+            target = [func("한국어", _) for _ in candidates]
+            assert trial == target,\
+                "levenshtein_many returned {}, not {}.".format(trial, target)
+            trial = jamo.distance.levenshtein_many(
+                "한국어", candidates, transpositions, max_distance=2)
+            assert trial == [min(_, 3) for _ in target],\
+                "levenshtein_many didn't cap distances: {}.".format(trial)
+
+    def test_weighted_levenshtein(self):
+        """weighted_levenshtein should charge costs by jamo class."""
+        weighted = jamo.distance.weighted_levenshtein
+        tests = [(("간", "갈"), {"substitution": {"tail": 0.5}}, 0.5),
+                 (("간", "건"), {"substitution": {"tail": 0.5}}, 1),
+                 (("간", "건"), {"substitution": {"vowel": 0.25}}, 0.25),
+                 (("간", "가"), {"deletion": {"tail": 0.25}}, 0.25),
+                 (("가", "간"), {"insertion": {"tail": 0.25}}, 0.25),
+                 # A tail for a vowel crosses classes.
+                 (("가", "ᄀᆫ"), {"substitution": {None: 5}}, 2),
+                 (("ab", "ac"), {"substitution": 3}, 2)]
+        for (a, b), costs, target in tests:
+            trial = weighted(a, b, **costs)
+            assert trial == target,\
+                ("Weighted distance from {a} to {b} with {costs} was "
+                 "{trial}, but expected {target}.").format(
+                     a=a, b=b, costs=costs, trial=trial, target=target)
+
+
+if __name__ == "__main__":
+    unittest.main()
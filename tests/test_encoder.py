@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for JamoEncoder.
+"""
+import unittest
+import jamo
+from jamo.encoder import PAD, OOV, MAX_VOCABULARY
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_TEXTS = ["자모=字母", "Do you speak 한국어?", "", "한글 ᄀᄁᄂᄃᇹᇫ ㄱㆎ",
+          "ᄒᆞᆫ글"]
+
+
+class TestEncoder(unittest.TestCase):
+    def test_vocabulary(self):
+        """Modern jamo should come first, after padding and OOV."""
+        encoder = jamo.JamoEncoder(chars="")
+        modern = jamo.JAMO_LEADS_MODERN + jamo.JAMO_VOWELS_MODERN +\
+            jamo.JAMO_TAILS_MODERN
+        assert encoder.vocabulary[2:] == modern,\
+            "The vocabulary isn't the modern jamo."
+        assert len(encoder) == len(modern) + 2,\
+            "len doesn't give the vocabulary size."
+        larger = jamo.JamoEncoder(archaic=True, hcj=True, chars=" ?")
+        for char in "ᆞꥠힰㄱㆎ ?":
+            assert char in larger.vocabulary,\
+                "{} isn't in the vocabulary.".format(char)
+        assert len(set(larger.vocabulary)) == len(larger),\
+            "The vocabulary has duplicates."
+
+    def test_encode(self):
+        """encode should give the IDs of the jamo of h2j."""
+        encoder = jamo.JamoEncoder(archaic=True, hcj=True)
+        for text in _TEXTS:
+            trial = encoder.encode(text)
+            target = [encoder.vocabulary.index(_)
+                      if _ in encoder.vocabulary else OOV
+                      for _ in jamo.h2j(text)]
+            assert list(trial) == target,\
+                "Encoded {} as {}.".format(text, list(trial))
+
+    def test_round_trip(self):
+        """Decoding should undo encoding, up to OOV characters."""
+        encoder = jamo.JamoEncoder(archaic=True, hcj=True,
+                                   chars=" =?字母Doyuspeak")
+        ids, lengths = encoder.encode_batch(_TEXTS)
+        assert ids.shape == (len(_TEXTS), max(lengths)),\
+            "encode_batch returned shape {}.".format(ids.shape)
+        assert encoder.decode_batch(ids, lengths) == _TEXTS,\
+            "decode_batch didn't undo encode_batch."
+        assert encoder.decode_batch(ids) == _TEXTS,\
+            "decode_batch didn't drop padding."
+        assert encoder.decode_batch(ids.tolist(), lengths) == _TEXTS,\
+            "decode_batch didn't accept lists."
+        assert encoder.decode(encoder.encode(_TEXTS[1]), compose=False) ==\
+            jamo.h2j(_TEXTS[1]), "decode composed with compose=False."
+        encoder = jamo.JamoEncoder(chars="", oov_char="_")
+        assert encoder.decode(encoder.encode("한 ᆞ")) == "한__",\
+            "OOV characters didn't decode to oov_char."
+        ids = [300, 5000, 2, 0xD800, 0x110000, 0xFFFFFFFF]
+        assert encoder.decode(ids) == "__ᄀ___",\
+            "IDs outside the vocabulary didn't decode to oov_char."
+        assert encoder.decode_batch([ids]) == ["__ᄀ___"],\
+            "decode_batch didn't decode unknown IDs to oov_char."
+
+    def test_vocabulary_limit(self):
+        """The vocabulary should stop short of IDs in the surrogate range."""
+        size = len(jamo.JamoEncoder(chars=""))
+        chars = ''.join(map(chr, range(0x10000, 0x10000 + MAX_VOCABULARY)))
+        encoder = jamo.JamoEncoder(chars=chars[:MAX_VOCABULARY - size])
+        assert len(encoder) == MAX_VOCABULARY,\
+            "The vocabulary has {} entries.".format(len(encoder))
+        last = encoder.vocabulary[-1]
+        assert list(encoder.encode(last)) == [MAX_VOCABULARY - 1],\
+            "Didn't encode the last ID."
+        try:
+            jamo.JamoEncoder(chars=chars[:MAX_VOCABULARY - size + 1])
+            assert False, "Accepted a vocabulary reaching the surrogates."
+        except ValueError:
+            pass
+
+    def test_encode_batch(self):
+        """Rows should be padded to the longest, or cut to width."""
+        encoder = jamo.JamoEncoder()
+        ids, lengths = encoder.encode_batch(_TEXTS)
+        for row, length, text in zip(ids.tolist(), lengths, _TEXTS):
+            assert row[:length] == list(encoder.encode(text)) and\
+                set(row[length:]) <= {PAD},\
+                "Row for {} is {}.".format(text, row)
+        ids, lengths = encoder.encode_batch(_TEXTS, width=3)
+        assert ids.shape == (len(_TEXTS), 3) and max(lengths) == 3,\
+            "encode_batch didn't cut rows to width."
+        ids, lengths = encoder.encode_batch([])
+        assert len(ids) == 0 and len(lengths) == 0,\
+            "encode_batch failed on an empty batch."
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        """numpy.asarray should see the batch as a 2-D array."""
+        encoder = jamo.JamoEncoder()
+        ids, lengths = encoder.encode_batch(_TEXTS)
+        array = numpy.asarray(ids)
+        assert array.shape == ids.shape and array.tolist() == ids.tolist(),\
+            "numpy.asarray didn't read the batch."
+        assert encoder.decode_batch(array, lengths) ==\
+            encoder.decode_batch(ids, lengths),\
+            "decode_batch didn't accept a NumPy array."
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for FuzzyIndex.
+"""
+import unittest
+import jamo
+import jamo.distance
+import random
+
+
+_WORDS = ["한국어", "한국", "대한민국", "헌국아", "학교", "간장", "갈장",
+          "hello", "help"]
+
+
+class TestFuzzy(unittest.TestCase):
+    def test_search(self):
+        """search should return the closest words by jamo distance."""
+        index = jamo.FuzzyIndex(_WORDS)
+        tests = [(("한국어", 3), [("한국어", 0), ("한국", 2), ("헌국아", 2)]),
+                 (("간장", 5, 1), [("간장", 0), ("갈장", 1)]),
+                 (("hepl", 2), [("hello", 2), ("help", 2)])]
+        for args, target in tests:
+            trial = index.search(*args)
+            assert trial == target,\
+                "Searched {} and found {}.".format(args, trial)
+        assert index.search("hepl", 1, transpositions=True) ==\
+            [("help", 1)], "search ignored transpositions=True."
+        assert index.search("없음", max_distance=1) == [],\
+            "search returned words beyond max_distance."
+
+    def test_random(self):
+        """With every candidate verified, search should find the same
+        distances as comparing the query with every word sharing an n-gram
+        with it.
+        """
+        rng = random.Random(0)
+        words = list(set(''.join(rng.choice("가각간나난다ab")
+                                 for _ in range(rng.randint(1, 4)))
+                         for _ in range(300)))
+        index = jamo.FuzzyIndex(words, n=2)
+        for _ in range(50):
+            query = ''.join(rng.choice("가각간나난다ab")
+                            for _ in range(rng.randint(1, 4)))
+            trial = [distance for _, distance in
+                     index.search(query, 5, max_candidates=None)]
+            # Words sharing no n-gram with the query are never candidates.
+            grams = index._grams(jamo.h2j(query))
+            shared = [_ for _ in words if grams & index._grams(jamo.h2j(_))]
+            target = sorted(jamo.distance.levenshtein_many(query,
+                                                           shared))[:5]
+            assert trial == target,\
+                "Searched {} and found distances {}, not {}.".format(
+                    query, trial, target)
+
+    def test_insert_delete(self):
+        index = jamo.FuzzyIndex(_WORDS)
+        index.insert("한국")
+        assert len(index) == len(_WORDS), "Inserted a word twice."
+        index.delete("한국")
+        assert "한국" not in index and len(index) == len(_WORDS) - 1,\
+            "delete didn't remove the word."
+        assert "한국" not in [word for word, _ in index.search("한국")],\
+            "search returned a deleted word."
+        try:
+            index.delete("한국")
+            assert False, "Deleted a missing word."
+        except KeyError:
+            pass
+        index.insert("한국")
+        assert index.search("한국", 1) == [("한국", 0)],\
+            "search didn't find a reinserted word."
+        for word in _WORDS[2:]:
+            index.delete(word)
+        index.compact()
+        assert sorted(index) == sorted(_WORDS[:2]) and\
+            [word for word, _ in index.search("대한민국")] == ["한국", "한국어"],\
+            "compact lost words or kept deleted ones."
+        assert index.search("한국", 0) == [], "search(k=0) returned words."
+
+    def test_churn(self):
+        """Deleted words should neither take up slots once compacted nor
+        crowd out live candidates before.
+        """
+        rng = random.Random(0)
+        index = jamo.FuzzyIndex(n=2)
+        for _ in range(5):
+            words = set(''.join(rng.choice("가각간나난다라") for _ in range(5))
+                        for _ in range(3000))
+            for word in words:
+                index.insert(word)
+            for word in words:
+                index.delete(word)
+        assert len(index) == 0 and len(index._words) < 3000,\
+            "Deleted words kept their slots: {}.".format(len(index._words))
+        index = jamo.FuzzyIndex(["가나다{}".format(_) for _ in range(50)])
+        index.insert("가나다라")
+        for number in range(50):
+            index.delete("가나다{}".format(number))
+        assert index.search("가나다", 1, max_candidates=1) ==\
+            [("가나다라", 2)], "Deleted words crowded out a live one."
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for ChoseongIndex.
+"""
+import unittest
+import jamo
+import os
+import random
+import tempfile
+
+
+_ENTRIES = ["가나다", "삼성 전자", "가방", "나비", "강남", "apple", "가나",
+            "삼성", "사과", "ᄀᄂ"]
+
+
+def _matches(entry, query):
+    """A slow reference for ChoseongIndex matching."""
+    entry, query = ''.join(entry.split()), ''.join(query.split())
+    if len(entry) < len(query):
+        return False
+    for char, want in zip(entry, query):
+        if jamo.is_hangul_char(want):
+            if char != want:
+                return False
+        elif jamo.choseong(char) != jamo.choseong(want):
+            return False
+    return True
+
+
+class TestIndex(unittest.TestCase):
+    def test_search(self):
+        """search should find entries by initial consonants, mixed with
+        syllables.
+        """
+        index = jamo.ChoseongIndex(_ENTRIES)
+        tests = [("ㄱㄴ", ["ᄀᄂ", "가나", "강남", "가나다"]),
+                 ("가ㄴ", ["가나", "가나다"]),
+                 ("ㄱ나", ["가나", "가나다"]),
+                 ("ㅅㅅㅈㅈ", ["삼성 전자"]),
+                 ("삼성ㅈ", ["삼성 전자"]),
+                 ("ㅅ", ["사과", "삼성", "삼성 전자"]),
+                 ("a", ["apple"]),
+                 ("ㄱㄴㄷㄹ", []),
+                 ("ㄴ", ["나비"])]
+        for query, target in tests:
+            trial = index.search(query)
+            assert trial == target,\
+                "Searched {} and found {}.".format(query, trial)
+        assert index.search("ㄱ", limit=2) == ["ᄀᄂ", "가나"],\
+            "search didn't stop at limit."
+        assert index.search("", limit=0) == [],\
+            "search didn't stop at limit=0."
+        assert sorted(index.search_ids("ㄱ")) == [0, 2, 4, 6, 9],\
+            "search_ids didn't number entries in order."
+
+    def test_search_random(self):
+        """search should agree with a plain scan."""
+        rng = random.Random(0)
+        syllables = "가각간나난다사삼성"
+        entries = [''.join(rng.choice(syllables + " ")
+                           for _ in range(rng.randint(0, 5)))
+                   for _ in range(500)]
+        index = jamo.ChoseongIndex(entries)
+        for _ in range(200):
+            query = ''.join(rng.choice(syllables + "ㄱㄴㄷㅅ")
+                            for _ in range(rng.randint(0, 3)))
+            trial = sorted(index.search_ids(query))
+            target = [i for i, entry in enumerate(entries)
+                      if _matches(entry, query)]
+            assert trial == target,\
+                "Searched {} and found {}.".format(query, trial)
+
+    def test_ignore_spaces(self):
+        index = jamo.ChoseongIndex(_ENTRIES, ignore_spaces=False)
+        assert index.search("ㅅㅅㅈ") == [],\
+            "Matched across a space with ignore_spaces=False."
+        assert index.search("ㅅㅅ ㅈ") == ["삼성 전자"],\
+            "Didn't match a space with ignore_spaces=False."
+
+    def test_entries(self):
+        index = jamo.ChoseongIndex(_ENTRIES)
+        assert len(index) == len(_ENTRIES) and\
+            [index[i] for i in range(len(index))] == _ENTRIES and\
+            index[-1] == _ENTRIES[-1], "The index lost its entries."
+        try:
+            index[len(_ENTRIES)]
+            assert False, "Indexed past the end."
+        except IndexError:
+            pass
+
+    def test_save_load(self):
+        """An index should search the same after a save and load."""
+        index = jamo.ChoseongIndex(_ENTRIES + ["\U0001f600", "\udcff"])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index")
+            index.save(path)
+            loaded = jamo.ChoseongIndex.load(path)
+            with open(path, 'rb') as fin:
+                data = fin.read()
+            for bad in (b"not an index", data[:12], data[:-1]):
+                with open(path, 'wb') as fout:
+                    fout.write(bad)
+                try:
+                    jamo.ChoseongIndex.load(path)
+                    assert False, "Loaded a file that isn't an index."
+                except ValueError:
+                    pass
+        assert list(loaded[i] for i in range(len(loaded))) ==\
+            _ENTRIES + ["\U0001f600", "\udcff"], "load lost entries."
+        for query in ("ㄱ", "가ㄴ", "ㅅㅅㅈ", ""):
+            assert loaded.search(query) == index.search(query),\
+                "Loaded index searched {} differently.".format(query)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the opt-in instrumentation.
+"""
+import unittest
+import jamo
+import jamo.distance
+import jamo.instrument
+import os
+import subprocess
+import sys
+
+
+class TestInstrument(unittest.TestCase):
+    def tearDown(self):
+        jamo.instrument.disable()
+        jamo.instrument.reset()
+
+    def test_profile(self):
+        """Calls within profile should be counted, and the original
+        functions restored after it.
+        """
+        originals = [getattr(jamo, _) for _ in jamo.instrument.FUNCTIONS]
+        with jamo.instrument.profile(reset_stats=True):
+            jamo.h2j("한국어")
+            jamo.h2j(["가", "나"])
+            jamo.distance.levenshtein("가", "나")
+            jamo.j2hcj(jamo.h2j("가"))
+            jamo.hcj_to_jamo("ㄱ", "lead")
+            try:
+                jamo.get_jamo_class("a")
+            except jamo.InvalidJamoError:
+                pass
+        jamo.h2j("uncounted")
+        assert [getattr(jamo, _) for _ in jamo.instrument.FUNCTIONS] ==\
+            originals, "profile didn't restore the original functions."
+        assert jamo.distance.h2j is jamo.jamo.h2j is jamo.h2j,\
+            "profile didn't restore the functions in other modules."
+        trial = jamo.instrument.snapshot()
+        h2j = trial["h2j"]
+        assert (h2j["calls"], h2j["chars"], h2j["errors"]) == (5, 8, 0),\
+            "Wrong h2j totals {}.".format(h2j)
+        assert h2j["inputs"]["list"]["calls"] == 1 and\
+            h2j["inputs"]["str"]["calls"] == 4,\
+            "Wrong h2j input types {}.".format(h2j["inputs"])
+        assert trial["j2hcj"]["chars"] == 2 and\
+            trial["hcj_to_jamo"]["calls"] == 1,\
+            "Wrong totals {}.".format(trial)
+        assert trial["get_jamo_class"]["errors"] == 1,\
+            "Didn't count the exception."
+        assert "jamo_to_hangul" not in trial,\
+            "Recorded a function that wasn't called."
+
+    def test_prometheus(self):
+        with jamo.instrument.profile():
+            jamo.h2j("한국어")
+        lines = jamo.instrument.prometheus().splitlines()
+        for metric in ("calls", "chars", "seconds", "errors"):
+            assert "# TYPE jamo_{}_total counter".format(metric) in lines,\
+                "Missing the {} metric.".format(metric)
+        assert 'jamo_calls_total{function="h2j",input="str"} 1' in lines,\
+            "Missing the h2j call count."
+        assert 'jamo_chars_total{function="h2j",input="str"} 3' in lines,\
+            "Missing the h2j character count."
+
+    def test_environment(self):
+        """JAMO_PROFILE=1 should instrument from import and report at exit.
+        """
+        code = "import jamo; jamo.h2j('abc')"
+        output = subprocess.run([sys.executable, "-c", code],
+                                env=dict(os.environ, JAMO_PROFILE="1"),
+                                stderr=subprocess.PIPE,
+                                universal_newlines=True).stderr
+        assert 'jamo_calls_total{function="h2j",input="str"} 1' in\
+            output.splitlines(), "JAMO_PROFILE didn't report: " + output
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,8 @@ import unittest
 import jamo
 import random
 import itertools
-import io
+import subprocess
+import sys
 
 
 # See http://www.unicode.org/charts/PDF/U1100.pdf
@@ -32,6 +33,50 @@ def _get_random_hangul(count=(0xd7a4 - 0xac00)):
 
 
 class TestJamo(unittest.TestCase):
+    def test_lazy_tables(self):
+        """Importing jamo should not load the name-derived tables."""
+        code = ("import sys, jamo; "
+                "print('jamo._tables' in sys.modules); "
+                "jamo.j2hcj('\u1100'); "
+                "print('jamo._tables' in sys.modules)")
+        output = subprocess.check_output([sys.executable, "-c", code],
+                                         universal_newlines=True)
+        assert output.split() == ["False", "True"],\
+            "jamo._tables was not loaded lazily."
+
+    def test_lazy_exports(self):
+        """Importing jamo should not import the modules behind its classes
+        and sorting until they are used.
+        """
+        code = ("import sys, jamo; "
+                "print('jamo.collation' in sys.modules); "
+                "print(jamo.sort is jamo.collation.sort); "
+                "print('sort_key' in dir(jamo))")
+        output = subprocess.check_output([sys.executable, "-c", code],
+                                         universal_newlines=True)
+        assert output.split() == ["False", "True", "True"],\
+            "jamo.collation was not imported lazily."
+        with self.assertRaises(AttributeError):
+            jamo.no_such_name
+
+    def test_lazy_imports(self):
+        """Importing jamo should not import re or jamo.codec, nor create its
+        namedtuple classes, until they are used.
+        """
+        code = ("import sys; had_re = 're' in sys.modules; import jamo; "
+                "print(had_re or 're' not in sys.modules); "
+                "print('jamo.codec' in sys.modules); "
+                "print('ScanResult' in vars(jamo.jamo)); "
+                "print(type(jamo.scan('한')) is jamo.ScanResult); "
+                "print('한'.encode('utf-8-jamo') == '한'.encode()); "
+                "print('jamo.codec' in sys.modules)")
+        output = subprocess.check_output([sys.executable, "-c", code],
+                                         universal_newlines=True)
+        assert output.split() == ["True", "False", "False", "True", "True",
+                                  "True"],\
+            "Importing jamo did work it could have put off: {}.".format(
+                output.split())
+
     def test_is_jamo(self):
         """is_jamo tests
         Test if a single character is a jamo character.
@@ -224,8 +269,6 @@ class TestJamo(unittest.TestCase):
                                              target=target)
 
         # Negative tests
-        _stderr = jamo.jamo.stderr
-        jamo.jamo.stderr = io.StringIO()
         for _ in invalid_cases:
             try:
                 jamo.get_jamo_class(_)
@@ -238,7 +281,99 @@ class TestJamo(unittest.TestCase):
                 assert False, "Accepted bad input without throwing exception."
             except:
                 pass
-        jamo.jamo.stderr = _stderr
+
+    def test_get_jamo_class_extended(self):
+        """get_jamo_class should class the extended jamo blocks as well.
+        See http://www.unicode.org/charts/PDF/UA960.pdf and
+        http://www.unicode.org/charts/PDF/UD7B0.pdf
+        """
+        cases = itertools.chain(((chr(_), "lead")
+                                 for _ in range(0xa960, 0xa97d)),
+                                ((chr(_), "vowel")
+                                 for _ in range(0xd7b0, 0xd7c7)),
+                                ((chr(_), "tail")
+                                 for _ in range(0xd7cb, 0xd7fc)),
+                                ((chr(_), "vowel")
+                                 for _ in range(0x314f, 0x3164)))
+        for test, target in cases:
+            trial = jamo.get_jamo_class(test)
+            assert trial == target,\
+                ("Incorrectly decided {test} "
+                 "was a {trial}. "
+                 "(it's a {target})").format(test=hex(ord(test)),
+                                             trial=trial,
+                                             target=target)
+
+    def test_classify(self):
+        """classify tests
+        classify should return one byte of FLAG_* bits per character, which
+        agree with the is_* functions.
+        """
+        assert jamo.classify("") == b"",\
+            "classify didn't accept an empty string."
+        text = ''.join(itertools.chain(
+            (chr(_) for _ in range(0x1100, 0x1200)),
+            (chr(_) for _ in range(0x3130, 0x3190)),
+            (chr(_) for _ in range(0xa960, 0xa980)),
+            (chr(_) for _ in range(0xd7b0, 0xd800)),
+            _get_random_hangul(1024),
+            "abABzyZY ,.:;~`―—–/!@#$%^&*()[]{}字母\U0001f600"))
+        trial = jamo.classify(text)
+        assert len(trial) == len(text),\
+            "classify didn't return one byte per character."
+        for char, flags in zip(text, trial):
+            assert bool(flags & jamo.FLAG_HANGUL) ==\
+                jamo.is_hangul_char(char),\
+                "Wrong FLAG_HANGUL for U+{}.".format(hex(ord(char))[2:])
+            assert bool(flags & (jamo.FLAG_LEAD | jamo.FLAG_VOWEL |
+                                 jamo.FLAG_TAIL | jamo.FLAG_HCJ)) ==\
+                jamo.is_jamo(char),\
+                "Wrong jamo flags for U+{}.".format(hex(ord(char))[2:])
+            assert bool(flags & jamo.FLAG_MODERN) ==\
+                jamo.is_jamo_modern(char),\
+                "Wrong FLAG_MODERN for U+{}.".format(hex(ord(char))[2:])
+            assert bool(flags & jamo.FLAG_HCJ) == jamo.is_hcj(char),\
+                "Wrong FLAG_HCJ for U+{}.".format(hex(ord(char))[2:])
+
+    def test_scan(self):
+        """scan tests
+        scan should count characters by kind in agreement with the is_*
+        functions, and contains_hangul and is_all_precomposed should agree
+        with it.
+        """
+        assert jamo.scan("") == (0, 0, 0, 0, 0),\
+            "scan didn't accept an empty string."
+        samples = ["abc 字母", jamo.h2j("한국어"), "한국어", "ㅎㄱ",
+                   "\ua960\u1160", "가\u1100", "\U0001f600"]
+        samples.append(''.join(itertools.chain(
+            (chr(_) for _ in range(0x1100, 0x1200)),
+            (chr(_) for _ in range(0x3130, 0x3190)),
+            (chr(_) for _ in range(0xa960, 0xa980)),
+            (chr(_) for _ in range(0xd7b0, 0xd800)),
+            _get_random_hangul(1024), samples)))
+        for text in samples:
+            target = [0] * 5
+            for char in text:
+                if jamo.is_hangul_char(char):
+                    target[0] += 1
+                elif jamo.is_hcj(char):
+                    target[3] += 1
+                elif jamo.is_jamo_modern(char):
+                    target[1] += 1
+                elif jamo.is_jamo(char):
+                    target[2] += 1
+                else:
+                    target[4] += 1
+            trial = jamo.scan(text)
+            assert trial == tuple(target),\
+                "scan counted {trial} for {text}.".format(trial=trial,
+                                                          text=text)
+            assert jamo.scan(iter(text)) == trial,\
+                "scan didn't accept an iterable."
+            assert jamo.contains_hangul(text) == any(trial[:4]),\
+                "contains_hangul was wrong for {}.".format(text)
+            assert jamo.is_all_precomposed(text) == (not any(trial[1:4])),\
+                "is_all_precomposed was wrong for {}.".format(text)
 
     def test_jamo_to_hcj(self):
         """jamo_to_hcj tests
@@ -435,6 +570,107 @@ class TestJamo(unittest.TestCase):
                                               trial=trial,
                                               target=target)
 
+    def test_h2j_table(self):
+        """h2j table tests
+        The precomputed translation table should agree with the syllable
+        arithmetic for every modern Hangul character.
+        """
+        for hangul in _get_random_hangul():
+            target = ''.join(jamo.jamo._hangul_char_to_jamo(hangul))
+            assert jamo.h2j(hangul) == target,\
+                ("Converted {hangul} to {trial}, but "
+                 "expected {target}.").format(hangul=hangul,
+                                              trial=jamo.h2j(hangul),
+                                              target=target)
+        assert jamo.h2j(iter("한굴")) == jamo.h2j("한굴"),\
+            "h2j doesn't accept iterables of characters."
+
+    def test_h2j_with_offsets(self):
+        """h2j_with_offsets tests
+        h2j_with_offsets should return h2j of its input, and offset maps
+        that send every character to the span it became.
+        """
+        tests = ["", "test123~", "한굴", "자모=字母", "ᄀᄁᄂᄃᇹᇫ",
+                 "Do you speak 한국어?", "𝕏가"]
+        for test in tests:
+            trial, source_to_target, target_to_source = \
+                jamo.h2j_with_offsets(test)
+            assert trial == jamo.h2j(test),\
+                "Converted {} to {}.".format(test, trial)
+            assert len(source_to_target) == len(test) + 1 and\
+                len(target_to_source) == len(trial) + 1,\
+                "Offset maps for {} have the wrong length.".format(test)
+            for i, char in enumerate(test):
+                start, end = source_to_target[i], source_to_target[i + 1]
+                assert trial[start:end] == jamo.h2j(char),\
+                    ("Mapped {char} in {test} to {span}.").format(
+                        char=char, test=test, span=trial[start:end])
+                assert list(target_to_source[start:end]) ==\
+                    [i] * (end - start),\
+                    "Mapped {} in {} back wrongly.".format(char, test)
+            assert source_to_target[-1] == len(trial) and\
+                target_to_source[-1] == len(test),\
+                "Offset maps for {} lack a final entry.".format(test)
+
+    def test_hangul_to_hcj(self):
+        """hangul_to_hcj tests
+        Arguments may be iterables or characters.
+
+        hangul_to_hcj should split every Hangul character into HCJ and convert
+        every U+11xx jamo character into HCJ. Anything else is unchanged.
+        """
+        tests = ["", "test123~", "한굴", "자모=字母", "ᄀᄁᄂᄃᇹᇫ",
+                 "Do you speak 한국어?", "ㄱㆎ"]
+
+        for test in tests:
+            trial = jamo.hangul_to_hcj(test)
+            assert trial.__name__ == "<genexpr>",\
+                "hangul_to_hcj didn't return an instance of a generator."
+            trial = ''.join(trial)
+            target = jamo.j2hcj(jamo.h2j(test))
+            assert trial == target,\
+                ("Converted {test} to {trial}, but "
+                 "expected {target}.").format(test=test,
+                                              trial=trial,
+                                              target=target)
+
+    def test_h2hcj(self):
+        """h2hcj tests
+        h2hcj should give the same result as j2hcj(h2j(...)) for every modern
+        Hangul character.
+        """
+        assert jamo.h2hcj("자모=字母") == "ㅈㅏㅁㅗ=字母",\
+            "h2hcj doesn't convert Hangul to HCJ."
+        for hangul in _get_random_hangul():
+            target = jamo.j2hcj(jamo.h2j(hangul))
+            assert jamo.h2hcj(hangul) == target,\
+                ("Converted {hangul} to {trial}, but "
+                 "expected {target}.").format(hangul=hangul,
+                                              trial=jamo.h2hcj(hangul),
+                                              target=target)
+
+    def test_choseong(self):
+        """choseong tests
+        Arguments may be iterables or characters.
+
+        choseong should replace every Hangul character and modern lead with
+        the HCJ of its lead. Anything else is unchanged.
+        """
+        tests = ["", "test123~", "가나다", "자모=字母", "ᄀᄁᄂᄃᇹᇫ",
+                 "Do you speak 한국어?", "ㄱㆎ"]
+        targets = ["", "test123~", "ㄱㄴㄷ", "ㅈㅁ=字母", "ㄱㄲㄴㄷᇹᇫ",
+                   "Do you speak ㅎㄱㅇ?", "ㄱㆎ"]
+        for test, target in zip(tests, targets):
+            trial = jamo.choseong(test)
+            assert trial == target,\
+                ("Converted {test} to {trial}, but "
+                 "expected {target}.").format(test=test, trial=trial,
+                                              target=target)
+        for hangul in _get_random_hangul():
+            target = jamo.j2hcj(jamo.h2j(hangul)[0])
+            assert jamo.choseong(iter(hangul)) == target,\
+                "Converted {} to {}.".format(hangul, jamo.choseong(hangul))
+
     def test_jamo_to_hangul(self):
         """jamo_to_hangul tests
         Arguments may be jamo characters including HCJ. Throws an
@@ -499,8 +735,6 @@ class TestJamo(unittest.TestCase):
                                           failure=trial)
 
         # Negative tests
-        _stderr = jamo.jamo.stderr
-        jamo.jamo.stderr = io.StringIO()
         for _ in invalid_cases:
             try:
                 print(_)
@@ -508,7 +742,110 @@ class TestJamo(unittest.TestCase):
                 assert False, "Accepted bad input without throwing exception."
             except jamo.InvalidJamoError:
                 pass
-        jamo.jamo.stderr = _stderr
+
+    def test_jamo_to_hangul_many(self):
+        """jamo_to_hangul_many tests
+        Arguments are sequences of the characters jamo_to_hangul accepts.
+
+        Outputs a string of Hangul characters, one per triple.
+        """
+        assert jamo.jamo_to_hangul_many("ㅎㄱ", "ㅏㅜ", "ㄴㄹ") == "한굴",\
+            "jamo_to_hangul_many doesn't compose HCJ."
+        assert jamo.jamo_to_hangul_many("ㅎㅁ", "ㅏㅗ") == "하모",\
+            "jamo_to_hangul_many doesn't compose without tails."
+        assert jamo.jamo_to_hangul_many("", "", "") == "",\
+            "jamo_to_hangul_many doesn't accept empty input."
+
+        hangul = _get_random_hangul(1024)
+        leads, vowels, tails = [], [], []
+        for jamo_chars in map(jamo.jamo._hangul_char_to_jamo, hangul):
+            leads.append(jamo_chars[0])
+            vowels.append(jamo_chars[1])
+            tails.append(jamo_chars[2] if len(jamo_chars) == 3 else None)
+        trial = jamo.jamo_to_hangul_many(leads, vowels, tails)
+        assert trial == ''.join(hangul),\
+            "jamo_to_hangul_many did not undo _hangul_char_to_jamo."
+
+        # Archaic jamo have no precomposed Hangul character.
+        invalid_cases = [("ㄱㄱ", "ㅏㅏ", "ㄴ\u11c3"), ("ㄱ", "\u1176"),
+                         ("\u1113", "ㅏ"), ("ㄴ", "ㄴ")]
+        for args in invalid_cases:
+            try:
+                jamo.jamo_to_hangul_many(*args)
+                assert False, "Accepted bad input without throwing exception."
+            except jamo.InvalidJamoError:
+                pass
+
+    def test_errors(self):
+        """errors tests
+        jamo_to_hangul, jamo_to_hangul_many, hcj_to_jamo, j2hcj, and h2j
+        should handle invalid input according to errors.
+        """
+        # ᅶ has no HCJ counterpart.
+        unmapped = "\u1100\u1176\u1161"
+        assert jamo.j2hcj(unmapped) == "ㄱ\u1176ㅏ",\
+            "j2hcj didn't leave unmapped jamo unchanged by default."
+        assert jamo.j2hcj(unmapped, errors='ignore') == "ㄱㅏ",\
+            "j2hcj didn't ignore unmapped jamo."
+        assert jamo.j2hcj(unmapped, errors='replace') == "ㄱ\ufffdㅏ",\
+            "j2hcj didn't replace unmapped jamo."
+        trial, records = jamo.j2hcj(unmapped, errors='collect')
+        assert trial == "ㄱ\u1176ㅏ" and\
+            [(_.position, _.value) for _ in records] == [(1, "\u1176")],\
+            "j2hcj didn't collect unmapped jamo."
+        assert jamo.j2hcj("ᄀᄁᄂᄃᇹᇫ", errors='strict') == "ㄱㄲㄴㄷㆆㅿ",\
+            "j2hcj rejected mapped jamo."
+
+        surrogates = "한\udcff글"
+        assert jamo.h2j(surrogates) == jamo.h2j("한") + "\udcff" +\
+            jamo.h2j("글"), "h2j didn't leave surrogates unchanged by default."
+        assert jamo.h2j(surrogates, errors='replace') ==\
+            jamo.h2j("한\ufffd글"), "h2j didn't replace surrogates."
+        trial, records = jamo.h2j(surrogates, errors='collect')
+        assert [(_.position, _.value) for _ in records] == [(1, "\udcff")],\
+            "h2j didn't collect surrogates."
+
+        assert jamo.hcj_to_jamo("a", "lead", errors='ignore') == "",\
+            "hcj_to_jamo didn't ignore invalid input."
+        assert jamo.hcj_to_jamo("a", "lead", errors='replace') == "\ufffd",\
+            "hcj_to_jamo didn't replace invalid input."
+        assert jamo.hcj_to_jamo("a", "lead", errors='collect')[0] == "a",\
+            "hcj_to_jamo didn't leave invalid input unchanged."
+        assert jamo.hcj_to_jamo("ㄱ", "lead", errors='collect') ==\
+            (chr(0x1100), []), "hcj_to_jamo reported valid input."
+
+        assert jamo.jamo_to_hangul("ㄴ", "ㄴ", errors='ignore') == "",\
+            "jamo_to_hangul didn't ignore invalid input."
+        assert jamo.jamo_to_hangul("ㄴ", "ㄴ", errors='replace') == "\ufffd",\
+            "jamo_to_hangul didn't replace invalid input."
+        trial, records = jamo.jamo_to_hangul("ㄴ", "ㄴ", errors='collect')
+        assert trial == "ㄴㄴ" and len(records) == 1,\
+            "jamo_to_hangul didn't collect invalid input."
+
+        leads, vowels, tails = "ㅎㄴㄱ", "ㅏㄴㅜ", ["ㄴ", "", "ㄹ"]
+        assert jamo.jamo_to_hangul_many(leads, vowels, tails,
+                                        errors='ignore') == "한굴",\
+            "jamo_to_hangul_many didn't ignore invalid triples."
+        assert jamo.jamo_to_hangul_many(leads, vowels, tails,
+                                        errors='replace') == "한\ufffd굴",\
+            "jamo_to_hangul_many didn't replace invalid triples."
+        trial, records = jamo.jamo_to_hangul_many(iter(leads), iter(vowels),
+                                                  iter(tails),
+                                                  errors='collect')
+        assert trial == "한ㄴㄴ굴" and\
+            [_.position for _ in records] == [1],\
+            "jamo_to_hangul_many didn't collect invalid triples."
+        with self.assertRaisesRegex(jamo.InvalidJamoError, "index 1 "):
+            jamo.jamo_to_hangul_many(iter(leads), iter(vowels), iter(tails))
+        with self.assertRaises(ValueError):
+            jamo.jamo_to_hangul_many("ㅎ", "ㅏ", errors='bogus')
+
+        for errors in ('strict', 'bogus'):
+            try:
+                jamo.j2hcj(unmapped, errors=errors)
+                assert False, "Accepted bad input without throwing exception."
+            except (jamo.InvalidJamoError, ValueError):
+                pass
 
     def test_j2h(self):
         """j2h hardcoded tests.
@@ -528,8 +865,101 @@ class TestJamo(unittest.TestCase):
             "j2h doesn't work. Hint: it's the same as jamo_to_hangul."
 
     def test_synth_hangul(self):
-        # To be implemented in a future version
-        pass
+        """synth_hangul tests
+        Arguments may be iterables or characters.
+
+        synth_hangul should compose modern lead, vowel, and optional tail
+        sequences into Hangul characters. Anything else is unchanged.
+        """
+        tests = ["", "test123~", "ㄱㄲㄴㄷㆆㅿ",
+                 jamo.h2j("Do you speak 한국어?"),
+                 # Lone lead, lone vowel, lone tail, and an archaic vowel.
+                 "\u1100 \u1161 \u11a8 \u1100\u1176\u11a8",
+                 # A tail followed by a vowel starts no new syllable.
+                 "\u1100\u1161\u11a8\u1161"]
+        targets = ["", "test123~", "ㄱㄲㄴㄷㆆㅿ",
+                   "Do you speak 한국어?",
+                   "\u1100 \u1161 \u11a8 \u1100\u1176\u11a8",
+                   "\uac01\u1161"]
+
+        for test, target in zip(tests, targets):
+            trial = jamo.synth_hangul(test)
+            assert trial == target,\
+                ("Synthesized {test} to {trial}, but "
+                 "expected {target}.").format(test=test,
+                                              trial=trial,
+                                              target=target)
+
+        for hangul in _get_random_hangul():
+            assert jamo.synth_hangul(jamo.h2j(hangul)) == hangul,\
+                "synth_hangul did not undo h2j for {}.".format(hangul)
+
+    def test_synth_hangul_with_offsets(self):
+        """synth_hangul_with_offsets tests
+        synth_hangul_with_offsets should return synth_hangul of its input,
+        and offset maps that invert those of h2j_with_offsets.
+        """
+        tests = ["", "test123~", "Do you speak 한국어?", "자모=字母",
+                 "\u1100 \u1161 \u11a8 \u1100\u1176\u11a8",
+                 "\u1100\u1161\u11a8\u1161", "\u1100가\u1100"]
+        for test in tests:
+            source = jamo.h2j(test)
+            trial, source_to_target, target_to_source = \
+                jamo.synth_hangul_with_offsets(source)
+            assert trial == jamo.synth_hangul(source),\
+                "Synthesized {} to {}.".format(source, trial)
+            if trial == test:
+                _, forward, backward = jamo.h2j_with_offsets(test)
+                assert forward == target_to_source and\
+                    backward == source_to_target,\
+                    ("Offsets for {} don't invert those of "
+                     "h2j_with_offsets.").format(test)
+            for j, char in enumerate(trial):
+                start, end = target_to_source[j], target_to_source[j + 1]
+                assert jamo.synth_hangul(source[start:end]) == char,\
+                    "Mapped {} in {} back wrongly.".format(char, trial)
+                assert list(source_to_target[start:end]) ==\
+                    [j] * (end - start),\
+                    "Mapped jamo of {} in {} wrongly.".format(char, trial)
+
+    def test_bytes(self):
+        """h2j_bytes, j2hcj_bytes, and synth_bytes tests
+        The bytes functions should agree with the string functions on UTF-8,
+        and leave anything else, including malformed UTF-8, as it was.
+        """
+        text = "자모=字母, Do you speak 한국어? ㅋㅋ ᄀᄁᄂᄃᇹᇫ \U0001f600"
+        tests = [(jamo.h2j_bytes, jamo.h2j, text),
+                 (jamo.j2hcj_bytes, jamo.j2hcj, jamo.h2j(text)),
+                 (jamo.synth_bytes, jamo.synth_hangul, jamo.h2j(text))]
+        for bytes_func, func, source in tests:
+            data = source.encode('utf-8')
+            target = func(source).encode('utf-8')
+            for argument in (data, bytearray(data), memoryview(data)):
+                trial = bytes_func(argument)
+                assert type(trial) is bytes and trial == target,\
+                    "{} returned {}.".format(bytes_func.__name__, trial)
+            bad = b"\xff" + data[:2] + b"\xed\xa0\x80" + data + b"\xea\xb0"
+            target = b"\xff" + data[:2] + b"\xed\xa0\x80" + target +\
+                b"\xea\xb0"
+            trial = bytes_func(bad)
+            assert trial == target,\
+                "{} changed malformed bytes: {}.".format(bytes_func.__name__,
+                                                         trial)
+            assert bytes_func(b"plain ASCII") == b"plain ASCII",\
+                "{} changed ASCII.".format(bytes_func.__name__)
+
+    def test_synthesize_hangul(self):
+        """synthesize_hangul tests
+        Syllables split across chunks should be composed as if the input were
+        a single string.
+        """
+        text = jamo.h2j("자모=字母, 한국어를 합성합니다.")
+        for size in range(1, 5):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            trial = ''.join(jamo.synthesize_hangul(chunks))
+            assert trial == "자모=字母, 한국어를 합성합니다.",\
+                ("Synthesized chunks of size {size} to "
+                 "{trial}.").format(size=size, trial=trial)
 
 if __name__ == "__main__":
     unittest.main()
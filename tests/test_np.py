@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the NumPy codepoint array API.
+"""
+import unittest
+import jamo
+import random
+
+try:
+    import numpy
+    import jamo.np
+except ImportError:
+    numpy = None
+
+
+def _get_random_text(count):
+    """Generate a mix of Hangul, jamo, HCJ, and other characters."""
+    alphabet = ([chr(_) for _ in range(0xac00, 0xd7a4)] +
+                [chr(_) for _ in range(0x1100, 0x1200)] +
+                [chr(_) for _ in range(0x3131, 0x318f)] +
+                list("abc 123,.?字母"))
+    return ''.join(random.choice(alphabet) for _ in range(count))
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestJamoNumPy(unittest.TestCase):
+    def test_decompose(self):
+        """decompose tests
+        decompose should agree with h2j, and offsets should map every input
+        character to its decomposition.
+        """
+        for text in ["", "a", "한", "Do you speak 한국어?",
+                     _get_random_text(4096)]:
+            trial, offsets = jamo.np.decompose(text)
+            assert trial.dtype == numpy.uint32,\
+                "decompose didn't return uint32 codepoints."
+            assert jamo.np.to_str(trial) == jamo.h2j(text),\
+                "decompose disagrees with h2j for {}.".format(text)
+            assert len(offsets) == len(text) + 1,\
+                "decompose returned the wrong number of offsets."
+            for i, char in enumerate(text):
+                piece = jamo.np.to_str(trial[offsets[i]:offsets[i + 1]])
+                assert piece == jamo.h2j(char),\
+                    "Offsets for {} are incorrect.".format(char)
+
+    def test_decompose_array(self):
+        """decompose should accept integer arrays of any shape or dtype."""
+        codepoints = numpy.array([[0xd55c, 0x61]], dtype=numpy.int64)
+        trial, offsets = jamo.np.decompose(codepoints)
+        assert trial.tolist() == [0x1112, 0x1161, 0x11ab, 0x61],\
+            "decompose didn't accept a two-dimensional int64 array."
+        assert offsets.tolist() == [0, 3, 4],\
+            "decompose returned incorrect offsets."
+
+    def test_compose(self):
+        """compose tests
+        compose should agree with synth_hangul, and offsets should map every
+        output character to the jamo it was composed from.
+        """
+        tests = ["", "ᄀ", "가", "각ᅡ",
+                 jamo.h2j("Do you speak 한국어?"),
+                 _get_random_text(4096),
+                 jamo.h2j(_get_random_text(4096))]
+        for text in tests:
+            trial, offsets = jamo.np.compose(text)
+            target = jamo.synth_hangul(text)
+            assert jamo.np.to_str(trial) == target,\
+                "compose disagrees with synth_hangul for {}.".format(text)
+            assert len(offsets) == len(target) + 1,\
+                "compose returned the wrong number of offsets."
+            for j, char in enumerate(target):
+                piece = text[offsets[j]:offsets[j + 1]]
+                assert jamo.synth_hangul(piece) == char,\
+                    "Offsets for {} are incorrect.".format(char)
+
+    def test_round_trip(self):
+        """compose should invert decompose, offsets included."""
+        text = ''.join(chr(_) for _ in range(0xac00, 0xd7a4))
+        decomposed, decomposed_offsets = jamo.np.decompose(text)
+        composed, composed_offsets = jamo.np.compose(decomposed)
+        assert jamo.np.to_str(composed) == text,\
+            "compose didn't undo decompose."
+        assert (composed_offsets == decomposed_offsets).all(),\
+            "compose offsets don't match decompose offsets."
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for multiprocess file conversion.
+"""
+import unittest
+import jamo
+import jamo.parallel
+import io
+import os
+import subprocess
+import sys
+import tempfile
+
+
+_TEXT = "자모=字母, Do you speak 한국어?\n한글을 합성합니다. ᄀᄁᄂᄃᇹᇫ\n"
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i, text in enumerate((_TEXT * 50, jamo.h2j(_TEXT) * 30 + "끝")):
+            path = os.path.join(self.tmp.name, "in{}.txt".format(i))
+            with open(path, 'w', encoding='utf-8', newline='') as fout:
+                fout.write(text)
+            self.paths.append(path)
+        self.text = _TEXT * 50 + jamo.h2j(_TEXT) * 30 + "끝"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_shards(self):
+        """Shards should cover the file and end after whole lines."""
+        path = self.paths[0]
+        with open(path, 'rb') as fin:
+            data = fin.read()
+        shards = jamo.parallel._shards(path, 100)
+        assert len(shards) > 1, "Didn't split the file into shards."
+        assert shards[0][0] == 0 and shards[-1][1] == len(data),\
+            "Shards don't cover the whole file."
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            assert end == start, "Shards {} aren't contiguous.".format(shards)
+            assert data[end - 1:end] == b"\n",\
+                "Shard ending at {} splits a line.".format(end)
+
+    def test_convert_files(self):
+        """convert_files should match converting the files in one piece,
+        in or out of worker processes.
+        """
+        targets = {"jamo": jamo.h2j(self.text),
+                   "hcj": jamo.h2hcj(self.text),
+                   "hangul": jamo.synth_hangul(self.text)}
+        for to, target in targets.items():
+            for processes in (1, 2):
+                fout = io.BytesIO()
+                size = jamo.parallel.convert_files(
+                    self.paths, fout, to, processes=processes, shard_size=64)
+                trial = fout.getvalue().decode('utf-8')
+                assert trial == target,\
+                    ("convert_files to {to} with {processes} processes "
+                     "failed.").format(to=to, processes=processes)
+                assert size == len(self.text.encode('utf-8')),\
+                    "convert_files didn't report the number of bytes read."
+
+    def test_bounded_map(self):
+        """Results should come back in order, with no more than window
+        tasks submitted and not yet returned.
+        """
+        class Pool(object):
+            running = 0
+            most = 0
+
+            def apply_async(self, func, args):
+                self.running += 1
+                self.most = max(self.most, self.running)
+                pool = self
+
+                class Result(object):
+                    def get(self):
+                        pool.running -= 1
+                        return func(*args)
+                return Result()
+
+        pool = Pool()
+        trial = list(jamo.parallel._bounded_map(pool, str, range(20), 3))
+        assert trial == [(i, str(i)) for i in range(20)],\
+            "_bounded_map returned {}.".format(trial)
+        assert pool.most == 3,\
+            "{} tasks were in flight, not 3.".format(pool.most)
+
+    def test_convert_file(self):
+        """convert_file should write to a path."""
+        path = os.path.join(self.tmp.name, "out.txt")
+        jamo.parallel.convert_file(self.paths[0], path, "hcj", processes=2,
+                                   shard_size=64)
+        with open(path, encoding='utf-8', newline='') as fin:
+            assert fin.read() == jamo.h2hcj(_TEXT * 50),\
+                "convert_file didn't write the converted file."
+
+    def test_command(self):
+        """python -m jamo --jobs should convert files in order."""
+        output = subprocess.check_output(
+            [sys.executable, "-m", "jamo", "--jobs", "2", "--shard-size",
+             "64"] + self.paths)
+        assert output.decode('utf-8') == jamo.h2j(self.text),\
+            "python -m jamo --jobs 2 failed."
+        result = subprocess.run(
+            [sys.executable, "-m", "jamo", "--jobs", "2"],
+            input=b"", stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert result.returncode != 0,\
+            "python -m jamo --jobs accepted standard input."
+        for option in (["--encoding", "utf-16"], ["--shard-size", "0"]):
+            result = subprocess.run(
+                [sys.executable, "-m", "jamo", "--jobs", "2"] + option +
+                self.paths, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            assert result.returncode != 0,\
+                "python -m jamo --jobs accepted {}.".format(option)
+
+    def test_bad_arguments(self):
+        """convert_files should reject encodings it cannot split on newline
+        bytes, and shard sizes that are not positive.
+        """
+        for kwargs in ({"encoding": "utf-16"}, {"encoding": "utf-8-sig"},
+                       {"encoding": "utf-32-le"}, {"shard_size": 0}):
+            try:
+                jamo.parallel.convert_files(self.paths, io.BytesIO(),
+                                            processes=1, **kwargs)
+                assert False, "convert_files accepted {}.".format(kwargs)
+            except ValueError:
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
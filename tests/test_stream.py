@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for chunked stream conversion and the jamo command.
+"""
+import unittest
+import jamo
+import jamo.stream
+import io
+import os
+import subprocess
+import sys
+import tempfile
+
+
+_TEXT = "자모=字母, Do you speak 한국어?\n한글을 합성합니다. ᄀᄁᄂᄃᇹᇫ\n"
+
+
+class TestStream(unittest.TestCase):
+    def test_convert_chunks(self):
+        """convert_chunks tests
+        Conversion should not depend on where the input is split.
+        """
+        targets = {"jamo": jamo.h2j(_TEXT),
+                   "hcj": jamo.h2hcj(_TEXT),
+                   "hangul": jamo.synth_hangul(jamo.h2j(_TEXT))}
+        for to, target in targets.items():
+            source = jamo.h2j(_TEXT) if to == "hangul" else _TEXT
+            for size in (1, 2, 3, 5, len(source)):
+                chunks = [source[i:i + size]
+                          for i in range(0, len(source), size)]
+                trial = ''.join(jamo.stream.convert_chunks(chunks, to))
+                assert trial == target,\
+                    ("Converted chunks of size {size} to {to} as {trial}, "
+                     "but expected {target}.").format(size=size, to=to,
+                                                      trial=trial,
+                                                      target=target)
+
+    def test_convert_chunks_unknown_form(self):
+        try:
+            jamo.stream.convert_chunks([_TEXT], "latin")
+            assert False, "Accepted an unknown form."
+        except ValueError:
+            pass
+
+    def test_transcode(self):
+        """transcode should convert a whole file a chunk at a time."""
+        fout = io.StringIO()
+        count = jamo.stream.transcode(io.StringIO(jamo.h2j(_TEXT) * 100),
+                                      fout, "hangul", chunk_size=4)
+        assert count == len(jamo.h2j(_TEXT)) * 100,\
+            "transcode didn't report the number of characters read."
+        assert fout.getvalue() == _TEXT * 100,\
+            "transcode didn't compose the whole file."
+        for chunk_size in (0, -1):
+            for call in (lambda: jamo.stream.read_chunks(fin, chunk_size),
+                         lambda: jamo.stream.transcode(fin, fout,
+                                                       chunk_size=chunk_size)):
+                fin = io.StringIO(_TEXT)
+                try:
+                    call()
+                    assert False,\
+                        "Accepted chunk_size={}.".format(chunk_size)
+                except ValueError:
+                    pass
+
+    def test_command(self):
+        """python -m jamo should convert standard input."""
+        for to, target in (("jamo", jamo.h2j(_TEXT)),
+                           ("hcj", jamo.h2hcj(_TEXT))):
+            output = subprocess.check_output(
+                [sys.executable, "-m", "jamo", "--to", to,
+                 "--chunk-size", "3"],
+                input=_TEXT.encode('utf-8'))
+            assert output.decode('utf-8') == target,\
+                "python -m jamo --to {} failed.".format(to)
+        result = subprocess.run(
+            [sys.executable, "-m", "jamo", "--to", "hangul", "--stats"],
+            input=jamo.h2j(_TEXT).encode('utf-8'),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert result.stdout.decode('utf-8') == _TEXT,\
+            "python -m jamo --to hangul failed."
+        assert b"MB/s" in result.stderr,\
+            "python -m jamo --stats didn't report throughput."
+        for chunk_size in ("0", "-1"):
+            result = subprocess.run(
+                [sys.executable, "-m", "jamo", "--chunk-size", chunk_size],
+                input=_TEXT.encode('utf-8'),
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            assert result.returncode == 2 and not result.stdout,\
+                "python -m jamo accepted --chunk-size {}.".format(chunk_size)
+
+    def test_command_errors(self):
+        """python -m jamo should report a missing file or an unknown
+        encoding in one line, without a traceback.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            missing = os.path.join(tmp, "missing.txt")
+            for args in ([missing], ["--jobs", "2", missing],
+                         ["--encoding", "no-such-encoding"],
+                         ["--errors", "no-such-handler"]):
+                result = subprocess.run(
+                    [sys.executable, "-m", "jamo"] + args,
+                    input=_TEXT.encode('utf-8'),
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                message = result.stderr.decode('utf-8')
+                assert result.returncode == 2,\
+                    "python -m jamo {} exited with {}.".format(
+                        " ".join(args), result.returncode)
+                assert "Traceback" not in message and\
+                    message.splitlines()[-1].startswith("jamo: error: "),\
+                    "python -m jamo {} reported {}".format(" ".join(args),
+                                                           message)
+
+
+if __name__ == "__main__":
+    unittest.main()
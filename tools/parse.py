@@ -1,9 +1,141 @@
 from sys import argv
+import os
 import re
 import json
 import check
 
-if __name__ == "__main__":
+
+def _derive_tables(jamo_names, hcj_names):
+    """Pair jamo and HCJ characters by Unicode name, e.g. HANGUL CHOSEONG
+    KIYEOK, HANGUL JONGSEONG KIYEOK and HANGUL LETTER KIYEOK.
+    """
+    jamo_lookup = {name: char for char, name in jamo_names.items()}
+    hcj_lookup = {name: char for char, name in hcj_names.items()}
+    jamo_to_hcj = {}
+    for char, name in jamo_names.items():
+        hcj_name = re.sub(r"(?<=HANGUL )(\w+)", "LETTER", name)
+        if hcj_name in hcj_lookup:
+            jamo_to_hcj[char] = hcj_lookup[hcj_name]
+    hcj_to_jamo = {}
+    for position, jamo_class in (("lead", "CHOSEONG"),
+                                 ("vowel", "JUNGSEONG"),
+                                 ("tail", "JONGSEONG")):
+        table = {}
+        for char, name in sorted(jamo_names.items()) + \
+                sorted(hcj_names.items()):
+            jamo_name = re.sub(r"(?<=HANGUL )(\w+)", jamo_class, name)
+            if jamo_lookup.get(jamo_name, char) != char:
+                table[char] = jamo_lookup[jamo_name]
+        hcj_to_jamo[position] = table
+    return jamo_to_hcj, hcj_to_jamo
+
+
+# Letters in dictionary order. Jamo names are made of these, joined by
+# hyphens, and each may be doubled (SSANG) or modified (e.g. KAPYEOUN).
+_CONSONANTS = ("KIYEOK", "NIEUN", "TIKEUT", "RIEUL", "MIEUM", "PIEUP",
+               "SIOS", "IEUNG", "CIEUC", "CHIEUCH", "KHIEUKH", "THIEUTH",
+               "PHIEUPH", "HIEUH")
+_VOWELS = ("A", "AE", "YA", "YAE", "EO", "E", "YEO", "YE", "O", "WA", "WAE",
+           "OE", "YO", "U", "WEO", "WE", "WI", "YU", "EU", "YI", "I",
+           "ARAEA")
+# Archaic letters sort after every other letter built on the one they
+# resemble, and modified letters after the plain ones.
+_ARCHAIC = {"PANSIOS": "SIOS", "YESIEUNG": "IEUNG", "YEORINHIEUH": "HIEUH"}
+_MODIFIERS = ("", "KAPYEOUN", "CHITUEUM", "CEONGCHIEUM", "ARCHAIC")
+
+
+def _letter_key(part, letters):
+    """Return the sort key of one hyphen-separated part of a jamo name."""
+    modifier = 0
+    for number, prefix in enumerate(_MODIFIERS[1:], 1):
+        if part.startswith(prefix):
+            modifier, part = number, part[len(prefix):]
+    count = 1
+    if part.startswith("SSANG"):
+        count, part = 2, part[len("SSANG"):]
+    if part in _ARCHAIC:
+        modifier, part = len(_MODIFIERS) - 1, _ARCHAIC[part]
+    return ((letters.index(part), modifier),) * count
+
+
+def _collation_order(jamo_names):
+    """Order the lead, vowel, and tail jamo by the letters in their names,
+    so that e.g. HANGUL CHOSEONG NIEUN-KIYEOK comes right after HANGUL
+    CHOSEONG NIEUN. Fillers come first.
+    """
+    order = {}
+    for position, jamo_class, letters in (
+            ("lead", "CHOSEONG", _CONSONANTS),
+            ("vowel", "JUNGSEONG", _VOWELS),
+            ("tail", "JONGSEONG", _CONSONANTS)):
+        keys = {}
+        for char, name in jamo_names.items():
+            words = name.split(" ", 2)
+            if words[1] != jamo_class:
+                continue
+            keys[char] = () if words[2] == "FILLER" else sum(
+                (_letter_key(_, letters) for _ in words[2].split("-")), ())
+        order[position] = ''.join(sorted(keys, key=lambda _: (keys[_], _)))
+    # The derived order must agree with the modern alphabet.
+    for position, start, stop in (("lead", 0x1100, 0x1113),
+                                  ("vowel", 0x1161, 0x1176),
+                                  ("tail", 0x11A8, 0x11C3)):
+        modern = [_ for _ in order[position] if start <= ord(_) < stop]
+        assert modern == [chr(_) for _ in range(start, stop)], position
+    return order
+
+
+def _format_dict(name, table):
+    lines = ["{} = {{".format(name)]
+    lines.extend("    {}: {},".format(ascii(key), ascii(value))
+                 for key, value in sorted(table.items()))
+    lines.append("}")
+    return '\n'.join(lines)
+
+
+def write_tables(jamo_file, hcj_file, fileout):
+    """Write a Python module of the jamo tables derived from the Unicode
+    names, so that jamo never has to parse the JSON data at runtime.
+    """
+    with open(jamo_file, 'r') as fin:
+        jamo_names = json.load(fin)
+    with open(hcj_file, 'r') as fin:
+        hcj_names = json.load(fin)
+    jamo_to_hcj, hcj_to_jamo = _derive_tables(jamo_names, hcj_names)
+    named = ''.join(sorted(jamo_names)) + ''.join(sorted(hcj_names))
+    with open(fileout, 'w') as fout:
+        fout.write("# -*- coding: utf-8 -*-\n"
+                   "\"\"\"Jamo tables derived from {jamo} and {hcj}.\n"
+                   "Generated by tools/parse.py --tables; do not edit.\n"
+                   "\"\"\"\n\n".format(jamo=os.path.basename(jamo_file),
+                                        hcj=os.path.basename(hcj_file)))
+        fout.write("# Every jamo and HCJ character that has a Unicode name.\n")
+        fout.write("NAMED = (\n")
+        for start in range(0, len(named), 12):
+            fout.write("    {}\n".format(ascii(named[start:start + 12])))
+        fout.write(")\n\n")
+        fout.write(_format_dict("JAMO_TO_HCJ", jamo_to_hcj) + "\n\n")
+        fout.write("# Named characters missing from these tables map to "
+                   "themselves.\n")
+        for position in ("lead", "vowel", "tail"):
+            fout.write(_format_dict("HCJ_TO_JAMO_" + position.upper(),
+                                    hcj_to_jamo[position]) + "\n")
+            if position != "tail":
+                fout.write("\n")
+        fout.write("\n# Lead, vowel, and tail jamo in collation order.\n")
+        for position, chars in sorted(_collation_order(jamo_names).items()):
+            fout.write("COLLATION_{} = (\n".format(position.upper()))
+            for start in range(0, len(chars), 12):
+                fout.write("    {}\n".format(ascii(chars[start:start + 12])))
+            fout.write(")\n")
+
+
+if __name__ == "__main__" and argv[1] == '--tables':
+    datadir, fileout = argv[2], argv[3]
+    write_tables(os.path.join(datadir, "U+11xx.json"),
+                 os.path.join(datadir, "U+31xx.json"), fileout)
+    print("{ok, %s}" % fileout)
+elif __name__ == "__main__":
     filein, fileout = argv[1], argv[2]
     status = check.validate(filein)
     if status == True or len(argv) == 4 and argv[3] == '--nocheck':